@@ -1,9 +1,23 @@
-import random
+from ..utils.battle_rng import global_rng
 from ..utils.data_loader import data_loader
 
+
+def bind_policy(policy, game):
+    """Point a policy at ``game``: its random stream, plus the game itself for policies that search."""
+    bind = getattr(policy, 'bind', None)
+    if bind is not None:
+        bind(game)
+    else:
+        policy.rng = game.rng
+
+
 class BattleAI:
-    def __init__(self):
-        pass
+    def __init__(self, rng=global_rng):
+        # The battle's random stream, for picking among near-best moves
+        self.rng = rng
+
+    def bind(self, game):
+        self.rng = game.rng
 
     def select_move(self, ai_pokemon, player_pokemon, weather='none'):
         if not ai_pokemon or not player_pokemon:
@@ -34,7 +48,7 @@ class BattleAI:
         threshold = 0.9 * top_score
         best_moves = [m for m in scored_moves if m[2] >= threshold]
         
-        selected_move_name, selected_move, _ = random.choice(best_moves)
+        selected_move_name, selected_move, _ = self.rng.choice(best_moves)
         return selected_move_name, selected_move
 
     def select_switch(self, team, player_pokemon):
@@ -48,12 +62,13 @@ class BattleAI:
         best_score = -1
         best_mon = None
         
+        matrix = data_loader.type_chart.matrix
         for p in available:
             score = 0
             # Check type advantage
-            for p_type in p.types:
-                for player_type in player_pokemon.types:
-                    score += data_loader.get_type_effectiveness(p_type, player_type)
+            for p_type in p.type_ids:
+                for player_type in player_pokemon.type_ids:
+                    score += matrix[p_type][player_type]
             
             if score > best_score:
                 best_score = score
@@ -69,14 +84,11 @@ class BattleAI:
             if base_power == 0:
                 base_power = 40
             
-            effectiveness = 1.0
-            attacker_types = [t.lower() for t in attacker.types]
-            defender_types = [t.lower() for t in defender.types]
-            
-            for d_type in defender_types:
-                effectiveness *= data_loader.get_type_effectiveness(move.type, d_type)
+            chart = data_loader.type_chart
+            move_type_id = chart.type_id(move.type)
+            effectiveness = chart.against(move_type_id, defender.type_ids)
             
-            stab = 1.5 if move.type.lower() in attacker_types else 1.0
+            stab = 1.5 if move_type_id in attacker.type_ids else 1.0
             
             if move.category == 'physical':
                 atk = attacker.attack
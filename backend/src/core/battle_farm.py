@@ -0,0 +1,245 @@
+"""Bulk AI-vs-AI battles across worker processes, for balancing and evaluating policies.
+
+Seeds are cut into chunks and farmed out to a ProcessPoolExecutor whose
+initializer preloads the datasets once per worker. Each seed is one battle
+between random teams (get_random_battle_ready_pokemon on sets from
+get_all_pokemon_sets) played by simulate(); odd seeds swap which policy
+plays the player side.
+
+Finished chunks are written as they arrive: appended to one CSV file, or
+one Parquet file per chunk in a directory (needs pyarrow). A checkpoint
+next to the output records the finished chunks and running totals, so an
+interrupted or crashed farm started again with the same arguments picks up
+where it stopped.
+"""
+
+import csv
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from .ai import BattleAI
+from .search_ai import SEARCH_LEVELS, SearchAI
+from .simulation import RandomPolicy, random_team, simulate
+from ..utils.data_loader import data_loader
+from ..utils.sets_database import sets_database
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+POLICIES = {'ai': BattleAI, 'random': RandomPolicy}
+POLICIES.update({'search-' + level: partial(SearchAI, level) for level in SEARCH_LEVELS})
+
+COLUMNS = [
+    'seed', 'player_policy', 'opponent_policy', 'winner', 'winner_policy', 'turns',
+    'player_remaining', 'opponent_remaining', 'player_team', 'opponent_team',
+    'player_damage', 'opponent_damage', 'player_moves', 'opponent_moves',
+]
+
+
+class FarmError(Exception):
+    pass
+
+
+def init_worker():
+    """Pool initializer: load everything a battle touches once, not on each worker's first battle."""
+    data_loader.preload()
+    sets_database.is_available()
+
+
+def play_seed(seed: int, policy_a: str, policy_b: str, team_size: int = 6) -> Dict[str, Any]:
+    player, opponent = (policy_a, policy_b) if seed % 2 == 0 else (policy_b, policy_a)
+    random.seed(seed)
+    player_team, opponent_team = random_team(team_size), random_team(team_size)
+    result = simulate(player_team, opponent_team, POLICIES[player](), POLICIES[opponent](), seed=seed)
+
+    damage = [0, 0]
+    moves: List[Dict[str, int]] = [{}, {}]
+    for event in result.events:
+        if event.type == 'move' and event.side is not None:
+            damage[event.side] += event.amount
+            moves[event.side][event.name] = moves[event.side].get(event.name, 0) + 1
+    winner = {'a': 'player', 'b': 'opponent'}.get(result.winner, 'draw')
+    return {
+        'seed': seed,
+        'player_policy': player,
+        'opponent_policy': opponent,
+        'winner': winner,
+        'winner_policy': {'player': player, 'opponent': opponent}.get(winner, ''),
+        'turns': result.turns,
+        'player_remaining': result.remaining[0],
+        'opponent_remaining': result.remaining[1],
+        'player_team': '/'.join(p['name'] for p in player_team),
+        'opponent_team': '/'.join(p['name'] for p in opponent_team),
+        'player_damage': damage[0],
+        'opponent_damage': damage[1],
+        'player_moves': json.dumps(moves[0], sort_keys=True),
+        'opponent_moves': json.dumps(moves[1], sort_keys=True),
+    }
+
+
+def play_chunk(seeds: List[int], policy_a: str, policy_b: str, team_size: int) -> List[Dict[str, Any]]:
+    return [play_seed(seed, policy_a, policy_b, team_size) for seed in seeds]
+
+
+class CsvOutput:
+    """One CSV file; the checkpoint remembers its length after the last finished chunk."""
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.file = open(path, 'a+', newline='', encoding='utf-8')
+        # Rows of a chunk that was being written when the farm died are cut off
+        self.file.truncate(size)
+        self.file.seek(size)
+        self.writer = csv.DictWriter(self.file, fieldnames=COLUMNS)
+        if size == 0:
+            self.writer.writeheader()
+
+    def write(self, index: int, rows: List[Dict[str, Any]]):
+        self.writer.writerows(rows)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def size(self) -> int:
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetOutput:
+    """A directory of part-NNNNNN.parquet files, one per chunk."""
+
+    def __init__(self, path: str, size: int):
+        if pyarrow is None:
+            raise FarmError("Parquet output needs pyarrow (pip install pyarrow); use a .csv path instead")
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, index: int, rows: List[Dict[str, Any]]):
+        table = pyarrow.Table.from_pylist(rows)
+        part = os.path.join(self.path, f'part-{index:06d}.parquet')
+        pyarrow.parquet.write_table(table, part + '.tmp')
+        os.replace(part + '.tmp', part)
+
+    def size(self) -> int:
+        return 0
+
+    def close(self):
+        pass
+
+
+def open_output(path: str, size: int):
+    return CsvOutput(path, size) if path.endswith('.csv') else ParquetOutput(path, size)
+
+
+class Checkpoint:
+    def __init__(self, path: str, config: Dict[str, Any]):
+        self.path = path
+        self.config = config
+        self.done: set = set()
+        self.size = 0
+        self.totals: Dict[str, int] = {}
+
+    @classmethod
+    def load(cls, out: str, config: Dict[str, Any]) -> 'Checkpoint':
+        checkpoint = cls(out + '.checkpoint.json', config)
+        if not os.path.exists(checkpoint.path):
+            if os.path.exists(out):
+                raise FarmError(f"{out} exists but has no checkpoint; remove it or pick another output")
+            return checkpoint
+        with open(checkpoint.path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        if saved['config'] != config:
+            raise FarmError(f"{checkpoint.path} was written with different arguments: {saved['config']}")
+        checkpoint.done = set(saved['done'])
+        checkpoint.size = saved['size']
+        checkpoint.totals = saved['totals']
+        return checkpoint
+
+    def record(self, index: int, rows: List[Dict[str, Any]], size: int):
+        self.done.add(index)
+        self.size = size
+        for row in rows:
+            counts = [('battles', 1), ('turns', row['turns']), ('wins:' + row['winner'], 1)]
+            if row['winner_policy']:
+                # Draws are already counted once, as wins:draw
+                counts.append(('wins:' + row['winner_policy'], 1))
+            for key, amount in counts:
+                self.totals[key] = self.totals.get(key, 0) + amount
+        self.save()
+
+    def save(self):
+        state = {'config': self.config, 'done': sorted(self.done), 'size': self.size, 'totals': self.totals}
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(self.path + '.tmp', self.path)
+
+
+def run_farm(out: str, seeds: range, policy_a: str = 'ai', policy_b: str = 'random', team_size: int = 6,
+             workers: Optional[int] = None, chunk_size: int = 50, progress_every: float = 10.0) -> Dict[str, int]:
+    """Play every seed in ``seeds`` (skipping chunks a previous run finished); returns the running totals."""
+    for policy in (policy_a, policy_b):
+        if policy not in POLICIES:
+            raise FarmError(f"Unknown policy {policy!r}; choose from {', '.join(sorted(POLICIES))}")
+    config = {'seeds': [seeds.start, seeds.stop], 'policies': [policy_a, policy_b],
+              'team_size': team_size, 'chunk_size': chunk_size}
+    checkpoint = Checkpoint.load(out, config)
+    chunks = [(index, list(seeds[start:start + chunk_size]))
+              for index, start in enumerate(range(0, len(seeds), chunk_size))]
+    todo = [(index, chunk) for index, chunk in chunks if index not in checkpoint.done]
+    total = len(seeds)
+    if len(todo) < len(chunks):
+        print(f"Resuming: {len(chunks) - len(todo)} of {len(chunks)} chunks already done", file=sys.stderr)
+
+    output = open_output(out, checkpoint.size)
+    checkpoint.save()
+    workers = workers or os.cpu_count() or 1
+    started, last_report = time.monotonic(), time.monotonic()
+    played = 0
+    pending = {}
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            queue = iter(todo)
+            while True:
+                # A few chunks per worker in flight: enough to stay busy without queuing millions of futures
+                for index, chunk in queue:
+                    pending[executor.submit(play_chunk, chunk, policy_a, policy_b, team_size)] = index
+                    if len(pending) >= workers * 4:
+                        break
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = pending.pop(future)
+                    rows = future.result()
+                    output.write(index, rows)
+                    checkpoint.record(index, rows, output.size())
+                    played += len(rows)
+                now = time.monotonic()
+                if now - last_report >= progress_every:
+                    last_report = now
+                    report_progress(checkpoint.totals.get('battles', 0), total, played, now - started)
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    finally:
+        output.close()
+    report_progress(checkpoint.totals.get('battles', 0), total, played, time.monotonic() - started)
+    return checkpoint.totals
+
+
+def report_progress(done: int, total: int, played: int, elapsed: float):
+    rate = played / elapsed if elapsed else 0.0
+    eta = (total - done) / rate if rate else 0.0
+    print(f"{done:,}/{total:,} battles ({done / total:.1%})  {rate:.1f} battles/s  ETA {eta / 60:.1f} min",
+          file=sys.stderr)
@@ -0,0 +1,288 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import types
+import uuid
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from .battle_state import SnapshotError, dump_game, load_game
+from .battle_store import BattleStore, create_store
+from .game import Game
+
+MAX_BATTLES = int(os.getenv('MAX_BATTLES', '500'))
+BATTLE_IDLE_TTL = float(os.getenv('BATTLE_IDLE_TTL', str(30 * 60)))
+# Optional budget for the summed estimated size of all battles (0 = no budget)
+BATTLE_MEMORY_BUDGET = int(os.getenv('BATTLE_MEMORY_BUDGET', '0'))
+# Turns between re-measuring a battle's size; walking the whole game every turn is too slow
+BATTLE_MEASURE_INTERVAL = int(os.getenv('BATTLE_MEASURE_INTERVAL', '10'))
+# Seconds between sweeps of expired snapshots out of the store
+STORE_PURGE_INTERVAL = float(os.getenv('BATTLE_STORE_PURGE_INTERVAL', '60'))
+
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+               types.MethodType, types.CodeType, str, bytes, int, float, bool, type(None))
+# (loaded dataset names, ids) from the last _shared_object_ids() call
+_shared_ids: Optional[Tuple[FrozenSet[str], Set[int]]] = None
+
+
+def _shared_object_ids() -> Set[int]:
+    """Ids of the dataset tables and their records, which every battle references but none owns.
+
+    Datasets load lazily, so the ids are recomputed whenever another one has loaded.
+    """
+    global _shared_ids
+    from ..systems.ability_system import ABILITIES_CONFIG
+    from ..systems.item_system import ITEMS_CONFIG
+    from ..utils.data_loader import data_loader
+
+    loaded = frozenset(data_loader.load_times)
+    if _shared_ids is None or _shared_ids[0] != loaded:
+        tables = [ABILITIES_CONFIG, ITEMS_CONFIG] + [vars(data_loader).get(name) for name in data_loader.DATASETS]
+        ids = {id(data_loader)}
+        for table in tables:
+            if isinstance(table, dict):
+                ids.add(id(table))
+                ids.update(id(record) for record in table.values())
+        _shared_ids = (loaded, ids)
+    return _shared_ids[1]
+
+
+def estimate_size(root) -> int:
+    """Approximate bytes owned by ``root``: sys.getsizeof over everything it reaches.
+
+    Shared dataset records, functions, classes and modules are not counted,
+    and strings/numbers only count their (mostly interned) references.
+    """
+    shared = _shared_object_ids()
+    seen: Set[int] = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen or obj_id in shared or isinstance(obj, _SKIP_TYPES):
+            continue
+        seen.add(obj_id)
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            attributes = getattr(obj, '__dict__', None)
+            if attributes is not None:
+                total += sys.getsizeof(attributes)
+                stack.extend(attributes.values())
+    return total
+
+
+class BattleLimitError(Exception):
+    pass
+
+
+class BattleSession:
+    def __init__(self, battle_id: str, game: Game):
+        self.battle_id = battle_id
+        self.game = game
+        # Serializes turns of one battle; different battles run independently
+        self.lock = asyncio.Lock()
+        self.created_at = time.monotonic()
+        self.last_access = self.created_at
+        self.size_bytes = 0
+        # Turns played; a store entry with a higher revision was saved by another worker
+        self.revision = 0
+
+    def measure(self) -> int:
+        self.size_bytes = estimate_size(self.game)
+        return self.size_bytes
+
+
+class BattleSessionManager:
+    """Live battles by id, least recently used first.
+
+    A battle's size is measured when it is created or restored and then every
+    ``measure_interval`` checkpoints.
+
+    Battles idle for longer than ``idle_ttl`` are dropped. When ``max_battles``
+    (or the optional memory budget) is reached, the least recently used battle
+    that isn't mid-turn makes room; if every battle is busy, ``create`` raises
+    BattleLimitError.
+
+    With a ``store``, battles evicted to make room are parked there as
+    snapshots and restored by ``get``; ``evict_expired`` also purges expired
+    snapshots from the store every ``purge_interval`` seconds. With ``write_through`` (the default for
+    stores shared between processes) every checkpoint is saved too, so any
+    worker can resume a battle and a worker holding an older copy reloads it.
+    Two workers playing the same battle at once is not coordinated: the last
+    checkpoint wins, so keep a battle's requests on one worker at a time.
+    """
+
+    def __init__(self, max_battles: int = MAX_BATTLES, idle_ttl: float = BATTLE_IDLE_TTL,
+                 memory_budget: int = BATTLE_MEMORY_BUDGET, clock=time.monotonic,
+                 store: Optional[BattleStore] = None, write_through: Optional[bool] = None,
+                 purge_interval: float = STORE_PURGE_INTERVAL,
+                 measure_interval: int = BATTLE_MEASURE_INTERVAL):
+        self.max_battles = max_battles
+        self.idle_ttl = idle_ttl
+        self.memory_budget = memory_budget
+        self.clock = clock
+        self.store = store
+        self.write_through = store is not None and (store.shared if write_through is None else write_through)
+        self.purge_interval = purge_interval
+        self._next_purge = clock() + purge_interval
+        self.measure_interval = max(1, measure_interval)
+        self.evictions = 0
+        self.restores = 0
+        self._sessions: "OrderedDict[str, BattleSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, battle_id: str) -> bool:
+        return battle_id in self._sessions
+
+    def _drop(self, battle_id: str, park: bool = False):
+        session = self._sessions.pop(battle_id, None)
+        if session is None:
+            return
+        self.evictions += 1
+        if park and self.store is not None and not self.write_through:
+            self._save(session)
+
+    def _save(self, session: BattleSession):
+        self.store.put(session.battle_id, dump_game(session.game), session.revision, self.idle_ttl)
+
+    def _expired(self, session: BattleSession, now: float) -> bool:
+        return now - session.last_access > self.idle_ttl and not session.lock.locked()
+
+    def evict_expired(self) -> int:
+        now = self.clock()
+        with self._lock:
+            expired = [battle_id for battle_id, session in self._sessions.items() if self._expired(session, now)]
+            for battle_id in expired:
+                self._drop(battle_id)
+        if self.store is not None and now >= self._next_purge:
+            self._next_purge = now + self.purge_interval
+            self.store.purge_expired()
+        return len(expired)
+
+    def _over_limit(self, extra_battles: int = 0) -> bool:
+        if len(self._sessions) + extra_battles > self.max_battles:
+            return True
+        return bool(self.memory_budget) and self.total_bytes() > self.memory_budget
+
+    def _make_room(self, extra_battles: int):
+        for battle_id in list(self._sessions):
+            if not self._over_limit(extra_battles):
+                return
+            if not self._sessions[battle_id].lock.locked():
+                self._drop(battle_id, park=True)
+        if self._over_limit(extra_battles):
+            raise BattleLimitError(f"Too many concurrent battles ({len(self._sessions)})")
+
+    def create(self, game: Game) -> BattleSession:
+        self.evict_expired()
+        with self._lock:
+            self._make_room(1)
+            session = BattleSession(uuid.uuid4().hex, game)
+            session.last_access = self.clock()
+            session.measure()
+            self._sessions[session.battle_id] = session
+        if self.write_through:
+            self._save(session)
+        return session
+
+    def checkpoint(self, session: BattleSession):
+        """Record that a turn was played: re-measure now and then, and save the battle when writing through."""
+        session.revision += 1
+        if session.revision % self.measure_interval == 0:
+            session.measure()
+        if self.write_through:
+            self._save(session)
+
+    def _restore(self, battle_id: str, now: float) -> Optional[BattleSession]:
+        entry = self.store.get(battle_id)
+        if entry is None:
+            return None
+        snapshot, revision = entry
+        try:
+            game = load_game(snapshot)
+        except SnapshotError as e:
+            # e.g. parked by an older release with a different snapshot format
+            print(f"Warning: dropping unreadable snapshot of battle {battle_id}: {e}")
+            self.store.delete(battle_id)
+            return None
+        session = BattleSession(battle_id, game)
+        session.revision = revision
+        session.last_access = now
+        session.measure()
+        with self._lock:
+            current = self._sessions.get(battle_id)
+            if current is not None:
+                # Restored concurrently by another request
+                return current
+            self._make_room(1)
+            self._sessions[battle_id] = session
+            self.restores += 1
+        return session
+
+    def _refresh(self, session: BattleSession):
+        """Reload a battle another worker has played further than our copy."""
+        if session.lock.locked():
+            return
+        revision = self.store.revision(session.battle_id)
+        if revision is None or revision <= session.revision:
+            return
+        entry = self.store.get(session.battle_id)
+        if entry is not None:
+            session.game = load_game(entry[0])
+            session.revision = entry[1]
+            session.measure()
+
+    def get(self, battle_id: Optional[str]) -> Optional[BattleSession]:
+        if not battle_id:
+            return None
+        now = self.clock()
+        with self._lock:
+            session = self._sessions.get(battle_id)
+            if session is not None:
+                if self._expired(session, now):
+                    self._drop(battle_id)
+                    return None
+                session.last_access = now
+                self._sessions.move_to_end(battle_id)
+        if self.store is None:
+            return session
+        if session is None:
+            return self._restore(battle_id, now)
+        if self.write_through:
+            self._refresh(session)
+        return session
+
+    def remove(self, battle_id: str) -> bool:
+        if self.store is not None:
+            self.store.delete(battle_id)
+        with self._lock:
+            return self._sessions.pop(battle_id, None) is not None
+
+    def sessions(self) -> Iterable[BattleSession]:
+        return list(self._sessions.values())
+
+    def total_bytes(self) -> int:
+        return sum(session.size_bytes for session in self._sessions.values())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'battles': len(self._sessions),
+            'max_battles': self.max_battles,
+            'total_bytes': self.total_bytes(),
+            'evictions': self.evictions,
+            'restores': self.restores,
+        }
+
+
+battle_sessions = BattleSessionManager(store=create_store())
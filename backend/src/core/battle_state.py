@@ -0,0 +1,315 @@
+"""Compact binary snapshots of a running battle.
+
+A snapshot is ``PKBT`` + format version + a msgpack list with one entry per
+object in the battle graph (Game, sides, Pokemon, moves, abilities, items,
+status effects). Objects refer to each other by index, so shared references
+(the active Pokemon is also in its team, a future move points at its user)
+survive a round trip.
+
+Moves, abilities and items are stored as their name plus the attributes that
+differ from a freshly created one; on restore they start from a cached
+template built from the shared dataset, so dataset records are re-bound,
+never copied. Status effect configs are stored as references into
+STATUS_EFFECTS_CONFIG the same way. Hooks, the AI and the priority resolver
+hold no battle state and come from a fresh Game() (the AI for the stored
+ai_level). The battle's random
+stream is stored as its position (BattleRNG.getstate()) and re-bound to the
+AI and every Pokemon on restore, so a restored battle rolls the same numbers.
+"""
+
+import struct
+import threading
+from enum import Enum
+from itertools import compress, repeat
+from operator import is_not
+from typing import Any, Dict, List, Tuple
+
+import msgpack
+
+from ..models.move import Move
+from ..models.pokemon import Pokemon
+from ..systems import status_effects
+from ..systems.ability_system import ABILITIES_CONFIG, Ability
+from ..systems.item_system import ITEMS_CONFIG, Item
+from ..utils.battle_rng import BattleRNG
+from ..utils.data_loader import data_loader
+from .battle_view import StateVersions
+from .game import BattleSide, Game
+from .search_ai import create_ai
+
+MAGIC = b'PKBT'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sH')
+_INDEX = struct.Struct('<I')
+
+# Class codes are part of the format: append only, and bump FORMAT_VERSION on any other change.
+CLASSES = [
+    Game, BattleSide, Pokemon, Move, Ability, Item,
+    status_effects.StatusEffect,
+    status_effects.BurnStatusEffect,
+    status_effects.ParalysisStatusEffect,
+    status_effects.FreezeStatusEffect,
+    status_effects.SleepStatusEffect,
+    status_effects.PoisonStatusEffect,
+    status_effects.ToxicStatusEffect,
+    StateVersions,
+]
+_CLASS_CODES = {cls: code for code, cls in enumerate(CLASSES)}
+ENUMS = [status_effects.StatusType]
+
+# Attributes rebuilt on restore rather than stored; the RNG travels as Game's rng_state
+RUNTIME_ATTRS = {
+    Game: frozenset(['hooks', 'priority_resolver', 'ai', 'rng']),
+    Pokemon: frozenset(['rng']),
+}
+
+# Classes restored from a template instance: how to key the template and how to build one
+TEMPLATES = {
+    Move: (lambda move: move.name, Move),
+    Ability: (lambda ability: ability.id, Ability),
+    Item: (lambda item: item.id, Item),
+}
+
+_EXT_OBJECT, _EXT_SHARED, _EXT_TUPLE, _EXT_SET, _EXT_ENUM, _EXT_FROZENSET = range(1, 7)
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def _shared_tables() -> Dict[str, Dict[str, Any]]:
+    return {
+        'status': status_effects.STATUS_EFFECTS_CONFIG,
+        'ability': ABILITIES_CONFIG,
+        'item': ITEMS_CONFIG,
+        'move': data_loader.moves_data,
+    }
+
+
+_MISSING = object()
+
+
+class _Template:
+    __slots__ = ('attrs', 'names', 'values', 'copied')
+
+    def __init__(self, obj):
+        self.attrs = dict(vars(obj))
+        self.names = tuple(self.attrs)
+        self.values = tuple(self.attrs.values())
+        # Containers parsed per instance are copied on restore; ones that come
+        # straight from the dataset record (data, config, flags...) are shared.
+        record_parts = set()
+        for name in ('data', 'config'):
+            record = self.attrs.get(name)
+            if isinstance(record, dict):
+                record_parts.add(id(record))
+                record_parts.update(id(value) for value in record.values())
+        self.copied = [
+            name for name, value in self.attrs.items()
+            if isinstance(value, (dict, list, set)) and id(value) not in record_parts
+        ]
+
+    def diff(self, attrs: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Attributes of ``attrs`` that differ from the template, and template attributes it lacks."""
+        # Identity is checked in C for every attribute; only the few that fail it are compared by value
+        current = map(attrs.get, self.names, repeat(_MISSING))
+        changed, deleted = {}, []
+        for name in compress(self.names, map(is_not, current, self.values)):
+            value = attrs.get(name, _MISSING)
+            base = self.attrs[name]
+            if value is _MISSING:
+                deleted.append(name)
+            elif type(base) is not type(value) or base != value:
+                changed[name] = value
+        if len(attrs) != len(self.names) - len(deleted):
+            for name in attrs.keys() - self.attrs.keys():
+                changed[name] = attrs[name]
+        return changed, deleted
+
+    def instantiate(self, cls):
+        obj = cls.__new__(cls)
+        attrs = dict(self.attrs)
+        for name in self.copied:
+            attrs[name] = attrs[name].copy()
+        obj.__dict__ = attrs
+        return obj
+
+
+class _Registry:
+    """Process-wide caches: templates and the shared-record index."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._templates: Dict[Tuple[type, str], _Template] = {}
+        self._shared_refs: Dict[int, msgpack.ExtType] = None
+        self._tables: Dict[str, Dict[str, Any]] = None
+
+    def template(self, cls, key) -> _Template:
+        template = self._templates.get((cls, key))
+        if template is None:
+            template = _Template(TEMPLATES[cls][1](key))
+            with self._lock:
+                self._templates[(cls, key)] = template
+        return template
+
+    def tables(self) -> Dict[str, Dict[str, Any]]:
+        if self._tables is None:
+            self._tables = _shared_tables()
+        return self._tables
+
+    def shared_refs(self) -> Dict[int, msgpack.ExtType]:
+        """Encoded reference for every dataset record, by id of the record."""
+        if self._shared_refs is None:
+            refs = {}
+            for table_name, table in self.tables().items():
+                for key, record in table.items():
+                    if id(record) not in refs:
+                        refs[id(record)] = msgpack.ExtType(_EXT_SHARED, msgpack.packb([table_name, key]))
+            self._shared_refs = refs
+        return self._shared_refs
+
+
+_registry = _Registry()
+
+
+_object_refs: List[msgpack.ExtType] = []
+
+
+def _object_ref(position: int) -> msgpack.ExtType:
+    while len(_object_refs) <= position:
+        _object_refs.append(msgpack.ExtType(_EXT_OBJECT, _INDEX.pack(len(_object_refs))))
+    return _object_refs[position]
+
+
+class _Encoder:
+    def __init__(self):
+        self.objects: List[Any] = []
+        self.refs: Dict[int, msgpack.ExtType] = {}
+        self.names: Dict[str, int] = {}
+        self.shared = _registry.shared_refs()
+        self.packer = msgpack.Packer(default=self.default, strict_types=True, use_bin_type=True)
+
+    def default(self, value):
+        cls = type(value)
+        if cls in _CLASS_CODES:
+            ref = self.refs.get(id(value))
+            if ref is None:
+                ref = self.refs[id(value)] = _object_ref(len(self.objects))
+                self.objects.append(value)
+            return ref
+        if cls is tuple:
+            return msgpack.ExtType(_EXT_TUPLE, self.pack(list(value)))
+        if cls is set:
+            return msgpack.ExtType(_EXT_SET, self.pack(list(value)))
+        if cls is frozenset:
+            return msgpack.ExtType(_EXT_FROZENSET, self.pack(list(value)))
+        if isinstance(value, Enum) and cls in ENUMS:
+            return msgpack.ExtType(_EXT_ENUM, self.pack([ENUMS.index(cls), value.value]))
+        raise TypeError(f"Can't snapshot {cls.__module__}.{cls.__qualname__}")
+
+    def pack(self, value) -> bytes:
+        return msgpack.packb(value, default=self.default, strict_types=True, use_bin_type=True)
+
+    def name_ids(self, names) -> List[int]:
+        table = self.names
+        ids = list(map(table.get, names))
+        if None in ids:
+            ids = [table.setdefault(name, len(table)) for name in names]
+        return ids
+
+    def entry(self, obj) -> Tuple[list, bytes]:
+        """([class code, template key, deleted attribute ids], packed [attribute ids, values])."""
+        cls = type(obj)
+        attrs = vars(obj)
+        key, deleted = None, []
+        if cls in RUNTIME_ATTRS:
+            runtime = RUNTIME_ATTRS[cls]
+            attrs = {name: value for name, value in attrs.items() if name not in runtime}
+            if cls is Game:
+                attrs['rng_state'] = obj.rng.getstate()
+        elif cls in TEMPLATES:
+            key = TEMPLATES[cls][0](obj)
+            attrs, deleted = _registry.template(cls, key).diff(attrs)
+        values = list(attrs.values())
+        if not self.shared.keys().isdisjoint(map(id, values)):
+            values = [self.shared.get(id(value), value) if type(value) is dict else value for value in values]
+        state = self.packer.pack([self.name_ids(attrs), values])
+        return [_CLASS_CODES[cls], key, self.name_ids(deleted)], state
+
+
+def dump_game(game: Game) -> bytes:
+    """Serialize the full battle state of ``game``."""
+    encoder = _Encoder()
+    encoder.default(game)
+    heads, states = [], []
+    # Packing a state discovers the objects it references, which join the end of the queue
+    while len(states) < len(encoder.objects):
+        head, state = encoder.entry(encoder.objects[len(states)])
+        heads.append(head)
+        states.append(state)
+    table = msgpack.packb([list(encoder.names), heads], use_bin_type=True)
+    array_header = msgpack.Packer().pack_array_header(len(states))
+    return b''.join([_HEADER.pack(MAGIC, FORMAT_VERSION), table, array_header] + states)
+
+
+def load_game(blob: bytes) -> Game:
+    """Rebuild a Game from ``dump_game`` output."""
+    if len(blob) < _HEADER.size:
+        raise SnapshotError("Truncated battle snapshot")
+    magic, version = _HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise SnapshotError("Not a battle snapshot")
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"Battle snapshot version {version}, expected {FORMAT_VERSION}")
+
+    tables = _registry.tables()
+    objects = []
+
+    def ext_hook(code, data):
+        if code == _EXT_OBJECT:
+            return objects[_INDEX.unpack(data)[0]]
+        if code == _EXT_SHARED:
+            table_name, key = unpack(data)
+            return tables[table_name][key]
+        if code == _EXT_TUPLE:
+            return tuple(unpack(data))
+        if code == _EXT_SET:
+            return set(unpack(data))
+        if code == _EXT_FROZENSET:
+            return frozenset(unpack(data))
+        if code == _EXT_ENUM:
+            enum_index, value = unpack(data)
+            return ENUMS[enum_index](value)
+        raise SnapshotError(f"Unknown extension type {code}")
+
+    def unpack(data):
+        return msgpack.unpackb(data, ext_hook=ext_hook, raw=False, strict_map_key=False)
+
+    unpacker = msgpack.Unpacker(ext_hook=ext_hook, raw=False, strict_map_key=False)
+    unpacker.feed(memoryview(blob)[_HEADER.size:])
+    try:
+        names, heads = unpacker.unpack()
+        # Every object exists before any state is read, so references resolve in one pass
+        for code, key, _ in heads:
+            cls = CLASSES[code]
+            if cls is Game:
+                objects.append(Game())
+            elif key is not None:
+                objects.append(_registry.template(cls, key).instantiate(cls))
+            else:
+                objects.append(cls.__new__(cls))
+        states = unpacker.unpack()
+        for obj, (name_ids, values), (_, _, deleted) in zip(objects, states, heads):
+            attrs = obj.__dict__
+            attrs.update(zip(map(names.__getitem__, name_ids), values))
+            for name_id in deleted:
+                attrs.pop(names[name_id], None)
+    except (msgpack.OutOfData, ValueError, IndexError, KeyError, TypeError) as e:
+        raise SnapshotError(f"Corrupt battle snapshot: {e}") from e
+    game = objects[0]
+    game.priority_resolver.set_debug_mode(not game.headless)
+    # Snapshots from before the RNG was stored carry on with a fresh stream
+    rng_state = game.__dict__.pop('rng_state', None)
+    game.ai = create_ai(game.ai_level, realtime=not game.headless)
+    game.bind_rng(BattleRNG.from_state(rng_state) if rng_state else None)
+    return game
@@ -0,0 +1,175 @@
+"""Stores for parked battles: ``battle_state`` snapshots keyed by battle id.
+
+MemoryBattleStore keeps snapshots in this process (evicted battles can come
+back instead of 404ing), dropping the least recently parked ones beyond
+BATTLE_STORE_MAX_ENTRIES entries or BATTLE_STORE_MAX_BYTES bytes. SQLiteBattleStore keeps them in a file every worker
+on the host can open, so any worker can resume any battle.
+
+BATTLE_STORE picks the store for the server: unset for none, ``memory``,
+``sqlite`` (data/battles.sqlite3) or ``sqlite:<path>``.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(CURRENT_DIR)), 'data')
+
+BATTLE_STORE = os.getenv('BATTLE_STORE', '')
+DEFAULT_SQLITE_PATH = os.path.join(DATA_DIR, 'battles.sqlite3')
+MEMORY_STORE_MAX_ENTRIES = int(os.getenv('BATTLE_STORE_MAX_ENTRIES', '5000'))
+# 0 = no byte cap
+MEMORY_STORE_MAX_BYTES = int(os.getenv('BATTLE_STORE_MAX_BYTES', '0'))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS battles (
+    battle_id TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL,
+    snapshot BLOB NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class BattleStore:
+    """Snapshot storage interface. Every entry carries the revision it was saved at."""
+
+    # True when other processes see the same entries
+    shared = False
+
+    def put(self, battle_id: str, snapshot: bytes, revision: int, ttl: float):
+        raise NotImplementedError
+
+    def get(self, battle_id: str) -> Optional[Tuple[bytes, int]]:
+        """(snapshot, revision), or None if missing or expired."""
+        raise NotImplementedError
+
+    def revision(self, battle_id: str) -> Optional[int]:
+        entry = self.get(battle_id)
+        return entry[1] if entry else None
+
+    def delete(self, battle_id: str):
+        raise NotImplementedError
+
+    def purge_expired(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryBattleStore(BattleStore):
+    """Snapshots in this process, least recently parked first."""
+
+    def __init__(self, clock=time.time, max_entries: int = MEMORY_STORE_MAX_ENTRIES,
+                 max_bytes: int = MEMORY_STORE_MAX_BYTES):
+        self.clock = clock
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[str, Tuple[bytes, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, battle_id: str, snapshot: bytes, revision: int, ttl: float):
+        with self._lock:
+            self._pop(battle_id)
+            self._entries[battle_id] = (snapshot, revision, self.clock() + ttl)
+            self.total_bytes += len(snapshot)
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or (self.max_bytes and self.total_bytes > self.max_bytes)
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def get(self, battle_id: str) -> Optional[Tuple[bytes, int]]:
+        entry = self._entries.get(battle_id)
+        if entry is None or entry[2] <= self.clock():
+            return None
+        return entry[0], entry[1]
+
+    def _pop(self, battle_id: str):
+        entry = self._entries.pop(battle_id, None)
+        if entry is not None:
+            self.total_bytes -= len(entry[0])
+
+    def delete(self, battle_id: str):
+        with self._lock:
+            self._pop(battle_id)
+
+    def purge_expired(self) -> int:
+        now = self.clock()
+        with self._lock:
+            expired = [battle_id for battle_id, entry in self._entries.items() if entry[2] <= now]
+            for battle_id in expired:
+                self._pop(battle_id)
+        return len(expired)
+
+
+class SQLiteBattleStore(BattleStore):
+    """Snapshots in a SQLite file (WAL mode, one connection per thread)."""
+
+    shared = True
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self._local = threading.local()
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute(_SCHEMA)
+            self._local.db = db
+        return db
+
+    def __len__(self) -> int:
+        return self._db().execute('SELECT COUNT(*) FROM battles').fetchone()[0]
+
+    def put(self, battle_id: str, snapshot: bytes, revision: int, ttl: float):
+        self._db().execute(
+            'INSERT OR REPLACE INTO battles (battle_id, revision, snapshot, expires_at) VALUES (?, ?, ?, ?)',
+            (battle_id, revision, snapshot, self.clock() + ttl),
+        )
+
+    def get(self, battle_id: str) -> Optional[Tuple[bytes, int]]:
+        row = self._db().execute(
+            'SELECT snapshot, revision FROM battles WHERE battle_id = ? AND expires_at > ?',
+            (battle_id, self.clock()),
+        ).fetchone()
+        return (bytes(row[0]), row[1]) if row else None
+
+    def revision(self, battle_id: str) -> Optional[int]:
+        row = self._db().execute(
+            'SELECT revision FROM battles WHERE battle_id = ? AND expires_at > ?',
+            (battle_id, self.clock()),
+        ).fetchone()
+        return row[0] if row else None
+
+    def delete(self, battle_id: str):
+        self._db().execute('DELETE FROM battles WHERE battle_id = ?', (battle_id,))
+
+    def purge_expired(self) -> int:
+        return self._db().execute('DELETE FROM battles WHERE expires_at <= ?', (self.clock(),)).rowcount
+
+
+def create_store(spec: str = BATTLE_STORE) -> Optional[BattleStore]:
+    """Store for a BATTLE_STORE value."""
+    spec = (spec or '').strip()
+    if not spec:
+        return None
+    if spec == 'memory':
+        return MemoryBattleStore()
+    if spec == 'sqlite':
+        return SQLiteBattleStore()
+    if spec.startswith('sqlite:'):
+        return SQLiteBattleStore(spec[len('sqlite:'):])
+    print(f"Warning: unknown BATTLE_STORE {spec!r}, battles will not be parked")
+    return None
@@ -0,0 +1,126 @@
+"""Compact client-facing view of a battle, versioned per field.
+
+A view carries what the battle screen draws: for every Pokemon its identity
+and forme, HP, status, stat stages, item and move PP, plus the active
+indices, weather and the active player Pokemon's move list.
+
+StateVersions (``Game.state_versions``) remembers, for every field of the
+view, its value and the state version that last changed it. A client that
+holds version N gets ``delta_since(N)``: just the fields changed after N,
+usually a handful of HP and PP numbers instead of both teams' full
+``to_dict()``.
+"""
+
+from typing import Any, Dict, List, Optional
+
+TEAMS = ('player_team', 'opponent_team')
+
+
+def pokemon_view(pokemon) -> Dict[str, Any]:
+    return {
+        'name': pokemon.name,
+        'types': list(pokemon.types),
+        'sprite': pokemon.sprite_url,
+        'cry_url': pokemon.cry_url,
+        'level': pokemon.level,
+        'current_hp': pokemon.current_hp,
+        'max_hp': pokemon.max_hp,
+        'status_effects': pokemon.get_status_display(),
+        'substitute_hp': pokemon.substitute_hp,
+        'stat_stages': dict(pokemon.stat_stages),
+        'item': pokemon.item,
+        'ability': pokemon.ability.name if pokemon.ability else None,
+        'pp': {name: move.pp for name, move in pokemon.moves.items()},
+    }
+
+
+def _active_index(team: List, active) -> Optional[int]:
+    for i, pokemon in enumerate(team):
+        if pokemon is active:
+            return i
+    return None
+
+
+def battle_view(game) -> Dict[str, Any]:
+    player = game.player_pokemon
+    return {
+        'weather': game.weather,
+        'player_active': _active_index(game.player_team, player),
+        'opponent_active': _active_index(game.opponent_team, game.opponent_pokemon),
+        'player_team': [pokemon_view(p) for p in game.player_team],
+        'opponent_team': [pokemon_view(p) for p in game.opponent_team],
+        'player_moves': [m.to_dict() for m in player.moves.values()] if player else [],
+        'can_mega_evolve': game.can_mega_evolve(True) if player else False,
+        'pending_player_switch': game.pending_player_self_switch,
+        'is_game_over': game.battle_over,
+    }
+
+
+class StateVersions:
+    """Per-field change versions of a battle's view; ``version`` bumps when anything changes."""
+
+    def __init__(self):
+        self.version = 0
+        # field -> [version, value] for top-level fields; per team, one such dict per slot
+        self.fields: Dict[str, list] = {}
+        self.teams: Dict[str, List[Dict[str, list]]] = {team: [] for team in TEAMS}
+
+    def update(self, view: Dict[str, Any]) -> int:
+        """Record ``view``; returns the (possibly new) version."""
+        changed = []
+        for key, value in view.items():
+            if key in self.teams:
+                slots = self.teams[key]
+                for i, pokemon in enumerate(value):
+                    if i == len(slots):
+                        slots.append({})
+                    slot = slots[i]
+                    for field, field_value in pokemon.items():
+                        entry = slot.get(field)
+                        if entry is None:
+                            entry = slot[field] = [0, None]
+                            changed.append((entry, field_value))
+                        elif entry[1] != field_value:
+                            changed.append((entry, field_value))
+            else:
+                entry = self.fields.get(key)
+                if entry is None or entry[1] != value:
+                    entry = self.fields.setdefault(key, [0, None])
+                    changed.append((entry, value))
+        if changed:
+            self.version += 1
+            for entry, value in changed:
+                entry[0], entry[1] = self.version, value
+        return self.version
+
+    def delta_since(self, version: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Fields changed after ``version``, shaped like a view with teams keyed by slot.
+
+        None when ``version`` isn't one this battle has produced; send the full view instead.
+        """
+        if not isinstance(version, int) or isinstance(version, bool) or not 0 < version <= self.version:
+            return None
+        delta = {key: value for key, (changed_at, value) in self.fields.items() if changed_at > version}
+        for team, slots in self.teams.items():
+            team_delta = {}
+            for i, slot in enumerate(slots):
+                changed = {field: value for field, (changed_at, value) in slot.items() if changed_at > version}
+                if changed:
+                    team_delta[str(i)] = changed
+            if team_delta:
+                delta[team] = team_delta
+        return delta
+
+
+def apply_delta(view: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """``view`` updated with ``delta`` (what a client does with a delta)."""
+    result = dict(view)
+    for key, value in delta.items():
+        if key in TEAMS:
+            team = [dict(p) for p in result.get(key, [])]
+            for index, changed in value.items():
+                team[int(index)].update(changed)
+            result[key] = team
+        else:
+            result[key] = value
+    return result
@@ -1,4 +1,3 @@
-import random
 from .hooks import BattleContext
 
 
@@ -25,7 +24,7 @@ def self_switch_after_move(context: BattleContext) -> None:
         game.pending_player_self_switch = True
         context.events.append({
             "type": "pending_switch",
-            "message": f"{game._get_pokemon_name(attacker)} went back to its trainer!",
+            "message": game._message("{} went back to its trainer!", attacker),
             "target": "player",
             "is_player_switch": True,
             "pokemon_hp": attacker.current_hp,
@@ -234,7 +233,7 @@ def recoil_on_hit(context: BattleContext) -> None:
     attacker.take_damage(recoil_damage)
     context.events.append({
         "type": "status",
-        "message": f"{game._get_pokemon_name(attacker)} is hurt by recoil!",
+        "message": game._message("{} is hurt by recoil!", attacker),
         "target": "player" if context.is_player_attacking else "opponent",
         "pokemon_hp": attacker.current_hp,
     })
@@ -265,8 +264,10 @@ def healing_on_hit(context: BattleContext) -> None:
     actual_heal = attacker.current_hp - hp_before
     
     if actual_heal > 0:
-        msg = f"{game._get_pokemon_name(attacker)} recovered {actual_heal} HP!"
-        if drain_ratio: msg += f" {game._get_pokemon_name(context.defender)}'s energy was drained!"
+        if drain_ratio:
+            msg = game._message("{} recovered {heal} HP! {}'s energy was drained!", attacker, context.defender, heal=actual_heal)
+        else:
+            msg = game._message("{} recovered {heal} HP!", attacker, heal=actual_heal)
         context.events.append({
             "type": "status",
             "message": msg,
@@ -290,7 +291,7 @@ def secondary_effects_on_hit(context: BattleContext) -> None:
     
     def process_block(block):
         chance = block.get("chance", 100) * multiplier
-        if random.randint(1, 100) > chance:
+        if attacker.rng.randint(1, 100) > chance:
             return
         
         # Status effects
@@ -337,7 +338,7 @@ def weather_residual_effects(context: BattleContext) -> None:
                 p.take_damage(damage)
                 context.events.append({
                     "type": "status",
-                    "message": f"{game._get_pokemon_name(p)} is buffeted by the sandstorm!",
+                    "message": game._message("{} is buffeted by the sandstorm!", p),
                     "target": "player" if p == game.player_pokemon else "opponent",
                     "pokemon_hp": p.current_hp
                 })
@@ -349,7 +350,7 @@ def weather_residual_effects(context: BattleContext) -> None:
                 p.take_damage(damage)
                 context.events.append({
                     "type": "status",
-                    "message": f"{game._get_pokemon_name(p)} is buffeted by the hail!",
+                    "message": game._message("{} is buffeted by the hail!", p),
                     "target": "player" if p == game.player_pokemon else "opponent",
                     "pokemon_hp": p.current_hp
                 })
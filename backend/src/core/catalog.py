@@ -0,0 +1,173 @@
+"""Prebuilt catalog responses: moves, items, species, battle-ready Pokemon, learnsets.
+
+Each catalog is serialized to JSON once and compressed once (gzip, plus
+brotli when the ``brotli`` package is installed). Responses carry a strong
+ETag per encoding and Cache-Control, so a repeat request is a header check
+(304) or a copy of ready-made bytes.
+
+The datasets don't change while the server runs; the battle-ready list is
+rebuilt when the sets file changes. Learnsets are built per Pokemon on
+first request and kept in a bounded LRU.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Request, Response
+
+from ..models.moveset import get_battle_ready_pokemon_list
+from ..utils.data_loader import data_loader
+from ..utils.sets_database import sets_database
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+CACHE_CONTROL = os.getenv('CATALOG_CACHE_CONTROL', 'public, max-age=3600')
+MAX_LEARNSETS = 2048
+
+
+def choose_encoding(accept_encoding: str, available) -> str:
+    """Best of ``available`` ('br' over 'gzip') the client accepts, else 'identity'."""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    for coding in ('br', 'gzip'):
+        if coding in available and accepted.get(coding, accepted.get('*', 0)) > 0:
+            return coding
+    return 'identity'
+
+
+class CatalogPayload:
+    """One catalog body in every encoding, with its ETags."""
+
+    __slots__ = ('bodies', 'etags')
+
+    def __init__(self, data: Any):
+        body = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        self.bodies = {'identity': body, 'gzip': gzip.compress(body, 9, mtime=0)}
+        if brotli is not None:
+            self.bodies['br'] = brotli.compress(body)
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        # Strong ETags name exact bytes, so each encoding gets its own
+        self.etags = {coding: f'"{digest}"' if coding == 'identity' else f'"{digest}-{coding}"'
+                      for coding in self.bodies}
+
+    def not_modified(self, if_none_match: str) -> bool:
+        tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return '*' in tags or any(etag in tags for etag in self.etags.values())
+
+    def response(self, request: Request) -> Response:
+        coding = choose_encoding(request.headers.get('accept-encoding', ''), self.bodies)
+        headers = {'ETag': self.etags[coding], 'Cache-Control': CACHE_CONTROL, 'Vary': 'Accept-Encoding'}
+        if self.not_modified(request.headers.get('if-none-match', '')):
+            return Response(status_code=304, headers=headers)
+        if coding != 'identity':
+            headers['Content-Encoding'] = coding
+        return Response(self.bodies[coding], media_type='application/json', headers=headers)
+
+
+def _sets_version() -> int:
+    # Re-reads the sets file if it changed, which bumps its version
+    sets_database.is_available()
+    return sets_database.version
+
+
+def build_moves() -> Dict[str, Any]:
+    return {'success': True, 'moves': sorted({m['name'] for m in data_loader.moves_data.values() if 'name' in m})}
+
+
+def build_items() -> Dict[str, Any]:
+    # items_data keys are normalized IDs, but we want the display names
+    names = {item.get('name') for item in data_loader.items_data.values()}
+    names.discard(None)
+    return {'success': True, 'items': sorted(names)}
+
+
+def build_species() -> Dict[str, Any]:
+    species: List[Dict[str, Any]] = []
+    for species_id, entry in data_loader.pokedex_data.items():
+        if entry.get('num', 0) <= 0 or 'name' not in entry:
+            continue
+        full = data_loader.get_species(entry['name']) or entry
+        species.append({
+            'id': species_id,
+            'name': entry['name'],
+            'num': entry['num'],
+            'types': full.get('types', []),
+            'base_species': entry.get('baseSpecies', entry['name']),
+        })
+    species.sort(key=lambda s: (s['num'], s['name'] != s['base_species'], s['name']))
+    return {'success': True, 'species': species}
+
+
+def build_battle_ready() -> Dict[str, Any]:
+    return {'success': True, 'pokemon': get_battle_ready_pokemon_list()}
+
+
+class Catalog:
+    def __init__(self):
+        # name -> (builder, source version or None for fixed data)
+        self._builders: Dict[str, Tuple[Callable[[], Any], Optional[Callable[[], Any]]]] = {}
+        self._payloads: Dict[str, Tuple[Any, CatalogPayload]] = {}
+        self._learnsets: 'OrderedDict[str, CatalogPayload]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, name: str, build: Callable[[], Any], version: Optional[Callable[[], Any]] = None):
+        self._builders[name] = (build, version)
+
+    def payload(self, name: str) -> CatalogPayload:
+        build, version = self._builders[name]
+        current = version() if version else None
+        cached = self._payloads.get(name)
+        if cached is None or cached[0] != current:
+            with self._lock:
+                cached = self._payloads.get(name)
+                if cached is None or cached[0] != current:
+                    cached = self._payloads[name] = (current, CatalogPayload(build()))
+        return cached[1]
+
+    def learnset(self, pokemon_name: str) -> CatalogPayload:
+        key = pokemon_name.lower()
+        with self._lock:
+            payload = self._learnsets.get(key)
+            if payload is not None:
+                self._learnsets.move_to_end(key)
+                return payload
+        payload = CatalogPayload(data_loader.get_pokemon_moves(pokemon_name))
+        with self._lock:
+            self._learnsets[key] = payload
+            while len(self._learnsets) > MAX_LEARNSETS:
+                self._learnsets.popitem(last=False)
+        return payload
+
+    def build(self):
+        for name in self._builders:
+            try:
+                self.payload(name)
+            except Exception as e:
+                print(f"Error building {name} catalog: {e}")
+
+    def warm(self):
+        """Build every catalog on a background thread."""
+        threading.Thread(target=self.build, name='catalog', daemon=True).start()
+
+
+catalog = Catalog()
+catalog.register('moves', build_moves)
+catalog.register('items', build_items)
+catalog.register('species', build_species)
+catalog.register('battle_ready', build_battle_ready, version=_sets_version)
@@ -1,17 +1,23 @@
-from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse, FileResponse
+import asyncio
 import requests
 import os
 import random
-from typing import List, Dict, Any, Optional
-from functools import lru_cache
+from typing import Dict, Any, Optional
+from .battle_sessions import BattleLimitError, battle_sessions
+from .battle_view import battle_view
+from .catalog import catalog
 from .game import Game
+from .search_ai import AI_LEVELS
+from .team_builder import close_http_client, hydrate_teams, run_blocking
 from ..models.pokemon import Pokemon
 from ..utils.data_loader import data_loader
-from ..models.moveset import get_strategic_moveset, get_all_pokemon_sets, get_random_battle_ready_pokemon, get_battle_ready_pokemon_list, BATTLE_ONLY_FORM_SUFFIXES
-from ..utils.pokemon_utils import POKEAPI_NAME_MAP, get_mandatory_item
+from ..models.moveset import get_strategic_moveset, get_all_pokemon_sets, get_random_battle_ready_pokemon
+from ..utils.pokemon_search import pokemon_search
 import json
 import re
 from dotenv import load_dotenv
@@ -29,6 +35,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.on_event("startup")
+def load_datasets():
+    # Datasets load lazily on first use; workers that prefer paying the cost up front set PRELOAD_DATASETS=1.
+    if os.getenv("PRELOAD_DATASETS", "").lower() in ("1", "true", "yes"):
+        data_loader.preload()
+    print(data_loader.timing_report())
+    pokemon_search.warm()
+    catalog.warm()
+
+
+@app.on_event("shutdown")
+async def close_clients():
+    await close_http_client()
+
+
 supabase_url = os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 bucket_name = os.getenv("SUPABASE_BUCKET_NAME", "pokemon-music")
@@ -41,8 +63,6 @@ if supabase_url and supabase_key and "PASTE_YOUR" not in supabase_key:
     except Exception as e:
         print(f"Error initializing Supabase client: {e}")
 
-game_instance = None
-
 # Resolve data path robustly
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DATA_DIR = os.path.join(BASE_DIR, 'data')
@@ -128,22 +148,10 @@ async def get_battle_tracks():
 @app.get("/api/pokemon/cry/{pokemon_name}")
 async def pokemon_cry(pokemon_name: str):
     try:
-        # Try to get ID first
-        normalized = pokemon_name.lower().replace(' ', '').replace('-', '')
-        api_name = POKEAPI_NAME_MAP.get(normalized, pokemon_name.lower())
-        pokemon_id = POKEMON_ID_MAP.get(api_name) or POKEMON_ID_MAP.get(normalized)
-        
-        # Fallback to name if ID not found
-        identifier = str(pokemon_id) if pokemon_id else api_name
-        
-        url = f'https://pokeapi.co/api/v2/pokemon/{identifier}'
-        response = requests.get(url, timeout=5)
-        if response.status_code == 200:
-            pokemon_data = response.json()
-            cry_url = None
-            
-            if 'cries' in pokemon_data and 'latest' in pokemon_data['cries']:
-                cry_url = pokemon_data['cries']['latest']
+        # Cry URLs come from the bundled species data; PokeAPI is only asked about unknown names
+        pokemon_data = get_pokemon_data(pokemon_name)
+        if pokemon_data:
+            cry_url = pokemon_data.get('cries', {}).get('latest')
             
             if not cry_url:
                 pokemon_id = pokemon_data.get('id')
@@ -166,49 +174,7 @@ async def pokemon_cry(pokemon_name: str):
             return FileResponse(fallback_path)
         raise HTTPException(status_code=500, detail=str(e))
 
-from ..utils.pokemon_api import get_best_sprite, get_pokemon_data, to_display_name
-
-def get_pokemon_moves(pokemon_data):
-    pokemon_name = pokemon_data['name'].lower()
-    strategic_moves = get_strategic_moveset(pokemon_name, debug=False)
-    
-    if strategic_moves:
-        return [{'name': move_name} for move_name in strategic_moves[:4]]
-    return [{'name': 'tackle'}, {'name': 'growl'}]
-
-@lru_cache(maxsize=1)
-def get_comprehensive_pokemon_list() -> List[str]:
-    # Start with Smogon list
-    try:
-        names = set(get_battle_ready_pokemon_list())
-    except:
-        names = set()
-        
-    # Add names from our ID map (most comprehensive)
-    if 'POKEMON_ID_MAP' in globals() and POKEMON_ID_MAP:
-        for n in POKEMON_ID_MAP.keys():
-            names.add(n)
-            
-    # Add PokeAPI names fallback
-    try:
-        names_path = os.path.join(DATA_DIR, 'all_pokemon_names.json')
-        if os.path.exists(names_path):
-            with open(names_path, 'r') as f:
-                api_names = json.load(f)
-                for n in api_names:
-                    names.add(n)
-    except Exception as e:
-        print(f"Error loading PokeAPI names: {e}")
-        
-    # Filter out battle-only forms
-    filtered_names = []
-    lower_suffixes = [s.lower() for s in BATTLE_ONLY_FORM_SUFFIXES]
-    for n in names:
-        if any(n.lower().endswith(s) for s in lower_suffixes):
-            continue
-        filtered_names.append(n)
-        
-    return sorted(list(set(filtered_names)))
+from ..utils.pokemon_api import get_best_sprite, get_pokemon_data
 
 @app.get("/api/search-pokemon")
 async def search_pokemon(q: str = "", sets_only: bool = False):
@@ -217,42 +183,7 @@ async def search_pokemon(q: str = "", sets_only: bool = False):
         return {"success": False, "results": []}
         
     try:
-        # Use comprehensive list
-        all_names = get_comprehensive_pokemon_list()
-        
-        # Filter matches
-        matches = [p for p in all_names if query in p.lower()][:20]
-        
-        results = []
-        for pokemon_name in matches:
-            # Check for sets (this is local and fast)
-            moveset = get_strategic_moveset(pokemon_name, debug=False)
-            has_sets = bool(moveset)
-            
-            if sets_only and not has_sets:
-                continue
-            
-            normalized = pokemon_name.lower().replace(' ', '').replace('-', '').replace('.', '')
-            api_name = POKEAPI_NAME_MAP.get(normalized, pokemon_name.lower().replace(' ', '-').replace('.', ''))
-            
-            # Deduplicate by API name to avoid Glastrier/glastrier duplicates
-            if any(r['name'] == api_name for r in results):
-                continue
-                
-            # FAST: Only provide basic info. Detailed info like abilities will be fetched 
-            # when the user actually selects the Pokemon in the UI.
-            results.append({
-                'name': api_name,
-                'display_name': to_display_name(pokemon_name),
-                'item': get_mandatory_item(pokemon_name) or '',
-                'moveset': moveset[:4] if moveset else ['Tackle'],
-                'has_sets': has_sets
-            })
-            
-            if len(results) >= 15:
-                break
-        
-        return {"success": True, "results": results}
+        return {"success": True, "results": pokemon_search.search(query, sets_only=sets_only)}
     except Exception as e:
         print(f"Error searching Pokémon: {e}")
         return {"success": False, "results": []}
@@ -295,44 +226,35 @@ async def get_all_sets(pokemon_name: str):
 async def search_pokemon_optimized(q: str = ""):
     return await search_pokemon(q)
 
-@app.get("/api/battle-ready-pokemon")
-async def get_battle_ready_list():
+def catalog_response(request: Request, name: str):
     try:
-        return {"success": True, "pokemon": get_battle_ready_pokemon_list()}
+        return catalog.payload(name).response(request)
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+@app.get("/api/battle-ready-pokemon")
+async def get_battle_ready_list(request: Request):
+    return catalog_response(request, "battle_ready")
+
 @app.get("/api/pokemon/{name}/moves")
-async def get_pokemon_learnset_api(name: str):
-    moves = data_loader.get_pokemon_moves(name)
-    return moves
+async def get_pokemon_learnset_api(name: str, request: Request):
+    return catalog.learnset(name).response(request)
 
 @app.get("/api/all-moves")
-async def get_all_moves_list():
-    try:
-        from ..utils.data_loader import data_loader
-        moves = sorted(list(set([m['name'] for m in data_loader.moves_data.values() if 'name' in m])))
-        return {"success": True, "moves": moves}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+async def get_all_moves_list(request: Request):
+    return catalog_response(request, "moves")
 
 @app.get("/api/items")
-async def get_all_items_list():
-    try:
-        from ..utils.data_loader import data_loader
-        # items_data keys are normalized IDs, but we want the display names
-        items = []
-        for item_id, item_data in data_loader.items_data.items():
-            name = item_data.get('name')
-            if name:
-                items.append(name)
-        return {"success": True, "items": sorted(list(set(items)))}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+async def get_all_items_list(request: Request):
+    return catalog_response(request, "items")
+
+@app.get("/api/species")
+async def get_species_list(request: Request):
+    return catalog_response(request, "species")
+
 
 @app.post("/api/start")
-async def start_game(request: Request):
-    global game_instance
+async def start_game(request: Request, response: Response):
     try:
         data = await request.json()
         
@@ -378,77 +300,25 @@ async def start_game(request: Request):
         else:
             opponent_team_raw = [{'name': opponent_choice}]
 
-        player_team_processed = []
-        for p in player_team_raw:
-            p_data = get_pokemon_data(p['name'])
-            if not p_data:
-                continue # Skip if no data
-            moves = [{'name': m} for m in p.get('moves', [])]
-            if not moves:
-                moves = get_pokemon_moves(p_data)
-                
-            mandatory = get_mandatory_item(p['name'])
-            config = {
-                'name': p_data['name'],
-                'types': [t['type']['name'] for t in p_data['types']],
-                'sprite_url': get_best_sprite(p_data, side='back', shiny=p.get('shiny', False)),
-                'stats': p_data['stats'],
-                'moves': moves,
-                'cry_url': p_data.get('cries', {}).get('latest', ''),
-                'ability': p.get('ability') or p_data.get('abilities', [{}])[0].get('ability', {}).get('name', 'noability'),
-                'item': p.get('item') or mandatory or ''
-            }
-            player_team_processed.append(config)
-            
-        opponent_team_processed = []
-        for o in opponent_team_raw:
-            o_data = get_pokemon_data(o['name'])
-            if not o_data:
-                continue # Skip if no data
-            o_name = o['name'].lower()
-            
-            o_moves = []
-            o_config = {}
-            o_sets = get_all_pokemon_sets(o_name)
-            if o_sets:
-                all_sets = []
-                for fmt in o_sets:
-                    for set_name, s in o_sets[fmt].items():
-                        all_sets.append(s)
-                
-                if all_sets:
-                    best_set = random.choice(all_sets)
-                    mandatory = get_mandatory_item(o_name)
-                    o_config = {
-                        'evs': best_set.get('evs', {}),
-                        'ivs': best_set.get('ivs', {}),
-                        'nature': best_set.get('nature', 'Hardy'),
-                        'ability': best_set.get('ability', 'noability'),
-                        'item': best_set.get('item', mandatory or '')
-                    }
-                    if best_set.get('moves'):
-                        o_moves = [{'name': m} for m in best_set['moves']]
-            
-            if not o_moves:
-                o_moves = get_pokemon_moves(o_data)
-                
-            config = {
-                'name': o_data['name'],
-                'types': [t['type']['name'] for t in o_data['types']],
-                'sprite_url': get_best_sprite(o_data, side='front', shiny=False),
-                'stats': o_data['stats'],
-                'moves': o_moves,
-                'cry_url': o_data.get('cries', {}).get('latest', ''),
-                **o_config
-            }
-            opponent_team_processed.append(config)
+        ai_level = data.get('ai_level', 'greedy')
+        if ai_level not in AI_LEVELS:
+            raise HTTPException(status_code=400, detail=f"Unknown ai_level {ai_level!r}; choose from {', '.join(AI_LEVELS)}")
 
-        game_instance = Game()
-        initial_events = game_instance.start_battle(player_team_processed, opponent_team_processed)
+        player_team_processed, opponent_team_processed, timings = await hydrate_teams(player_team_raw, opponent_team_raw)
+
+        game_instance = Game(ai_level=ai_level)
+        async with timings.stage('battle_start'):
+            initial_events = await run_blocking(game_instance.start_battle, player_team_processed, opponent_team_processed)
+        game_instance.record_state()
+        session = battle_sessions.create(game_instance)
+        response.headers['Server-Timing'] = timings.server_timing()
         
         # Prepare response
         return {
             "success": True,
+            "battle_id": session.battle_id,
+            "state_version": game_instance.state_versions.version,
+            "ai_level": game_instance.ai_level,
             "weather": game_instance.weather,
             "player_pokemon": {
                 "name": game_instance.player_pokemon.name,
@@ -478,6 +348,10 @@ async def start_game(request: Request):
             "opponent_team": [p.to_dict() for p in game_instance.opponent_team],
             "start_events": initial_events
         }
+    except BattleLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -520,11 +394,20 @@ async def get_random_team():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def get_battle_session(battle_id: Optional[str]):
+    if not battle_id:
+        raise HTTPException(status_code=400, detail="battle_id is required")
+    try:
+        session = battle_sessions.get(battle_id)
+    except BattleLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    if session is None:
+        raise HTTPException(status_code=404, detail="Battle not found or expired")
+    return session
+
 @app.get("/api/team")
-async def get_team():
-    global game_instance
-    if not game_instance:
-        return {"player_team": []}
+async def get_team(battle_id: Optional[str] = None):
+    game_instance = get_battle_session(battle_id).game
     return {
         "player_team": [
             {
@@ -539,24 +422,56 @@ async def get_team():
         ]
     }
 
+@app.get("/api/battles/stats")
+async def get_battle_stats():
+    battle_sessions.evict_expired()
+    return battle_sessions.stats()
+
 @app.post("/api/move")
 async def move(request: Request):
-    global game_instance
-    if game_instance is None:
-        raise HTTPException(status_code=400, detail="Battle not initialized")
-
     data = await request.json()
+    session = get_battle_session(data.get('battle_id'))
     move_name = data.get('move')
     switch_index = data.get('switch_index')
     mega = data.get('mega', False)
+    # Delta clients send {"delta": true, "ack_version": <state_version they hold>}
+    delta = bool(data.get('delta', False))
     
-    turn_info = game_instance.process_turn(move_name=move_name, switch_index=switch_index, mega=mega)
+    async with session.lock:
+        return await run_blocking(play_turn, session, move_name, switch_index, mega, delta, data.get('ack_version'))
+
+def run_turn(session, move_name, switch_index, mega, on_event=None):
+    turn_info = session.game.process_turn(move_name=move_name, switch_index=switch_index, mega=mega, on_event=on_event)
+    session.game.record_state()
+    battle_sessions.checkpoint(session)
+    return turn_info
+
+def state_update(game_instance, ack_version) -> Dict[str, Any]:
+    """Changes since ``ack_version``, or the full view when the client's version can't be diffed against."""
+    delta = game_instance.state_versions.delta_since(ack_version)
+    if delta is None:
+        return {"state_version": game_instance.state_versions.version, "state": battle_view(game_instance)}
+    return {"state_version": game_instance.state_versions.version, "delta": delta}
+
+def play_turn(session, move_name, switch_index, mega, delta=False, ack_version=None):
+    game_instance = session.game
+    turn_info = run_turn(session, move_name, switch_index, mega)
     
     if 'action_order' in turn_info:
         del turn_info['action_order']
     
+    if delta:
+        return {
+            "success": True,
+            "battle_id": session.battle_id,
+            "turn_info": turn_info,
+            "battle_result": game_instance.get_battle_result() if game_instance.battle_over else None,
+            **state_update(game_instance, ack_version),
+        }
+    
     response_data = {
         "success": True,
+        "battle_id": session.battle_id,
         "player_pokemon": {
             "name": game_instance.player_pokemon.name,
             "current_hp": game_instance.player_pokemon.current_hp,
@@ -586,15 +501,106 @@ async def move(request: Request):
         "turn_info": turn_info,
         "pending_player_switch": game_instance.pending_player_self_switch,
         "is_game_over": game_instance.battle_over,
-        "battle_result": game_instance.get_battle_result() if game_instance.battle_over else None
+        "battle_result": game_instance.get_battle_result() if game_instance.battle_over else None,
+        "state_version": game_instance.state_versions.version
     }
     
     print(f"DEBUG: Move {move_name} result: {list(response_data.keys())}")
     if response_data["turn_info"]:
         print(f"DEBUG: Turn Info Events: {len(response_data['turn_info'].get('battle_events', []))}")
-        
+    
     return response_data
 
+_TURN_DONE = object()
+
+async def stream_turn(websocket: WebSocket, session, message: Dict[str, Any]):
+    """Play one turn, sending each battle event as it happens, then the state delta."""
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+
+    def on_event(event):
+        # Runs on the worker thread; copy now, the event dict may be reused afterwards
+        loop.call_soon_threadsafe(events.put_nowait, dict(event))
+
+    def turn():
+        try:
+            return run_turn(session, message.get('move'), message.get('switch_index'), message.get('mega', False), on_event)
+        finally:
+            loop.call_soon_threadsafe(events.put_nowait, _TURN_DONE)
+
+    async with session.lock:
+        before = session.game.state_versions.version
+        pending = asyncio.ensure_future(run_blocking(turn))
+        try:
+            while True:
+                event = await events.get()
+                if event is _TURN_DONE:
+                    break
+                await websocket.send_json({"type": "event", "event": jsonable_encoder(event)})
+        finally:
+            # The battle stays locked until the turn is fully played, even if the client went away
+            await asyncio.wait([pending])
+        turn_info = pending.result()
+
+    summary = {key: value for key, value in turn_info.items() if key not in ('battle_events', 'action_order')}
+    game_instance = session.game
+    await websocket.send_json(jsonable_encoder({
+        "type": "turn",
+        "turn_info": summary,
+        "battle_result": game_instance.get_battle_result() if game_instance.battle_over else None,
+        **state_update(game_instance, before),
+    }))
+
+async def socket_session(websocket: WebSocket, battle_id: str):
+    """The socket's battle, or None after sending the client an error and closing (like get_battle_session's 404/503)."""
+    try:
+        session = battle_sessions.get(battle_id)
+    except BattleLimitError as e:
+        # Restoring a parked battle found no room
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1013)
+        return None
+    if session is None:
+        await websocket.send_json({"type": "error", "detail": "Battle not found or expired"})
+        await websocket.close(code=4404)
+    return session
+
+@app.websocket("/ws/battle/{battle_id}")
+async def battle_socket(websocket: WebSocket, battle_id: str):
+    """Battle channel. Send {"move": name, "mega": bool} or {"switch_index": i}; {"type": "sync"} resends the full state.
+
+    The server answers with the full state on connect, then per turn one
+    {"type": "event"} message per battle event as it happens and a closing
+    {"type": "turn"} message with the turn summary and the state delta
+    (or the full state when there is no earlier version to diff against).
+    """
+    await websocket.accept()
+    session = await socket_session(websocket, battle_id)
+    if session is None:
+        return
+    await websocket.send_json(jsonable_encoder({"type": "state", "battle_id": battle_id, **state_update(session.game, None)}))
+    try:
+        while True:
+            message = await websocket.receive_json()
+            # Looked up per action: refreshes the idle timer and picks up copies advanced by other workers
+            session = await socket_session(websocket, battle_id)
+            if session is None:
+                return
+            if message.get('type') == 'sync':
+                await websocket.send_json(jsonable_encoder({"type": "state", "battle_id": battle_id, **state_update(session.game, None)}))
+            elif message.get('move') is None and message.get('switch_index') is None:
+                await websocket.send_json({"type": "error", "detail": "Send a move or a switch_index"})
+            else:
+                try:
+                    await stream_turn(websocket, session, message)
+                except WebSocketDisconnect:
+                    raise
+                except Exception as e:
+                    print(f"Error playing turn of battle {battle_id}: {e}")
+                    await websocket.send_json({"type": "error", "detail": str(e)})
+    except WebSocketDisconnect:
+        pass
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 7860))
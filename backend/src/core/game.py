@@ -2,9 +2,26 @@ from ..models.pokemon import Pokemon
 from ..systems.priority_system import PriorityResolver, create_battle_action
 from .builtin_hooks import register_builtin_hooks
 from .hooks import BattleContext, HookRegistry
-from .ai import BattleAI
+from .ai import bind_policy
+from .search_ai import create_ai
+from .battle_view import StateVersions, battle_view
+from ..utils.battle_rng import BattleRNG
 from typing import List, Dict, Any, Optional, Tuple
-import random
+import copy
+
+class BattleEventLog(list):
+    """turn_info['battle_events'] that also hands each event to ``listener`` as soon as it is added."""
+    def __init__(self, listener):
+        super().__init__()
+        self.listener = listener
+
+    def append(self, event):
+        super().append(event)
+        self.listener(event)
+
+    def extend(self, events):
+        for event in events:
+            self.append(event)
 
 class BattleSide:
     def __init__(self, owner_name):
@@ -20,6 +37,23 @@ class BattleSide:
         self.safeguard = 0
         self.wish = None # {amount: int, turns: int}
         self.future_move = None # {move: Move, attacker: Pokemon, turns: int}
+
+    def clone(self, clones: Dict[int, Pokemon]) -> 'BattleSide':
+        """Copy for Game.clone(); ``clones`` maps id(original Pokemon) to its clone."""
+        side = object.__new__(type(self))
+        side.__dict__ = self.__dict__.copy()
+        if self.wish:
+            side.wish = dict(self.wish)
+        if self.future_move:
+            future_move = side.future_move = dict(self.future_move)
+            attacker = self.future_move['attacker']
+            clone = clones.get(id(attacker))
+            if clone is not None:
+                future_move['attacker'] = clone
+                for name, move in attacker.moves.items():
+                    if move is future_move['move']:
+                        future_move['move'] = clone.moves[name]
+        return side
         
     def process_turn_end(self):
         if self.reflect > 0: self.reflect -= 1
@@ -34,9 +68,8 @@ class BattleSide:
         
         if self.stealth_rock:
             from ..utils.data_loader import data_loader
-            effectiveness = data_loader.get_type_effectiveness('rock', pokemon.types[0])
-            if len(pokemon.types) > 1:
-                effectiveness *= data_loader.get_type_effectiveness('rock', pokemon.types[1])
+            chart = data_loader.type_chart
+            effectiveness = chart.against(chart.type_id('rock'), pokemon.type_ids)
             
             damage = int(pokemon.max_hp * (0.125 * effectiveness))
             if damage > 0:
@@ -69,7 +102,7 @@ class BattleSide:
         return messages
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless: bool = False, seed: Optional[int] = None, ai_level: str = 'greedy'):
         self.player_team: List[Pokemon] = []
         self.opponent_team: List[Pokemon] = []
         self.player_side = BattleSide("Player")
@@ -85,8 +118,54 @@ class Game:
         self.hooks = HookRegistry()
         register_builtin_hooks(self.hooks)
         self.priority_resolver = PriorityResolver()
-        self.ai = BattleAI()
-        
+        # Headless games (simulation) print nothing; the resolver's turn-order debug lines are the only output
+        self.headless = headless
+        self.priority_resolver.set_debug_mode(not headless)
+        # Every random draw in the battle comes from here; the same seed replays the same battle
+        self.rng = BattleRNG(seed)
+        # Opponent AI: 'greedy' (BattleAI) or a search level from search_ai.SEARCH_LEVELS
+        self.ai_level = ai_level
+        # Interactive battles bound search by wall-clock time, headless ones deterministically
+        self.ai = create_ai(ai_level, self.rng, realtime=not headless)
+        self.state_versions = StateVersions()
+
+    def bind_rng(self, rng: Optional[BattleRNG] = None):
+        """Point the AI and every Pokemon in the battle at ``rng`` (default: this game's stream)."""
+        self.rng = rng or self.rng
+        bind_policy(self.ai, self)
+        for pokemon in self.player_team + self.opponent_team:
+            pokemon.rng = self.rng
+        
+    def clone(self, rng: Optional[BattleRNG] = None) -> 'Game':
+        """Independent copy of the battle, cheap enough for lookahead search.
+
+        Teams, sides, weather and flags are copied (see Pokemon.clone); hooks and the
+        priority resolver are shared, the AI is shallow-copied onto the clone's stream
+        and state versions start afresh. The clone continues this game's random stream
+        from the same position, so it rolls what this game would; pass ``rng`` (e.g.
+        ``game.rng.spawn()``) to roll differently.
+        """
+        game = object.__new__(type(self))
+        attrs = game.__dict__ = self.__dict__.copy()
+        clones = {id(p): p.clone() for p in self.player_team + self.opponent_team}
+        for active in (self.player_pokemon, self.opponent_pokemon):
+            if active is not None and id(active) not in clones:
+                clones[id(active)] = active.clone()
+        attrs['player_team'] = [clones[id(p)] for p in self.player_team]
+        attrs['opponent_team'] = [clones[id(p)] for p in self.opponent_team]
+        attrs['player_pokemon'] = clones.get(id(self.player_pokemon))
+        attrs['opponent_pokemon'] = clones.get(id(self.opponent_pokemon))
+        attrs['player_side'] = self.player_side.clone(clones)
+        attrs['opponent_side'] = self.opponent_side.clone(clones)
+        attrs['ai'] = copy.copy(self.ai)
+        attrs['state_versions'] = StateVersions()
+        game.bind_rng(rng or self.rng.copy())
+        return game
+
+    def record_state(self) -> int:
+        """Record the client-facing state; returns the state version, which bumps when anything changed."""
+        return self.state_versions.update(battle_view(self))
+
     def set_weather(self, new_weather: str, duration: int = 5):
         STRONG_WEATHERS = ['primordialsea', 'desolateland', 'deltastream']
         
@@ -144,7 +223,7 @@ class Game:
                     return True
         
         from ..utils.pokemon_utils import MEGA_STONES
-        item_id = pokemon.item.lower().replace(' ', '').replace('-', '')
+        item_id = (pokemon.item or '').lower().replace(' ', '').replace('-', '')
         
         # Try using data_loader first as it's more comprehensive
         from ..utils.data_loader import data_loader
@@ -173,7 +252,7 @@ class Game:
             return False
         
         from ..utils.pokemon_utils import PRIMAL_ORBS
-        item_id = pokemon.item.lower().replace(' ', '').replace('-', '')
+        item_id = (pokemon.item or '').lower().replace(' ', '').replace('-', '')
         
         if item_id in PRIMAL_ORBS:
             target_form = PRIMAL_ORBS[item_id]
@@ -196,7 +275,7 @@ class Game:
             target_form = "rayquaza-mega"
             mega_message = f"{self._get_pokemon_name(pokemon)}'s fervent wish has been granted!"
         else:
-            item_id = pokemon.item.lower().replace(' ', '').replace('-', '')
+            item_id = (pokemon.item or '').lower().replace(' ', '').replace('-', '')
             
             # Try data_loader for dynamic mapping
             from ..utils.data_loader import data_loader
@@ -262,7 +341,7 @@ class Game:
         from ..utils.pokemon_utils import PRIMAL_ORBS
         from ..utils.pokemon_api import get_forme_data
         
-        item_id = pokemon.item.lower().replace(' ', '').replace('-', '')
+        item_id = (pokemon.item or '').lower().replace(' ', '').replace('-', '')
         if item_id in PRIMAL_ORBS:
             target_form = PRIMAL_ORBS[item_id]
             side = 'back' if is_player else 'front'
@@ -300,6 +379,20 @@ class Game:
         if not pokemon: return "Unknown"
         return pokemon.get_display_name()
 
+    def _message(self, template: str, *pokemon, **values) -> Optional[str]:
+        """``template`` filled with the display names of ``pokemon`` and ``values``; None when headless, where nothing shows it."""
+        if self.headless:
+            return None
+        return template.format(*map(self._get_pokemon_name, pokemon), **values)
+
+    def _emit(self, events: List[Dict], event: Dict, display=None) -> Dict:
+        """Append ``event``. Interactive games first add the display-only fields returned by
+        ``display()`` (names, HP, timestamp); headless ones never compute them."""
+        if display is not None and not self.headless:
+            event.update(display())
+        events.append(event)
+        return event
+
     def _check_move_accuracy(self, context: BattleContext) -> bool:
         if context.accuracy is True: return True
         base_accuracy = context.accuracy
@@ -315,7 +408,7 @@ class Game:
         if hasattr(attacker, 'ability'):
             if attacker.ability.id == 'victorystar': effective_accuracy *= 1.1
             elif attacker.ability.id == 'compoundeyes': effective_accuracy *= 1.3
-        return random.randint(1, 100) <= effective_accuracy
+        return self.rng.randint(1, 100) <= effective_accuracy
 
     def execute_move(self, attacker, defender, move, move_name, is_player_attacking, turn_info, action=None):
         if not move: return False
@@ -335,7 +428,8 @@ class Game:
             attacker.consecutive_stalling_moves = 0
             is_ability_msg = 'ability:' in msg.lower() or 'loafing' in msg.lower() or (attacker.ability and attacker.ability.id == 'truant')
             event_type = 'ability' if is_ability_msg else 'status'
-            turn_info['battle_events'].append({'type': event_type, 'ability_name': attacker.ability.name if event_type == 'ability' else None, 'pokemon_name': self._get_pokemon_name(attacker), 'message': msg, 'target': 'player' if is_player_attacking else 'opponent', 'is_player': is_player_attacking, 'pokemon_hp': attacker.current_hp, 'player_hp': self.player_pokemon.current_hp, 'opponent_hp': self.opponent_pokemon.current_hp, 'player_max_hp': self.player_pokemon.max_hp, 'opponent_max_hp': self.opponent_pokemon.max_hp, 'status_effects': attacker.get_status_display(), 'substitute_hp': attacker.substitute_hp, 'timestamp': len(turn_info['battle_events'])})
+            events = turn_info['battle_events']
+            self._emit(events, {'type': event_type, 'message': msg, 'is_player': is_player_attacking}, lambda: {'ability_name': attacker.ability.name if event_type == 'ability' else None, 'pokemon_name': self._get_pokemon_name(attacker), 'target': 'player' if is_player_attacking else 'opponent', 'pokemon_hp': attacker.current_hp, 'player_hp': self.player_pokemon.current_hp, 'opponent_hp': self.opponent_pokemon.current_hp, 'player_max_hp': self.player_pokemon.max_hp, 'opponent_max_hp': self.opponent_pokemon.max_hp, 'status_effects': attacker.get_status_display(), 'substitute_hp': attacker.substitute_hp, 'timestamp': len(events)})
             return False
             
         self.hooks.run('modifyMove', context)
@@ -355,12 +449,13 @@ class Game:
             p_used = active_prot[0]
             if move.category in ['physical', 'special'] or PROT[p_used] == 'all': is_blocked = True
         if is_blocked:
-            turn_info['battle_events'].append({'type': 'move', 'attacker_name': self._get_pokemon_name(attacker), 'move': move_name, 'is_player': is_player_attacking, 'attacker_hp': attacker.current_hp, 'defender_hp': defender.current_hp, 'timestamp': len(turn_info['battle_events'])})
-            turn_info['battle_events'].append({'type': 'status', 'message': f"{self._get_pokemon_name(defender)} protected itself!", 'target': 'player' if not is_player_attacking else 'opponent', 'pokemon_hp': defender.current_hp, 'timestamp': len(turn_info['battle_events'])})
+            events = turn_info['battle_events']
+            self._emit(events, {'type': 'move', 'move': move_name, 'is_player': is_player_attacking}, lambda: {'attacker_name': self._get_pokemon_name(attacker), 'attacker_hp': attacker.current_hp, 'defender_hp': defender.current_hp, 'timestamp': len(events)})
+            turn_info['battle_events'].append({'type': 'status', 'message': self._message("{} protected itself!", defender), 'target': 'player' if not is_player_attacking else 'opponent', 'pokemon_hp': defender.current_hp, 'timestamp': len(turn_info['battle_events'])})
             if move.flags.get('contact'):
                 if active_prot[0] == 'spikyshield':
                     attacker.take_damage(defender.max_hp // 8)
-                    turn_info['battle_events'].append({'type': 'status', 'message': f"{self._get_pokemon_name(attacker)} was hurt by {self._get_pokemon_name(defender)}'s Spiky Shield!", 'target': 'player' if is_player_attacking else 'opponent', 'timestamp': len(turn_info['battle_events'])})
+                    turn_info['battle_events'].append({'type': 'status', 'message': self._message("{} was hurt by {}'s Spiky Shield!", attacker, defender), 'target': 'player' if is_player_attacking else 'opponent', 'timestamp': len(turn_info['battle_events'])})
                 elif active_prot[0] == 'kingsshield':
                     m = attacker.modify_stat_stage('attack', -1)
                     if m: turn_info['battle_events'].append({'type': 'status', 'message': m, 'target': 'player' if is_player_attacking else 'opponent', 'timestamp': len(turn_info['battle_events'])})
@@ -372,7 +467,7 @@ class Game:
         if not self._check_move_accuracy(context):
             # If we missed while charging, clear active move
             attacker.active_move = None
-            turn_info['battle_events'].append({'type': 'status', 'message': f"{self._get_pokemon_name(attacker)}'s {move.name} missed!", 'target': 'player' if is_player_attacking else 'opponent', 'timestamp': len(turn_info['battle_events'])})
+            turn_info['battle_events'].append({'type': 'status', 'message': self._message("{}'s {move} missed!", attacker, move=move.name), 'target': 'player' if is_player_attacking else 'opponent', 'timestamp': len(turn_info['battle_events'])})
             move.pp -= 1
             return False
             
@@ -383,12 +478,12 @@ class Game:
             
             if not is_instant:
                 attacker.active_move = {'move': move, 'turns': 1}
-                msg = f"{self._get_pokemon_name(attacker)} is charging!"
-                if move.id == 'solarbeam': msg = f"{self._get_pokemon_name(attacker)} absorbed light!"
-                elif move.id == 'fly': msg = f"{self._get_pokemon_name(attacker)} flew up high!"
-                elif move.id == 'dig': msg = f"{self._get_pokemon_name(attacker)} burrowed its way under the ground!"
+                template = "{} is charging!"
+                if move.id == 'solarbeam': template = "{} absorbed light!"
+                elif move.id == 'fly': template = "{} flew up high!"
+                elif move.id == 'dig': template = "{} burrowed its way under the ground!"
                 
-                turn_info['battle_events'].append({'type': 'status', 'message': msg, 'target': 'player' if is_player_attacking else 'opponent', 'timestamp': len(turn_info['battle_events'])})
+                turn_info['battle_events'].append({'type': 'status', 'message': self._message(template, attacker), 'target': 'player' if is_player_attacking else 'opponent', 'timestamp': len(turn_info['battle_events'])})
                 move.pp -= 1
                 return True
         
@@ -407,7 +502,7 @@ class Game:
                 turn_info['battle_events'].append({'type': 'status', 'message': f"But it failed!", 'timestamp': len(turn_info['battle_events'])})
                 return False
             defender_side.future_move = {'move': move, 'attacker': attacker, 'turns': 2}
-            turn_info['battle_events'].append({'type': 'status', 'message': f"{self._get_pokemon_name(attacker)} foresaw an attack!", 'timestamp': len(turn_info['battle_events'])})
+            turn_info['battle_events'].append({'type': 'status', 'message': self._message("{} foresaw an attack!", attacker), 'timestamp': len(turn_info['battle_events'])})
             move.pp -= 1
             return True
 
@@ -423,14 +518,15 @@ class Game:
             self.set_weather(weather_to_set)
             self.weather_duration = 5
             w_name = weather_to_set.replace('day', ' sunlight').replace('dance', '').replace('hail', 'snow')
-            turn_info['battle_events'].append({'type': 'status', 'message': f"The weather changed to {w_name}!", 'set_weather': weather_to_set, 'timestamp': len(turn_info['battle_events'])})
+            turn_info['battle_events'].append({'type': 'status', 'message': self._message("The weather changed to {weather}!", weather=w_name), 'set_weather': weather_to_set, 'timestamp': len(turn_info['battle_events'])})
             
         prev_hp = defender.current_hp
         defender.take_damage(dmg, from_move=True)
         actual_dmg = prev_hp - defender.current_hp
         context.actual_damage = actual_dmg
         
-        turn_info['battle_events'].append({'type': 'move', 'attacker_name': self._get_pokemon_name(attacker), 'defender_name': self._get_pokemon_name(defender), 'move': move_name, 'category': move.category, 'move_type': move.type, 'damage': actual_dmg, 'substitute_damage': sub_dmg, 'is_player': is_player_attacking, 'attacker_hp': attacker.current_hp, 'defender_hp': defender.current_hp, 'player_hp': self.player_pokemon.current_hp, 'opponent_hp': self.opponent_pokemon.current_hp, 'attacker_status': attacker.get_status_display(), 'defender_status': defender.get_status_display(), 'timestamp': len(turn_info['battle_events']), 'status_message': stat_msg})
+        events = turn_info['battle_events']
+        self._emit(events, {'type': 'move', 'move': move_name, 'damage': actual_dmg, 'is_player': is_player_attacking}, lambda: {'attacker_name': self._get_pokemon_name(attacker), 'defender_name': self._get_pokemon_name(defender), 'category': move.category, 'move_type': move.type, 'substitute_damage': sub_dmg, 'attacker_hp': attacker.current_hp, 'defender_hp': defender.current_hp, 'player_hp': self.player_pokemon.current_hp, 'opponent_hp': self.opponent_pokemon.current_hp, 'attacker_status': attacker.get_status_display(), 'defender_status': defender.get_status_display(), 'timestamp': len(events), 'status_message': stat_msg})
         
         for event in defender.on_damage(actual_dmg): turn_info['battle_events'].append({**event, 'target': 'opponent' if is_player_attacking else 'player', 'timestamp': len(turn_info['battle_events'])})
         if defender.item_obj:
@@ -469,6 +565,7 @@ class Game:
             self.opponent_team.append(pokemon)
         if self.player_team: self.player_pokemon = self.player_team[0]
         if self.opponent_team: self.opponent_pokemon = self.opponent_team[0]
+        self.bind_rng()
         messages = []
         if self.player_pokemon: messages.extend(self._on_pokemon_switch_in(self.player_pokemon, self.opponent_pokemon, self.player_side))
         if self.opponent_pokemon: messages.extend(self._on_pokemon_switch_in(self.opponent_pokemon, self.player_pokemon, self.opponent_side))
@@ -485,7 +582,7 @@ class Game:
         self.hooks.run('switchIn', context)
         events.extend(context.events)
         if pokemon.is_fainted():
-            events.append({'type': 'faint', 'pokemon_name': self._get_pokemon_name(pokemon), 'is_player': pokemon.is_player})
+            events.append({'type': 'faint', 'pokemon_name': self._faint_name(pokemon), 'is_player': pokemon.is_player})
         return events
 
     def check_battle_over(self) -> Tuple[bool, Optional[str]]:
@@ -525,35 +622,36 @@ class Game:
         if ended:
             events.append({'type': 'status', 'message': "The mysterious weather dissipated!", 'timestamp': 0})
             
-        old_display = self._get_pokemon_name(old_pokemon) if old_pokemon else "Pokemon"
-        new_display = self._get_pokemon_name(new_pokemon)
-        
         if old_pokemon and not old_pokemon.is_fainted():
-            events.append({'type': 'recall', 'message': f"Come back, {old_display}!", 'is_player_switch': is_player, 'is_opponent_switch': not is_player, 'recalled_pokemon_name': old_pokemon.name})
+            events.append({'type': 'recall', 'message': self._message("Come back, {}!", old_pokemon), 'is_player_switch': is_player, 'is_opponent_switch': not is_player, 'recalled_pokemon_name': old_pokemon.name})
         elif old_pokemon and old_pokemon.is_fainted():
             events.append({'type': 'recall', 'message': None, 'is_player_switch': is_player, 'is_opponent_switch': not is_player, 'recalled_pokemon_name': old_pokemon.name})
         
-        events.append({'type': 'status', 'message': f"Go! {new_display}!", 'is_player_switch': is_player, 'is_opponent_switch': not is_player, 'new_pokemon_name': new_pokemon.name, 'player_hp': self.player_pokemon.current_hp, 'opponent_hp': self.opponent_pokemon.current_hp})
+        events.append({'type': 'status', 'message': self._message("Go! {}!", new_pokemon), 'is_player_switch': is_player, 'is_opponent_switch': not is_player, 'new_pokemon_name': new_pokemon.name, 'player_hp': self.player_pokemon.current_hp, 'opponent_hp': self.opponent_pokemon.current_hp})
         
         # Trigger switch-in hooks (Entry Hazards, Intimidate, etc.)
         events.extend(self._on_pokemon_switch_in(new_pokemon, self.opponent_pokemon if is_player else self.player_pokemon, side))
         
         return events
 
+    def _faint_name(self, pokemon):
+        # Headless battles report species names; the side is in 'is_player'
+        return pokemon.name if self.headless else self._get_pokemon_name(pokemon)
+
     def handle_fainted(self, turn_info):
         """Check for fainted Pokemon and handle switches/victory."""
         faint_occurred = False
         
         # Check both pokemons
-        processed_faints = [e.get('pokemon_name') for e in turn_info['battle_events'] if e.get('type') == 'faint']
+        processed_faints = [(e.get('pokemon_name'), e.get('is_player')) for e in turn_info['battle_events'] if e.get('type') == 'faint']
         
         for pokemon in [self.opponent_pokemon, self.player_pokemon]:
             if pokemon and pokemon.current_hp <= 0:
-                display_name = self._get_pokemon_name(pokemon)
-                if display_name in processed_faints:
+                display_name = self._faint_name(pokemon)
+                is_player = pokemon == self.player_pokemon
+                if (display_name, is_player) in processed_faints:
                     continue
                     
-                is_player = pokemon == self.player_pokemon
                 is_over, winner = self.check_battle_over()
                 
                 # Run faint hooks
@@ -596,13 +694,17 @@ class Game:
         
         return faint_occurred
 
-    def process_turn(self, move_name=None, switch_index=None, mega=False):
+    def process_turn(self, move_name=None, switch_index=None, mega=False, on_event=None):
+        """Play one turn. ``on_event`` (optional) is called with each battle event as it happens."""
         if self.battle_over: return {}
+        events = BattleEventLog(on_event) if on_event else []
         if switch_index is not None:
-            turn_info = {'player_move': 'Switch', 'battle_events': []}
-            turn_info['battle_events'].extend(self.switch_pokemon(True, switch_index))
+            turn_info = {'player_move': 'Switch', 'battle_events': events}
+            switch_events = self.switch_pokemon(True, switch_index)
+            if switch_events: self.pending_player_self_switch = False
+            turn_info['battle_events'].extend(switch_events)
             return turn_info
-        turn_info = {'player_move': move_name, 'initial_player_hp': self.player_pokemon.current_hp, 'initial_opponent_hp': self.opponent_pokemon.current_hp, 'player_damage': 0, 'opponent_damage': 0, 'battle_events': []}
+        turn_info = {'player_move': move_name, 'initial_player_hp': self.player_pokemon.current_hp, 'initial_opponent_hp': self.opponent_pokemon.current_hp, 'player_damage': 0, 'opponent_damage': 0, 'battle_events': events}
         
         if mega and self.can_mega_evolve(True):
             self.perform_mega_evolution(True, turn_info)
@@ -649,7 +751,7 @@ class Game:
         turn_info['opponent_move'] = opponent_move_name
         player_action = create_battle_action(self.player_pokemon, player_move, self.opponent_pokemon, self.priority_resolver)
         opponent_action = create_battle_action(self.opponent_pokemon, opponent_move, self.player_pokemon, self.priority_resolver)
-        action_order = self.priority_resolver.resolve_turn_order(player_action, opponent_action)
+        action_order = self.priority_resolver.resolve_turn_order(player_action, opponent_action, self.rng)
         turn_info['player_first'] = action_order[0].pokemon == self.player_pokemon
         for action in action_order:
             attacker = action.pokemon
@@ -690,16 +792,18 @@ class Game:
                                 # Recalculate damage at hit time
                                 dmg, _, eff_msg, _, _ = fm['move'].use_move(fm['attacker'], target, self.weather)
                                 target.take_damage(dmg)
-                                turn_info['battle_events'].append({
+                                events = turn_info['battle_events']
+                                self._emit(events, {
                                     'type': 'move',
-                                    'attacker_name': self._get_pokemon_name(fm['attacker']),
-                                    'defender_name': self._get_pokemon_name(target),
                                     'move': fm['move'].name,
                                     'damage': dmg,
-                                    'message': f"{self._get_pokemon_name(target)} took the {fm['move'].name} attack!",
                                     'target': 'player' if target == self.player_pokemon else 'opponent',
+                                }, lambda: {
+                                    'attacker_name': self._get_pokemon_name(fm['attacker']),
+                                    'defender_name': self._get_pokemon_name(target),
+                                    'message': f"{self._get_pokemon_name(target)} took the {fm['move'].name} attack!",
                                     'pokemon_hp': target.current_hp,
-                                    'timestamp': len(turn_info['battle_events'])
+                                    'timestamp': len(events),
                                 })
                                 if eff_msg: turn_info['battle_events'].append({'type': 'effectiveness', 'message': eff_msg, 'timestamp': len(turn_info['battle_events'])})
                             side.future_move = None
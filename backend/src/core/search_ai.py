@@ -0,0 +1,261 @@
+"""Search-based opponent: depth-limited expectiminimax over cloned battles.
+
+Each decision plays candidate moves forward on Game.clone()s. A turn is a
+simultaneous choice, so a move is worth its worst case over the foe's
+likeliest replies (ranked by BattleAI.score_move), and each (move, reply)
+pair is a chance node: the turn is played ``samples`` times on clones with
+independent random streams, so damage rolls, accuracy, crits, secondary
+effects and speed ties are averaged over rather than guessed. Every pair
+sees the same set of streams, which keeps the comparison between moves
+fair. Deeper levels repeat this from each resulting position (one sample
+per node); leaves are scored by evaluate().
+
+Search deepens one level at a time until the level's depth or the per
+decision budget runs out. The budget is hard: it is checked before every
+simulated turn, and a decision that runs out keeps the last fully searched
+depth (or the moves it finished at depth 1, or BattleAI's pick).
+
+The budget is counted in simulated turns by default, so a decision only
+depends on the battle and its seed: simulate() and the battle farm replay
+exactly, on any machine and across resumes. With ``realtime`` the budget is
+wall-clock milliseconds instead, which bounds the latency an interactive
+player sees but makes decisions depend on machine speed and load, so a
+seed no longer reproduces the battle. Interactive Games (not headless) use
+realtime search; headless ones count turns.
+
+Battles choose a level with Game(ai_level=...); 'greedy' is BattleAI and
+does no search at all. Modelling limits: player switches are not
+considered as replies, and a decision taken mid-turn replays that turn's
+start-of-turn effects on the clones.
+"""
+
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from .ai import BattleAI
+from ..utils.battle_rng import global_rng
+
+# Score of a won battle; a position is otherwise worth between -1 and 1
+WIN = 10.0
+
+
+class SearchLevel(NamedTuple):
+    depth: int         # turns to look ahead
+    samples: int       # random streams per chance node at the root
+    replies: int       # foe replies considered per move
+    budget_ms: int     # realtime budget per decision
+    budget_turns: int  # deterministic budget per decision: simulated turns, about budget_ms of work
+
+
+SEARCH_LEVELS = {
+    'easy': SearchLevel(depth=1, samples=2, replies=1, budget_ms=50, budget_turns=80),
+    'normal': SearchLevel(depth=1, samples=4, replies=2, budget_ms=150, budget_turns=250),
+    'hard': SearchLevel(depth=2, samples=4, replies=3, budget_ms=400, budget_turns=650),
+}
+
+AI_LEVELS = ['greedy'] + list(SEARCH_LEVELS)
+
+
+def create_ai(level: str = 'greedy', rng=global_rng, realtime: bool = False) -> BattleAI:
+    if level == 'greedy':
+        return BattleAI(rng)
+    if level not in SEARCH_LEVELS:
+        raise ValueError(f"Unknown AI level {level!r}; choose from {', '.join(AI_LEVELS)}")
+    return SearchAI(level, rng, realtime=realtime)
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+class _ScriptedMove:
+    """The policy a clone's opponent side plays: one fixed move, BattleAI for everything else."""
+
+    def __init__(self, move_name: Optional[str], fallback: BattleAI):
+        self.move_name = move_name
+        self.fallback = fallback
+
+    def select_move(self, pokemon, foe, weather='none'):
+        move = pokemon.moves.get(self.move_name)
+        if move is not None and move.pp > 0:
+            return self.move_name, move
+        return self.fallback.select_move(pokemon, foe, weather)
+
+    def select_switch(self, team, foe):
+        return self.fallback.select_switch(team, foe)
+
+
+def _side_score(team) -> float:
+    score = 0.0
+    for pokemon in team:
+        if not pokemon.is_fainted():
+            score += 0.4 + 0.6 * pokemon.current_hp / max(1, pokemon.max_hp) - (0.1 if pokemon.major_status else 0.0)
+    return score / max(1, len(team))
+
+
+def evaluate(game, as_player: bool = False) -> float:
+    """Static value of ``game`` for the opponent side (the player side if ``as_player``)."""
+    over, winner = game.check_battle_over()
+    if over:
+        value = WIN if winner == 'Opponent' else -WIN
+    else:
+        value = _side_score(game.opponent_team) - _side_score(game.player_team)
+    return -value if as_player else value
+
+
+class SearchAI(BattleAI):
+    def __init__(self, level: str = 'normal', rng=global_rng, budget_ms: Optional[int] = None,
+                 budget_turns: Optional[int] = None, realtime: bool = False):
+        super().__init__(rng)
+        self.level = level
+        self.settings = SEARCH_LEVELS[level]
+        self.realtime = realtime
+        self.budget_ms = self.settings.budget_ms if budget_ms is None else budget_ms
+        self.budget_turns = self.settings.budget_turns if budget_turns is None else budget_turns
+        self.game = None
+        # Last decision, for benchmarks and debugging
+        self.last_search: Dict[str, float] = {}
+        self._samples = []
+        self._turns = 0
+
+    def bind(self, game):
+        self.rng = game.rng
+        self.game = game
+
+    def select_move(self, ai_pokemon, player_pokemon, weather='none'):
+        game = self.game
+        if game is None or (ai_pokemon is not game.player_pokemon and ai_pokemon is not game.opponent_pokemon):
+            return super().select_move(ai_pokemon, player_pokemon, weather)
+        as_player = ai_pokemon is game.player_pokemon
+        candidates = self._ranked_moves(ai_pokemon, player_pokemon, weather)
+        if len(candidates) <= 1:
+            return (candidates[0], ai_pokemon.moves[candidates[0]]) if candidates else (None, None)
+
+        values = self._search(lambda depth, deadline, values: self._evaluate_moves(
+            game, as_player, candidates, depth, deadline, values))
+        name = max(values, key=values.get) if values else candidates[0]
+        return name, ai_pokemon.moves[name]
+
+    def select_switch(self, team, foe):
+        game = self.game
+        if game is None or (team is not game.player_team and team is not game.opponent_team):
+            return super().select_switch(team, foe)
+        as_player = team is game.player_team
+        active = game.player_pokemon if as_player else game.opponent_pokemon
+        options = [i for i, pokemon in enumerate(team) if not pokemon.is_fainted() and pokemon is not active]
+        if len(options) <= 1:
+            return options[0] if options else super().select_switch(team, foe)
+        greedy = super().select_switch(team, foe)
+        if greedy in options:
+            options.remove(greedy)
+            options.insert(0, greedy)
+
+        values = self._search(lambda depth, deadline, values: self._evaluate_switches(
+            game, as_player, options, depth, deadline, values))
+        return max(values, key=values.get) if values else options[0]
+
+    def _search(self, evaluate_level) -> dict:
+        """Iterative deepening under the budget; returns {choice: value} from the deepest finished level."""
+        start = time.perf_counter()
+        # None: count simulated turns instead of watching the clock
+        deadline = start + self.budget_ms / 1000.0 if self.realtime else None
+        # Chance-node streams for this decision; spawning does not draw from the battle's stream
+        self._samples = [self.rng.spawn() for _ in range(self.settings.samples)]
+        self._turns = 0
+        values, depth_done, timed_out = {}, 0, False
+        for depth in range(1, self.settings.depth + 1):
+            current = {}
+            try:
+                evaluate_level(depth, deadline, current)
+            except _OutOfTime:
+                timed_out = True
+                if not values:
+                    values = current
+                break
+            values, depth_done = current, depth
+        self.last_search = {'depth': depth_done, 'turns': self._turns, 'timed_out': timed_out,
+                            'ms': (time.perf_counter() - start) * 1000.0}
+        return values
+
+    def _ranked_moves(self, pokemon, foe, weather) -> List[str]:
+        scored = [(self.score_move(move, pokemon, foe, weather), name)
+                  for name, move in pokemon.moves.items() if move.pp > 0]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [name for _, name in scored]
+
+    def _replies(self, game, as_player: bool) -> List[Optional[str]]:
+        foe = game.opponent_pokemon if as_player else game.player_pokemon
+        own = game.player_pokemon if as_player else game.opponent_pokemon
+        if foe.active_move or foe.must_recharge:
+            return [None]  # the engine picks the move
+        return self._ranked_moves(foe, own, game.weather)[:self.settings.replies] or [None]
+
+    def _evaluate_moves(self, game, as_player: bool, candidates: List[str], depth: int, deadline: Optional[float],
+                        values: dict, samples: Optional[List] = None) -> float:
+        """Value each candidate into ``values``; returns the best value."""
+        samples = self._samples if samples is None else samples
+        best = -float('inf')
+        replies = self._replies(game, as_player)
+        for name in candidates:
+            worst = float('inf')
+            for reply in replies:
+                total = 0.0
+                for rng in samples:
+                    child = self._play(game, as_player, name, reply, rng, deadline)
+                    total += self._value(child, as_player, depth - 1, deadline)
+                worst = min(worst, total / len(samples))
+                # Maximin cut: this move can no longer beat the best one
+                if worst <= best:
+                    break
+            values[name] = worst
+            best = max(best, worst)
+        return best
+
+    def _evaluate_switches(self, game, as_player: bool, options: List[int], depth: int, deadline: Optional[float],
+                           values: dict):
+        for index in options:
+            self._check_time(deadline)
+            child = game.clone(self._samples[0].copy())
+            child.ai = _ScriptedMove(None, BattleAI(child.rng))
+            child.switch_pokemon(as_player, index)
+            if as_player:
+                child.pending_player_self_switch = False
+            values[index] = self._value(child, as_player, depth, deadline)
+
+    def _value(self, game, as_player: bool, depth: int, deadline: Optional[float]) -> float:
+        if depth <= 0 or game.battle_over:
+            return evaluate(game, as_player)
+        own = game.player_pokemon if as_player else game.opponent_pokemon
+        foe = game.opponent_pokemon if as_player else game.player_pokemon
+        candidates = self._ranked_moves(own, foe, game.weather)
+        if not candidates:
+            return evaluate(game, as_player)
+        # One sample per deeper node: the clone continues this position's stream
+        return self._evaluate_moves(game, as_player, candidates, depth, deadline, {}, [game.rng])
+
+    def _play(self, game, as_player: bool, move_name: str, reply: Optional[str], rng, deadline: Optional[float]):
+        """One turn on a clone of ``game``: our ``move_name`` against the foe's ``reply``."""
+        self._check_time(deadline)
+        self._turns += 1
+        child = game.clone(rng.copy())
+        greedy = BattleAI(child.rng)
+        opponent_move, player_move = (reply, move_name) if as_player else (move_name, reply)
+        child.ai = _ScriptedMove(opponent_move, greedy)
+        if player_move is None:
+            player_move, _ = greedy.select_move(child.player_pokemon, child.opponent_pokemon, child.weather)
+        child.process_turn(move_name=player_move)
+        # The player side's replacements are free actions; take them before scoring the position
+        if not child.battle_over and (child.pending_player_self_switch or child.player_pokemon.is_fainted()):
+            index = greedy.select_switch(child.player_team, child.opponent_pokemon)
+            if index is None or child.player_team[index] is child.player_pokemon:
+                index = child._first_available_switch_index(True)
+            if index is not None:
+                child.process_turn(switch_index=index)
+        return child
+
+    def _check_time(self, deadline: Optional[float]):
+        if deadline is None:
+            if self._turns >= self.budget_turns:
+                raise _OutOfTime()
+        elif time.perf_counter() > deadline:
+            raise _OutOfTime()
@@ -0,0 +1,143 @@
+"""Headless battles: whole battles run in-process for bulk simulation and benchmarks.
+
+simulate() plays team A (the player side) against team B (the opponent
+side) on a headless Game, asking a policy for every decision, and returns
+the winner plus a compact event stream. Nothing is printed, and the display
+dicts the engine builds for each event only live for the turn; what is kept
+is one BattleEvent tuple per event.
+
+A policy has BattleAI's interface: ``select_move(pokemon, foe, weather)``
+returns ``(move_name, move)`` and ``select_switch(team, foe)`` returns the
+index of a replacement. BattleAI itself is the default policy. Policies draw
+from their ``rng`` attribute, which simulate() points at the battle's stream
+(see ai.bind_policy), so a seed covers their choices too.
+"""
+
+import asyncio
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .ai import BattleAI, bind_policy
+from .game import Game
+from .team_builder import hydrate_teams
+from ..models.moveset import get_random_battle_ready_pokemon
+from ..utils.battle_rng import global_rng
+
+# A safety net: battles normally end well before this, but a side can run out of usable moves
+MAX_TURNS = 1000
+
+PLAYER, OPPONENT = 0, 1
+
+
+class BattleEvent(NamedTuple):
+    turn: int
+    type: str            # engine event type; switch-ins are reported as 'switch'
+    side: Optional[int]  # PLAYER, OPPONENT or None for field events
+    name: Optional[str]  # move used, Pokemon switched in or fainted
+    amount: int          # damage dealt, for move events
+
+
+class SimulationResult(NamedTuple):
+    winner: Optional[str]  # 'a', 'b' or None when MAX_TURNS ran out or nobody could move
+    turns: int
+    remaining: tuple       # unfainted Pokemon left on (team A, team B)
+    events: List[BattleEvent]
+    seed: int              # root seed of the battle's random stream; simulate(seed=...) replays it
+
+
+def event_side(event: Dict[str, Any]) -> Optional[int]:
+    for key in ('is_player_switch', 'is_player'):
+        if event.get(key) is not None:
+            return PLAYER if event[key] else OPPONENT
+    target = event.get('target')
+    if target == 'player':
+        return PLAYER
+    if target == 'opponent':
+        return OPPONENT
+    return None
+
+
+def compact_event(turn: int, event: Dict[str, Any]) -> BattleEvent:
+    if event.get('new_pokemon_name'):
+        return BattleEvent(turn, 'switch', event_side(event), event['new_pokemon_name'], 0)
+    name = event.get('move') or event.get('pokemon_name')
+    return BattleEvent(turn, event.get('type'), event_side(event), name, event.get('damage') or 0)
+
+
+class RandomPolicy:
+    """Uniformly random usable move; first healthy Pokemon as a replacement."""
+
+    rng = global_rng
+
+    def select_move(self, pokemon, foe, weather='none'):
+        usable = [(name, move) for name, move in pokemon.moves.items() if move.pp > 0]
+        return self.rng.choice(usable) if usable else (None, None)
+
+    def select_switch(self, team, foe):
+        for i, pokemon in enumerate(team):
+            if not pokemon.is_fainted():
+                return i
+        return None
+
+
+def random_team(size: int = 6) -> List[Dict[str, Any]]:
+    """Random battle-ready Pokemon on their most common sets, hydrated like the /api/start opponent.
+
+    Runs its own event loop, so call it from synchronous code. Teams are
+    drawn from the ``random`` module, outside any battle's stream.
+    """
+    names = [get_random_battle_ready_pokemon() for _ in range(size)]
+
+    async def build():
+        team = []
+        # One at a time, so set picks draw from the random module in a fixed order
+        for name in names:
+            _, built, _ = await hydrate_teams([], [{'name': name}])
+            team.extend(built)
+        return team
+
+    return asyncio.run(build())
+
+
+def _player_switch(game: Game, policy) -> Optional[int]:
+    index = policy.select_switch(game.player_team, game.opponent_pokemon)
+    if index is None or game.player_team[index] is game.player_pokemon or game.player_team[index].is_fainted():
+        index = game._first_available_switch_index(True)
+    return index
+
+
+def simulate(team_a: List[Dict[str, Any]], team_b: List[Dict[str, Any]], policy_a=None, policy_b=None,
+             seed: Optional[int] = None, max_turns: int = MAX_TURNS) -> SimulationResult:
+    """Play ``team_a`` against ``team_b`` (hydrated team data, as Game.start_battle takes) to the end.
+
+    The same ``seed`` replays the same battle, as long as the policies are deterministic given
+    their ``rng`` (for SearchAI: not ``realtime``, the default); without one the battle gets a
+    fresh seed, reported in the result.
+    """
+    policy_a = policy_a or BattleAI()
+    game = Game(headless=True, seed=seed)
+    game.ai = policy_b or BattleAI()
+    bind_policy(policy_a, game)
+    events: List[BattleEvent] = []
+    turn = 0
+
+    def record(event):
+        events.append(compact_event(turn, event))
+
+    for event in game.start_battle(team_a, team_b):
+        record(event)
+    while not game.battle_over and turn < max_turns:
+        turn += 1
+        if game.pending_player_self_switch or game.player_pokemon.is_fainted():
+            index = _player_switch(game, policy_a)
+            if index is None:
+                break
+            game.process_turn(switch_index=index, on_event=record)
+            continue
+        move_name, _ = policy_a.select_move(game.player_pokemon, game.opponent_pokemon, game.weather)
+        if move_name is None:
+            break
+        game.process_turn(move_name=move_name, on_event=record)
+
+    _, winner = game.check_battle_over()
+    remaining = tuple(sum(not p.is_fainted() for p in team) for team in (game.player_team, game.opponent_team))
+    return SimulationResult({'Player': 'a', 'Opponent': 'b'}.get(winner), turn, remaining, events, game.rng.seed)
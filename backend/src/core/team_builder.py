@@ -0,0 +1,184 @@
+"""Concurrent team hydration for /api/start.
+
+Species lookups run on the event loop (bundled data, or PokeAPI through a
+pooled httpx client); set and moveset lookups, which touch files and do
+the heavier Python work, go to a bounded thread pool. Every Pokemon of
+both teams is hydrated at once, and the time spent in each stage is
+recorded in a StageTimings that the endpoint reports as Server-Timing.
+"""
+
+import asyncio
+import functools
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..models.moveset import get_all_pokemon_sets, get_strategic_moveset
+from ..utils.pokemon_api import get_best_sprite, get_pokemon_data_async
+from ..utils.pokemon_utils import get_mandatory_item
+from ..utils.species_store import species_store
+
+MAX_WORKERS = int(os.getenv('TEAM_BUILDER_WORKERS', '8'))
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='team-builder')
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Process-wide pooled client, created on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=5,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def run_blocking(func: Callable, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+class StageTimings:
+    """Wall-clock span of each stage, from its first start to its last end.
+
+    Stages run for many Pokemon at once, so a span is the latency the request
+    actually paid for that stage, not the sum over Pokemon.
+    """
+
+    def __init__(self):
+        self.spans: Dict[str, List[float]] = {}
+
+    @asynccontextmanager
+    async def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            span = self.spans.get(name)
+            if span is None:
+                self.spans[name] = [started, ended]
+            else:
+                span[0], span[1] = min(span[0], started), max(span[1], ended)
+
+    def as_ms(self) -> Dict[str, float]:
+        return {name: round((end - start) * 1000, 2) for name, (start, end) in self.spans.items()}
+
+    def server_timing(self) -> str:
+        return ', '.join(f'{name};dur={ms}' for name, ms in self.as_ms().items())
+
+
+def default_moves(pokemon_name: str) -> List[Dict[str, str]]:
+    strategic_moves = get_strategic_moveset(pokemon_name.lower(), debug=False)
+    if strategic_moves:
+        return [{'name': move_name} for move_name in strategic_moves[:4]]
+    return [{'name': 'tackle'}, {'name': 'growl'}]
+
+
+def pick_set(all_sets: Optional[dict]) -> Optional[dict]:
+    candidates = [s for sets in (all_sets or {}).values() for s in sets.values()]
+    return random.choice(candidates) if candidates else None
+
+
+async def _species(name: str, timings: StageTimings) -> Optional[Dict[str, Any]]:
+    async with timings.stage('species'):
+        if not species_store.is_loaded():
+            # First request of the process: build the species index off the event loop
+            await run_blocking(lambda: species_store.records)
+        return await get_pokemon_data_async(name, get_http_client())
+
+
+async def build_player_pokemon(p: Dict[str, Any], timings: StageTimings) -> Optional[Dict[str, Any]]:
+    p_data = await _species(p['name'], timings)
+    if not p_data:
+        return None
+    moves = [{'name': m} for m in p.get('moves', [])]
+    if not moves:
+        async with timings.stage('moves'):
+            moves = await run_blocking(default_moves, p_data['name'])
+
+    mandatory = get_mandatory_item(p['name'])
+    return {
+        'name': p_data['name'],
+        'types': [t['type']['name'] for t in p_data['types']],
+        'sprite_url': get_best_sprite(p_data, side='back', shiny=p.get('shiny', False)),
+        'stats': p_data['stats'],
+        'moves': moves,
+        'cry_url': p_data.get('cries', {}).get('latest', ''),
+        'ability': p.get('ability') or p_data.get('abilities', [{}])[0].get('ability', {}).get('name', 'noability'),
+        'item': p.get('item') or mandatory or ''
+    }
+
+
+async def build_opponent_pokemon(o: Dict[str, Any], timings: StageTimings) -> Optional[Dict[str, Any]]:
+    o_name = o['name'].lower()
+
+    async def sets():
+        async with timings.stage('sets'):
+            return await run_blocking(get_all_pokemon_sets, o_name)
+
+    o_data, o_sets = await asyncio.gather(_species(o['name'], timings), sets())
+    if not o_data:
+        return None
+
+    o_moves = []
+    o_config = {}
+    best_set = pick_set(o_sets)
+    if best_set:
+        mandatory = get_mandatory_item(o_name)
+        o_config = {
+            'evs': best_set.get('evs', {}),
+            'ivs': best_set.get('ivs', {}),
+            'nature': best_set.get('nature', 'Hardy'),
+            'ability': best_set.get('ability', 'noability'),
+            'item': best_set.get('item', mandatory or '')
+        }
+        if best_set.get('moves'):
+            o_moves = [{'name': m} for m in best_set['moves']]
+
+    if not o_moves:
+        async with timings.stage('moves'):
+            o_moves = await run_blocking(default_moves, o_data['name'])
+
+    return {
+        'name': o_data['name'],
+        'types': [t['type']['name'] for t in o_data['types']],
+        'sprite_url': get_best_sprite(o_data, side='front', shiny=False),
+        'stats': o_data['stats'],
+        'moves': o_moves,
+        'cry_url': o_data.get('cries', {}).get('latest', ''),
+        **o_config
+    }
+
+
+async def _build_team(raw_team: List[Dict[str, Any]], build, stage: str, timings: StageTimings) -> List[Dict[str, Any]]:
+    async with timings.stage(stage):
+        configs = await asyncio.gather(*(build(p, timings) for p in raw_team))
+    # Pokemon without data are skipped, the rest keep their order
+    return [config for config in configs if config]
+
+
+async def hydrate_teams(player_raw: List[Dict[str, Any]], opponent_raw: List[Dict[str, Any]],
+                        timings: Optional[StageTimings] = None) -> Tuple[List[Dict], List[Dict], StageTimings]:
+    """Battle configs for both teams, built concurrently."""
+    timings = timings or StageTimings()
+    async with timings.stage('hydrate'):
+        player, opponent = await asyncio.gather(
+            _build_team(player_raw, build_player_pokemon, 'player_team', timings),
+            _build_team(opponent_raw, build_opponent_pokemon, 'opponent_team', timings),
+        )
+    return player, opponent, timings
@@ -1,7 +1,7 @@
 from ..utils.data_loader import data_loader
 from ..systems.damage_engine import smogon_damage_for_move
+from ..utils.battle_rng import global_rng
 from typing import Optional, Tuple, Dict, Any, Union, List
-import random
 import re
 
 class Move:
@@ -50,6 +50,7 @@ class Move:
         self.use_target_offensive = data_dict.get('useTargetOffensive', False)
         self.effectiveness = 1.0
         self.damage_source = 'python'
+        self.damage_engine = None
         self.last_damage_range = None
         self.last_damage_description = None
 
@@ -138,14 +139,14 @@ class Move:
             stat = pokemon.item_obj.modify_stat(pokemon, stat_name, stat)
         return max(1, stat)
 
-    def _get_critical_hit(self, defending_pokemon=None) -> bool:
+    def _get_critical_hit(self, defending_pokemon=None, rng=global_rng) -> bool:
         if defending_pokemon and hasattr(defending_pokemon, 'ability') and defending_pokemon.ability.id in ['battlearmor', 'shellarmor']:
             return False
         crit_ratio = self.data.get('critRatio', 1)
         will_crit = self.data.get('willCrit', False)
         crit_chances = {1: 1/16, 2: 1/8, 3: 1/2, 4: 1.0}
         crit_chance = crit_chances.get(crit_ratio, 1.0) if crit_ratio in crit_chances else (1.0 if crit_ratio > 4 else 1/16)
-        return will_crit or random.random() < crit_chance
+        return will_crit or rng.random() < crit_chance
 
     def _get_burn_multiplier(self, attacking_pokemon) -> float:
         if self.category != 'physical':
@@ -246,7 +247,7 @@ class Move:
         
         return False, None
     
-    def _determine_hit_count(self) -> int:
+    def _determine_hit_count(self, rng=global_rng) -> int:
         if not self.is_multihit_move or not self.multihit_data:
             return 1
         
@@ -256,7 +257,7 @@ class Move:
             min_hits, max_hits = self.multihit_data
             
             if max_hits == 5:
-                rand = random.randint(1, 100)
+                rand = rng.randint(1, 100)
                 if rand <= 35:
                     return 2
                 elif rand <= 70:
@@ -266,7 +267,7 @@ class Move:
                 else:
                     return 5
             else:
-                return random.randint(min_hits, max_hits)
+                return rng.randint(min_hits, max_hits)
         
         return 1
     
@@ -399,7 +400,7 @@ class Move:
             # Sand Veil / Snow Cloak in weather
             # (Need weather access here, but for now we'll skip or use a simple check)
             
-        return random.randint(1, 100) <= effective_accuracy
+        return attacker.rng.randint(1, 100) <= effective_accuracy
 
     def _apply_effect_block(self, target, effect_block: Dict[str, Any], chance_override: Optional[int] = None, user=None) -> List[str]:
         if not effect_block or not target:
@@ -409,7 +410,7 @@ class Move:
             return []
             
         chance = chance_override if chance_override is not None else effect_block.get('chance', 100)
-        if random.randint(1, 100) > chance:
+        if (user or target).rng.randint(1, 100) > chance:
             return []
             
         messages = []
@@ -668,12 +669,13 @@ class Move:
 
     def use_move(self, attacking_pokemon=None, defending_pokemon=None, weather='none', field=None) -> Tuple[int, int, str, Optional[str], Optional[str]]:
         self.damage_source = 'python'
+        self.damage_engine = None
         self.last_damage_range = None
         self.last_damage_description = None
             
         if self.stalling_move:
             success_rate = 1.0 / (3.0 ** attacking_pokemon.consecutive_stalling_moves)
-            if random.random() >= success_rate:
+            if attacking_pokemon.rng.random() >= success_rate:
                 attacking_pokemon.consecutive_stalling_moves = 0
                 return 0, 0, "", f"But it failed!", None
             attacking_pokemon.consecutive_stalling_moves += 1
@@ -750,28 +752,9 @@ class Move:
             # Get the move type in lowercase for comparison
             move_type = self.type.lower()
             
-            # Get defending Pokémon's types, handling both single and dual types
-            if hasattr(defending_pokemon, 'types') and isinstance(defending_pokemon.types, list) and defending_pokemon.types:
-                defending_types = [t.lower() if isinstance(t, str) else str(t).lower() for t in defending_pokemon.types]
-            else:
-                # Fallback for backward compatibility
-                defending_types = [getattr(defending_pokemon, 'type', 'normal').lower()]
-                
-            # Calculate effectiveness against each of the target's types
-            effectiveness = 1.0
-            # Calculate effectiveness against each of the target's types
-            effectiveness = 1.0
-            
-            for target_type in defending_types:
-                eff = data_loader.get_type_effectiveness(move_type, target_type)
-                # Delta Stream: Super-effective moves against Flying become neutral (1x)
-                if weather == 'deltastream' and target_type == 'flying' and eff > 1:
-                    eff = 1.0
-                effectiveness *= eff
-                
-            effectiveness = round(effectiveness, 2)
+            effectiveness = round(self._type_effectiveness(defending_pokemon, weather), 2)
             self.effectiveness = effectiveness
-            is_critical = self._get_critical_hit(defending_pokemon)
+            is_critical = self._get_critical_hit(defending_pokemon, attacking_pokemon.rng)
             
             # Primal Weather Suppression
             if weather == 'primordialsea' and move_type == 'fire':
@@ -815,7 +798,8 @@ class Move:
                 attacking_pokemon,
                 defending_pokemon,
                 self,
-                field or {'weather': weather}
+                field or {'weather': weather},
+                is_critical,
             )
             
             if self.fixed_damage:
@@ -831,7 +815,8 @@ class Move:
                 base_damage = damage
             elif smogon_result:
                 base_damage = int(smogon_result["selected_damage"])
-                self.damage_source = 'smogon'
+                self.damage_engine = smogon_result.get("engine", "smogon")
+                self.damage_source = self.damage_engine
                 self.last_damage_range = [int(smogon_result["min"]), int(smogon_result["max"])]
                 self.last_damage_description = smogon_result.get("description")
 
@@ -842,6 +827,9 @@ class Move:
                     effectiveness_message = "It's not very effective..."
                 elif effectiveness > 1:
                     effectiveness_message = "It's super effective!"
+                # The crit rolled above went into the payload; the calculator applied it
+                if is_critical:
+                    effectiveness_message = ("A critical hit! " + effectiveness_message).strip()
             else:
                 # Check for special move logic in JSON generically
                 actual_base_power = base_damage
@@ -897,7 +885,7 @@ class Move:
                     else:
                         effectiveness_message = "A critical hit!"
                 
-                damage = int(damage * random.randint(85, 100) / 100)
+                damage = int(damage * attacking_pokemon.rng.randint(85, 100) / 100)
                 damage = max(1, int(damage * self._get_burn_multiplier(attacking_pokemon)))
                 
                 # Apply ability damage modifiers (e.g. Blaze, Technician)
@@ -932,40 +920,36 @@ class Move:
         
         return base_damage, 0, effectiveness_message, combined_message, weather_to_set
     
+    def _type_effectiveness(self, defending_pokemon, weather=None) -> float:
+        """Multiplier of this move's type against the defender's typing."""
+        chart = data_loader.type_chart
+        type_ids = getattr(defending_pokemon, 'type_ids', None)
+        if type_ids is None:
+            type_ids = chart.type_ids(getattr(defending_pokemon, 'types', None) or [getattr(defending_pokemon, 'type', 'normal')])
+        move_id = chart.type_id(self.type)
+
+        # Delta Stream: Super-effective moves against Flying become neutral (1x)
+        flying = chart.type_id('flying')
+        if weather == 'deltastream' and flying in type_ids:
+            row = chart.matrix[move_id]
+            effectiveness = 1.0
+            for type_id in type_ids:
+                effectiveness *= 1.0 if type_id == flying and row[type_id] > 1 else row[type_id]
+            return effectiveness
+        return chart.against(move_id, type_ids)
+
     def _use_multihit_move(self, attacking_pokemon, defending_pokemon) -> Tuple[int, int, str, Optional[str]]:
         """Handle multi-hit moves like Pin Missile, Rock Blast, etc."""
         if not attacking_pokemon or not defending_pokemon:
             return 0, 0, f"{attacking_pokemon.name} used {self.name}!", None, None
         
         # Determine number of hits
-        hit_count = self._determine_hit_count()
+        hit_count = self._determine_hit_count(attacking_pokemon.rng)
         
         # Get the move type in lowercase for comparison
         move_type = self.type.lower()
         
-        # Get defending Pokémon's types, handling both single and dual types
-        if hasattr(defending_pokemon, 'types') and isinstance(defending_pokemon.types, list) and defending_pokemon.types:
-            defending_types = [t.lower() if isinstance(t, str) else str(t).lower() for t in defending_pokemon.types]
-        else:
-            # Fallback for backward compatibility
-            defending_types = [getattr(defending_pokemon, 'type', 'normal').lower()]
-        
-        # Calculate effectiveness against each of the target's types
-        effectiveness = 1.0
-        effectiveness_breakdown = {}
-        
-        for target_type in defending_types:
-            type_effectiveness = data_loader.get_type_effectiveness(move_type, target_type)
-            effectiveness_breakdown[target_type] = type_effectiveness
-        
-        for t in defending_types:
-            eff = data_loader.get_type_effectiveness(move_type, t)
-            # Delta Stream: Super-effective moves against Flying become neutral (1x)
-            if weather == 'deltastream' and t == 'flying' and eff > 1:
-                eff = 1.0
-            effectiveness *= eff
-        
-        effectiveness = round(effectiveness, 2)
+        effectiveness = round(self._type_effectiveness(defending_pokemon), 2)
         self.effectiveness = effectiveness
         
         if effectiveness == 0:
@@ -993,7 +977,7 @@ class Move:
                 accuracy = self.accuracy
                 continue
 
-            is_critical = self._get_critical_hit(defending_pokemon)
+            is_critical = self._get_critical_hit(defending_pokemon, attacking_pokemon.rng)
             attack_stat = self._get_damage_stat(attacking_pokemon, attack_stat_name, is_critical, 'attacker')
             defense_stat = self._get_damage_stat(defending_pokemon, defense_stat_name, is_critical, 'defender')
             
@@ -1014,7 +998,7 @@ class Move:
                 hit_damage = int(hit_damage * 1.5)
             
             # Variation
-            hit_damage = int(hit_damage * random.randint(85, 100) / 100)
+            hit_damage = int(hit_damage * attacking_pokemon.rng.randint(85, 100) / 100)
             hit_damage = max(1, int(hit_damage * self._get_burn_multiplier(attacking_pokemon)))
 
             if hasattr(attacking_pokemon, 'ability'):
@@ -1077,23 +1061,13 @@ class Move:
             return []
         
         # Determine number of hits
-        hit_count = self._determine_hit_count()
+        hit_count = self._determine_hit_count(attacking_pokemon.rng)
         
         # Get the move type in lowercase for comparison
         move_type = self.type.lower()
         
-        # Get defending Pokémon's types
-        if hasattr(defending_pokemon, 'types') and isinstance(defending_pokemon.types, list) and defending_pokemon.types:
-            defending_types = [t.lower() if isinstance(t, str) else str(t).lower() for t in defending_pokemon.types]
-        else:
-            defending_types = [getattr(defending_pokemon, 'type', 'normal').lower()]
-        
         # Calculate effectiveness
-        effectiveness = 1.0
-        for target_type in defending_types:
-            type_effectiveness = data_loader.get_type_effectiveness(move_type, target_type)
-            effectiveness *= type_effectiveness
-        effectiveness = round(effectiveness, 2)
+        effectiveness = round(self._type_effectiveness(defending_pokemon), 2)
         self.effectiveness = effectiveness
         
         if effectiveness == 0:
@@ -1122,7 +1096,7 @@ class Move:
                 })
                 continue
 
-            is_critical = self._get_critical_hit(defending_pokemon)
+            is_critical = self._get_critical_hit(defending_pokemon, attacking_pokemon.rng)
             attack_stat = self._get_damage_stat(attacking_pokemon, attack_stat_name, is_critical, 'attacker')
             defense_stat = self._get_damage_stat(defending_pokemon, defense_stat_name, is_critical, 'defender')
             
@@ -1144,7 +1118,7 @@ class Move:
                 damage = int(damage * 1.5)
             
             # Apply random damage variation
-            damage = int(damage * random.randint(85, 100) / 100)
+            damage = int(damage * attacking_pokemon.rng.randint(85, 100) / 100)
             damage = max(1, int(damage * self._get_burn_multiplier(attacking_pokemon)))
             
             hits.append({
@@ -1155,6 +1129,12 @@ class Move:
             })
         
         return hits
+
+    def clone(self) -> 'Move':
+        """Copy for Game.clone(): PP and per-use results are its own, ``data`` and ``flags`` are shared."""
+        move = object.__new__(type(self))
+        move.__dict__ = self.__dict__.copy()
+        return move
             
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -1,79 +1,25 @@
-import json
-import os
+import random
 import re
 from typing import List, Optional
 
+from ..utils.sets_database import BATTLE_ONLY_FORM_SUFFIXES, BATTLE_READY_FORMATS, sets_database
+
 # Cache to avoid repeated lookups
 moveset_cache = {}
-sets_data = None
-
-# Formats that typically only contain fully evolved/battle-ready Pokémon
-BATTLE_READY_FORMATS = [
-    'gen8ou',
-    'gen8ubers',
-    'gen8uu',
-    'gen8ru',
-    'gen8nu',
-    'gen8pu',
-    'gen8monotype'
-]
- 
-# Forms that cannot be obtained/selected normally in a teambuilder (battle-only)
-BATTLE_ONLY_FORM_SUFFIXES = [
-    '-Mega', '-Mega-X', '-Mega-Y', '-Mega-Z',
-    '-Primal', 
-    '-Complete', # Zygarde-Complete
-    '-Power-Construct', # Zygarde-Power-Construct
-    '-Eternamax', 
-    '-Ultra', # Necrozma-Ultra
-    '-Zen', # Darmanitan-Zen
-    '-Pirouette', # Meloetta-Pirouette
-    '-Blade', # Aegislash-Blade
-    '-School', # Wishiwashi-School
-    '-Gulping', '-Gorging', # Cramorant
-    '-Noice', # Eiscue
-    '-Hangry', # Morpeko
-    '-Busted', # Mimikyu-Busted
-    '-Gmax', # Gigantamax
-    '-Totem', # Totem Pokemon
-    '-Gliding-Build', '-Sprinting-Build', '-Swimming-Build', '-Limited-Build', # Koraidon/Miraidon
-    '-Drive-Mode', '-Aquatic-Mode', '-Glide-Mode', '-Low-Power-Mode' # Miraidon
-]
+moveset_cache_version = None
 
 def get_battle_ready_pokemon_list() -> List[str]:
     """
     Returns a list of unique Pokémon names that have competitive sets
     in the battle-ready formats (excluding Little Cup).
     """
-    try:
-        # Get the backend root directory (3 levels up from this file)
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        file_path = os.path.join(base_dir, 'data', 'gen8_stats_sets.json')
-        
-        if not os.path.exists(file_path):
-            return ["Charizard", "Garchomp", "Dragonite", "Mewtwo", "Zapdos", "Pikachu", "Snorlax", "Lucario"]
-            
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        battle_ready_names = set()
-        for fmt in BATTLE_READY_FORMATS:
-            if fmt in data and 'stats' in data[fmt]:
-                for name in data[fmt]['stats'].keys():
-                    # Filter out battle-only forms
-                    if any(name.endswith(suffix) for suffix in BATTLE_ONLY_FORM_SUFFIXES):
-                        continue
-                        
-                    battle_ready_names.add(name)
-        
-        return sorted(list(battle_ready_names))
-    except Exception as e:
-        print(f"Error building battle-ready list: {e}")
+    names = sets_database.battle_ready_names()
+    if not names:
         return ["Charizard", "Garchomp", "Dragonite", "Mewtwo", "Zapdos", "Pikachu", "Snorlax", "Lucario"]
+    return names
 
 def get_random_battle_ready_pokemon() -> str:
     """Returns a random fully evolved, battle-ready Pokémon name."""
-    import random
     pokemon_list = get_battle_ready_pokemon_list()
     return random.choice(pokemon_list)
 
@@ -98,63 +44,8 @@ def get_all_pokemon_sets(pokemon_name: str, debug: bool = True) -> Optional[dict
     Returns a dictionary with format names as keys and sets as values
     """
     try:
-        normalized_name = re.sub(r'[^a-z0-9]', '', pokemon_name.lower())
-        
-        # Get the backend root directory (3 levels up from this file)
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        file_path = os.path.join(base_dir, 'data', 'gen8_stats_sets.json')
-        
-        if not os.path.exists(file_path):
-            return None
-            
-        with open(file_path, 'r', encoding='utf-8') as f:
-            sets_data = json.load(f)
-        
-        if not isinstance(sets_data, dict):
-            return None
-        
-        all_sets = {}
-        
-        # Check all formats
-        for format_name, format_data in sets_data.items():
-            if not isinstance(format_data, dict) or 'stats' not in format_data:
-                continue
-                
-            stats_data = format_data['stats']
-            
-            # Try to find the Pokémon in this format
-            pokemon_key = None
-            
-            # Special case for Urshifu forms
-            if 'urshifu' in pokemon_name.lower():
-                if 'rapid' in pokemon_name.lower():
-                    pokemon_key = 'Urshifu-Rapid-Strike'
-                else:
-                    pokemon_key = 'Urshifu'
-            # Try exact match first
-            elif pokemon_name in stats_data:
-                pokemon_key = pokemon_name
-            else:
-                # Try case-insensitive match
-                for key in stats_data.keys():
-                    if key.lower() == pokemon_name.lower():
-                        pokemon_key = key
-                        break
-                
-                # If still not found, try partial match
-                if pokemon_key is None:
-                    for key in stats_data.keys():
-                        if pokemon_name.lower() in key.lower():
-                            pokemon_key = key
-                            break
-            
-            if pokemon_key and pokemon_key in stats_data:
-                pokemon_sets = stats_data[pokemon_key]
-                if pokemon_sets:
-                    all_sets[format_name] = pokemon_sets
-        
+        all_sets = sets_database.all_sets(pokemon_name)
         return all_sets if all_sets else None
-            
     except Exception as e:
         return None
 
@@ -168,6 +59,12 @@ def fetch_sets(pokemon_name: str, format_name: str = None, debug: bool = True) -
         print(f"Format: {format_name if format_name else 'search all formats'}")
         print(f"Normalized name: {normalized_name}")
     
+    # Cached movesets are only valid for the sets file they were read from
+    global moveset_cache_version
+    if moveset_cache_version != sets_database.version:
+        moveset_cache.clear()
+        moveset_cache_version = sets_database.version
+    
     # Check cache first if a specific format is requested
     if format_name:
         cache_key = f"{normalized_name}_{format_name}"
@@ -221,151 +118,18 @@ def fetch_sets(pokemon_name: str, format_name: str = None, debug: bool = True) -
     return moves
 
 def fetch_sets_direct(pokemon_name: str, format_name: str, debug: bool = True) -> Optional[List[str]]:
-    try:
-        if debug:
-            print(f"  Loading data for format: {format_name}")
-        
-        # Get the backend root directory (3 levels up from this file)
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        file_path = os.path.join(base_dir, 'data', 'gen8_stats_sets.json')
-        
+    if not sets_database.is_available():
         if debug:
-            print(f"  Loading JSON file from: {file_path}")
-            
-        if not os.path.exists(file_path):
-            if debug:
-                print(f"  Error: gen8_stats_sets.json not found at {file_path}!")
-            return None
-            
-        with open(file_path, 'r', encoding='utf-8') as f:
-            if debug:
-                print("  Parsing JSON data...")
-            try:
-                sets_data = json.load(f)
-            except json.JSONDecodeError as e:
-                if debug:
-                    print(f"  Error parsing JSON: {e}")
-                return None
-        
-        if not isinstance(sets_data, dict):
-            if debug:
-                print("  Error: Invalid data format in JSON file")
-            return None
-        
-        if debug:
-            print(f"  Available formats: {list(sets_data.keys())}")
-        
-        # Find the format in the data
-        if format_name not in sets_data:
-            if debug:
-                print(f"  No data found for format: {format_name}")
-            return None
-            
-        format_data = sets_data[format_name]
-        if not isinstance(format_data, dict):
-            if debug:
-                print(f"  Invalid format data for {format_name}")
-            return None
-            
-        # Get the stats data
-        stats_data = format_data.get('stats', {})
-        if not stats_data:
-            if debug:
-                print(f"  No stats data found for format: {format_name}")
-            return None
-        
-        if debug:
-            print(f"  Found {len(stats_data)} Pokémon in {format_name}")
-            # Print first few Pokémon names for debugging
-            sample_pokemon = list(stats_data.keys())[:5]
-            print(f"  Sample Pokémon in {format_name}: {', '.join(sample_pokemon)}")
-        
-        # Try to find the Pokémon in the format's stats data
-        # First try exact match, then case-insensitive, then partial match
-        pokemon_key = None
-        
-        # Special case for Urshifu forms
-        if 'urshifu' in pokemon_name.lower():
-            if 'rapid' in pokemon_name.lower():
-                pokemon_key = 'Urshifu-Rapid-Strike'
-            else:
-                pokemon_key = 'Urshifu'  # Default to single-strike form
-        # Try exact match first
-        elif pokemon_name in stats_data:
-            pokemon_key = pokemon_name
-        else:
-            # Try case-insensitive and normalized match
-            for key in stats_data.keys():
-                normalized_key = key.lower().replace('-', '').replace(' ', '')
-                normalized_search = pokemon_name.lower().replace('-', '').replace(' ', '')
-                if normalized_key == normalized_search:
-                    pokemon_key = key
-                    break
-            
-            # If still not found, try partial match (must start with the name)
-            if pokemon_key is None:
-                for key in stats_data.keys():
-                    if key.lower().replace('-', '').startswith(pokemon_name.lower().replace('-', '')):
-                        pokemon_key = key
-                        break
-        
-        if not pokemon_key:
-            if debug:
-                print(f"  No stats sets found for {pokemon_name} in {format_name}")
-            return None
-        
-        # Get all sets for this Pokémon in the specified format
-        pokemon_sets = stats_data[pokemon_key]
-        
-        if debug:
-            print(f"  Found {len(pokemon_sets)} stats sets for {pokemon_key} in {format_name}")
-            print(f"  Available sets: {list(pokemon_sets.keys())}")
-        
-        # Get the first set
-        if not pokemon_sets:
-            if debug:
-                print(f"  No sets found for {pokemon_key}")
-            return None
-            
-        first_set_name = next(iter(pokemon_sets.keys()))
-        first_set = pokemon_sets[first_set_name]
-        
-        if debug:
-            print(f"  Using set: {first_set_name}")
-        
-        # Extract moves from the set
-        moves = first_set.get('moves', [])
-        
-        if debug:
-            print(f"  Raw moves data: {moves}")
-        
-        # Take the first 4 moves
-        moves = moves[:4]
-        
-        # Filter out any empty or None moves
-        moves = [str(move).strip() for move in moves if move and str(move).strip()]
-        
-        if debug:
-            print(f"  Processed moves: {moves}")
-        
+            print(f"  Error: gen8_stats_sets.json not found at {sets_database.path}!")
+        return None
+
+    moves = sets_database.default_moves(pokemon_name, format_name)
+    if debug:
         if moves:
-            if debug:
-                print(f"  Found moves in set: {moves}")
-            return moves
-            
-    except FileNotFoundError:
-        if debug:
-            print("  Error: gen8_stats_sets.json not found in the script directory")
-    except json.JSONDecodeError as e:
-        if debug:
-            print(f"  Error: Invalid JSON in gen8_stats_sets.json: {e}")
-    except Exception as e:
-        if debug:
-            import traceback
-            print(f"  Error in fetch_sets_direct: {e}")
-            traceback.print_exc()
-    
-    return None
+            print(f"  Found moves in {format_name}: {moves}")
+        else:
+            print(f"  No stats sets found for {pokemon_name} in {format_name}")
+    return moves
 
 def is_attack_move(move_name: str) -> bool:
     """Simple heuristic to identify attacking moves."""
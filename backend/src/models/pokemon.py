@@ -3,10 +3,13 @@ from ..utils.data_loader import data_loader
 from ..systems.status_effects import StatusEffect, BurnStatusEffect, ParalysisStatusEffect, FreezeStatusEffect, SleepStatusEffect, PoisonStatusEffect, StatusType
 from ..systems.ability_system import create_ability
 from ..systems.item_system import create_item
+from ..utils.battle_rng import global_rng
 from typing import Dict, List, Any
-import random
 
 class Pokemon:
+    # Game.bind_rng() points each battling Pokemon at its battle's stream
+    rng = global_rng
+
     def __init__(self, name, type_, sprite_url, stats, moves=None, level=100, **kwargs):
         self.name = self._format_pokemon_name(name) if isinstance(name, str) else name
         self.base_species_name = self.name
@@ -82,6 +85,31 @@ class Pokemon:
             return f"{self.get_display_name()} became {status}!"
         return ""
 
+    def clone(self) -> 'Pokemon':
+        """Copy of the battle state: HP, stat stages, statuses, PP, active move, ability/item state.
+
+        Species data, base stats and EVs/IVs are shared with the original.
+        """
+        pokemon = object.__new__(type(self))
+        attrs = pokemon.__dict__ = self.__dict__.copy()
+        attrs['stat_stages'] = self.stat_stages.copy()
+        attrs['volatile_statuses'] = self.volatile_statuses.copy()
+        attrs['status_change_events'] = self.status_change_events.copy()
+        if self.status_effects:
+            attrs['status_effects'] = {name: effect.clone() for name, effect in self.status_effects.items()}
+        else:
+            attrs['status_effects'] = {}
+        moves = attrs['moves'] = {name: move.clone() for name, move in self.moves.items()}
+        attrs['ability'] = self.ability.clone()
+        if self.item_obj:
+            attrs['item_obj'] = self.item_obj.clone()
+        if self.active_move:
+            active_move = attrs['active_move'] = dict(self.active_move)
+            for name, move in self.moves.items():
+                if move is active_move['move']:
+                    active_move['move'] = moves[name]
+        return pokemon
+
     def get_display_name(self):
         if getattr(self, 'is_player', False):
             return self.name
@@ -179,6 +207,7 @@ class Pokemon:
         norm = {'par': 'paralysis', 'psn': 'poison', 'brn': 'burn', 'slp': 'sleep', 'frz': 'freeze', 'tox': 'toxic'}
         st = norm.get(st, st)
         
+        kwargs.setdefault('rng', self.rng)
         try:
             if st == StatusType.BURN.value: eff = BurnStatusEffect(**kwargs)
             elif st == StatusType.PARALYSIS.value: eff = ParalysisStatusEffect(**kwargs)
@@ -343,6 +372,16 @@ class Pokemon:
             'stat_stages': self.stat_stages, 'substitute_hp': self.substitute_hp
         }
 
+    @property
+    def types(self) -> List[str]:
+        return self._types
+
+    @types.setter
+    def types(self, value: List[str]):
+        # Interned ids for the type chart, so effectiveness checks are a single table lookup
+        self._types = value
+        self.type_ids = data_loader.type_chart.type_ids(value)
+
     def forme_change(self, new_name: str, new_types: List[str], new_sprite: str, new_stats: Dict[str, int], new_cry: str = "", new_ability: str = ""):
         """Change the Pokemon's form mid-battle while maintaining HP percentage."""
         old_hp_percent = self.current_hp / self.max_hp if self.max_hp > 0 else 1.0
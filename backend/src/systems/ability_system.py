@@ -3,6 +3,8 @@ import json
 import os
 import re
 
+from ..utils.dataset_snapshot import load_section
+
 LOGIC_PATH = os.path.join(os.path.dirname(__file__), "../../data/datasets/abilities_logic.json")
 METADATA_PATH = os.path.join(os.path.dirname(__file__), "../../data/datasets/abilities.json")
 
@@ -33,7 +35,7 @@ def load_abilities_config():
         
     return config
 
-ABILITIES_CONFIG = load_abilities_config()
+ABILITIES_CONFIG = load_section("abilities_config", load_abilities_config)
 
 class Ability:
     def __init__(self, name: str):
@@ -47,6 +49,13 @@ class Ability:
             self.state['counter'] = 5
         elif self.id == 'truant':
             self.state['skip'] = False
+
+    def clone(self) -> 'Ability':
+        """Copy with its own ``state``; ``config`` is shared."""
+        ability = object.__new__(type(self))
+        ability.__dict__ = self.__dict__.copy()
+        ability.state = self.state.copy()
+        return ability
         
     def _parse_chain_modify(self, logic_str: str) -> float:
         """Extract multiplier from chainModify([num1, num2]) or chainModify(float)."""
@@ -802,7 +811,9 @@ class Ability:
 
     def get_priority_modification(self) -> float:
         """Returns priority modification (e.g. Stall)."""
-        return self.config.get('onFractionalPriority', 0.0)
+        priority = self.config.get('onFractionalPriority', 0.0)
+        # Conditional handlers (Quick Draw, Mycelium Might) come through as JS source, not numbers
+        return priority if isinstance(priority, (int, float)) else 0.0
 
     def can_use_move(self, pokemon) -> Tuple[bool, str]:
         """Checks if the ability allows the move (e.g. Truant)."""
@@ -0,0 +1,162 @@
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+# Bump when the payload format or the calculator output changes, so stale
+# on-disk entries are never read back.
+CACHE_VERSION = 3
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("DAMAGE_CACHE_SIZE", "4096"))
+DEFAULT_DB_PATH = os.getenv("DAMAGE_CACHE_PATH") or None
+# Pending SQLite writes are committed after this many puts or seconds, and at exit
+DEFAULT_COMMIT_EVERY = int(os.getenv("DAMAGE_CACHE_COMMIT_EVERY", "64"))
+DEFAULT_COMMIT_INTERVAL = float(os.getenv("DAMAGE_CACHE_COMMIT_INTERVAL", "5"))
+
+
+def payload_key(payload: Dict[str, Any]) -> str:
+    """Canonical hash of an oracle payload (key order and whitespace do not matter)."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{CACHE_VERSION}:{canonical}".encode("utf-8")).hexdigest()
+
+
+class DamageCache:
+    """LRU cache of damage results keyed by payload hash.
+
+    Entries hold the full roll array (plus min/max/description) so callers only
+    pick the random roll per hit. When ``db_path`` is set, entries are also
+    written to SQLite and survive restarts; the in-memory LRU sits in front.
+    Writes are committed in batches (every ``commit_every`` puts or
+    ``commit_interval`` seconds, and by ``flush``/at exit), so a put never
+    waits on a WAL commit of its own.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, db_path: Optional[str] = DEFAULT_DB_PATH,
+                 commit_every: int = DEFAULT_COMMIT_EVERY, commit_interval: float = DEFAULT_COMMIT_INTERVAL,
+                 clock=time.monotonic):
+        self.max_entries = max(1, max_entries)
+        self.db_path = db_path
+        self.commit_every = max(1, commit_every)
+        self.commit_interval = commit_interval
+        self.clock = clock
+        self._pending = 0
+        self._last_commit = clock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._open_db(db_path)
+
+    def _open_db(self, db_path: str):
+        try:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS damage_cache (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Damage cache database unavailable ({db_path}): {e}")
+            self._db = None
+            return
+        atexit.register(self.flush)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute("SELECT result FROM damage_cache WHERE key = ?", (key,)).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row:
+                    result = json.loads(row[0])
+                    self._remember(key, result)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return result
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        entry = {field: result[field] for field in ("damage", "min", "max", "description", "engine") if field in result}
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO damage_cache (key, result) VALUES (?, ?)",
+                        (key, json.dumps(entry)),
+                    )
+                    self._pending += 1
+                    if self._pending >= self.commit_every or self.clock() - self._last_commit >= self.commit_interval:
+                        self._commit()
+                except sqlite3.Error as e:
+                    print(f"Warning: Could not persist damage cache entry: {e}")
+
+    def _commit(self):
+        self._db.commit()
+        self._pending = 0
+        self._last_commit = self.clock()
+
+    def flush(self):
+        """Commit writes still pending to SQLite."""
+        with self._lock:
+            if self._db is not None and self._pending:
+                try:
+                    self._commit()
+                except sqlite3.Error as e:
+                    print(f"Warning: Could not persist damage cache entries: {e}")
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "persistent": self._db is not None,
+                "pending_writes": self._pending,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.disk_hits = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM damage_cache")
+                self._commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+damage_cache = DamageCache()
@@ -1,9 +1,20 @@
-import random
-from typing import Any, Dict, Optional
+import os
+from typing import Any, Dict, List, Optional
 
+from ..utils.data_loader import data_loader
+from .damage_cache import damage_cache, payload_key
+from .native_damage import native_damage_calculator, to_id
 from .smogon_oracle import smogon_damage_oracle
 
 
+# "oracle" (the default) only asks the Node oracle, and moves fall back to the
+# Python formula when it is unavailable; "auto" tries the in-process calculator
+# first and only asks the oracle for mechanics it does not cover; "native"
+# never starts Node. The native calculator stays opt-in until
+# tools/damage_diff.py agrees with the oracle.
+DAMAGE_CALCULATOR = os.getenv("DAMAGE_CALCULATOR", "oracle").lower()
+
+
 STATUS_TO_SMOGON = {
     "burn": "brn",
     "paralysis": "par",
@@ -19,9 +30,9 @@ WEATHER_TO_SMOGON = {
     "sandstorm": "Sand",
     "hail": "Snow",
     "snow": "Snow",
-    "primordialsea": "Primordial Sea",
-    "desolateland": "Desolate Land",
-    "deltastream": "Delta Stream",
+    "primordialsea": "Heavy Rain",
+    "desolateland": "Harsh Sunshine",
+    "deltastream": "Strong Winds",
     "none": None,
 }
 
@@ -34,6 +45,15 @@ STAT_TO_SMOGON = {
 }
 
 
+# Current HP only changes the result for these mechanics. Everywhere else it is
+# left out of the payload (the calculators then assume full HP), so the memo
+# key stays the same from one hit to the next.
+PINCH_ABILITIES = {"blaze": 3, "torrent": 3, "overgrow": 3, "swarm": 3, "defeatist": 2}
+FULL_HP_ABILITIES = {"multiscale", "shadowshield"}
+ATTACKER_HP_MOVES = {"eruption", "waterspout", "dragonenergy", "flail", "reversal"}
+DEFENDER_HP_MOVES = {"crushgrip", "wringout", "hardpress", "brine"}
+
+
 def _clean_name(value: Any) -> Optional[str]:
     if not value:
         return None
@@ -58,16 +78,40 @@ def _normalize_spread(values: Dict[str, int] | None, default: int) -> Dict[str,
     return result
 
 
-def _pokemon_payload(pokemon) -> Dict[str, Any]:
+def _payload_hp(pokemon, abilities, hp_move: bool) -> Optional[int]:
+    """curHP to send: exact for HP-based moves, otherwise the threshold bucket
+    of an HP-dependent ability in ``abilities``, or None for full HP."""
+    current = getattr(pokemon, "current_hp", None)
+    max_hp = getattr(pokemon, "max_hp", None)
+    if current is None or not max_hp or current >= max_hp:
+        return None
+    if hp_move:
+        return current
+    ability = to_id(getattr(getattr(pokemon, "ability", None), "name", ""))
+    if ability not in abilities:
+        return None
+    if ability in FULL_HP_ABILITIES:
+        return max_hp - 1
+    divisor = PINCH_ABILITIES[ability]
+    return max_hp // divisor if current <= max_hp / divisor else None
+
+
+def _pokemon_payload(pokemon, cur_hp: Optional[int] = None) -> Dict[str, Any]:
     ability = _clean_name(getattr(getattr(pokemon, "ability", None), "name", None))
     item = _clean_name(getattr(pokemon, "item", None))
+    if item:
+        # Sets store items in several spellings ("choice-band", "choiceband");
+        # the calculators expect the display name.
+        item_data = data_loader.get_item(item)
+        if item_data:
+            item = item_data.get("name", item)
     boosts = {}
     for stat, stage in getattr(pokemon, "stat_stages", {}).items():
         key = STAT_TO_SMOGON.get(stat)
         if key:
             boosts[key] = int(stage)
 
-    return {
+    data = {
         "species": getattr(pokemon, "name", "Pikachu"),
         "level": getattr(pokemon, "level", 100),
         "ability": ability,
@@ -78,9 +122,13 @@ def _pokemon_payload(pokemon) -> Dict[str, Any]:
         "boosts": boosts,
         "status": STATUS_TO_SMOGON.get(getattr(pokemon, "major_status", None)),
     }
+    if cur_hp is not None:
+        data["curHP"] = cur_hp
+    return data
 
 
-def smogon_damage_for_move(attacker, defender, move, field: Dict[str, Any] | None = None) -> Optional[Dict[str, Any]]:
+def build_damage_payload(attacker, defender, move, field: Dict[str, Any] | None = None,
+                         is_critical: bool = False) -> Optional[Dict[str, Any]]:
     if getattr(move, "fixed_damage", None) or getattr(move, "ohko", False):
         return None
     if getattr(move, "category", "status") == "status" or getattr(move, "power", 0) <= 0:
@@ -95,11 +143,17 @@ def smogon_damage_for_move(attacker, defender, move, field: Dict[str, Any] | Non
     if "-mega" in attacker_name or "-mega" in defender_name:
         gen = 7
 
-    payload = {
+    move_payload = {"name": getattr(move, "name", "")}
+    move_id = to_id(move_payload["name"])
+    if is_critical:
+        # Only set for crits, so ordinary hits keep sharing one cache entry
+        move_payload["isCrit"] = True
+
+    return {
         "gen": gen,
-        "attacker": _pokemon_payload(attacker),
-        "defender": _pokemon_payload(defender),
-        "move": {"name": getattr(move, "name", "")},
+        "attacker": _pokemon_payload(attacker, _payload_hp(attacker, PINCH_ABILITIES, move_id in ATTACKER_HP_MOVES)),
+        "defender": _pokemon_payload(defender, _payload_hp(defender, FULL_HP_ABILITIES, move_id in DEFENDER_HP_MOVES)),
+        "move": move_payload,
         "field": {
             "weather": WEATHER_TO_SMOGON.get(field.get("weather"), field.get("weather")),
             "terrain": field.get("terrain"),
@@ -108,8 +162,88 @@ def smogon_damage_for_move(attacker, defender, move, field: Dict[str, Any] | Non
             "isAuroraVeil": bool(field.get("is_aurora_veil")),
         },
     }
+
+
+def _is_valid_result(result: Optional[Dict[str, Any]]) -> bool:
+    return bool(result) and not result.get("error") and bool(result.get("damage"))
+
+
+def calculate_damage(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Roll table for one payload from the configured calculator(s)."""
+    if DAMAGE_CALCULATOR != "oracle":
+        result = native_damage_calculator.calculate(payload)
+        if result is not None or DAMAGE_CALCULATOR == "native":
+            return result
     result = smogon_damage_oracle.calculate(payload)
-    if not result or result.get("error") or not result.get("damage"):
+    if _is_valid_result(result):
+        result.setdefault("engine", "smogon")
+    return result
+
+
+def calculate_damage_many(payloads: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+    results: List[Optional[Dict[str, Any]]] = [None] * len(payloads)
+    remaining = list(range(len(payloads)))
+    if DAMAGE_CALCULATOR != "oracle":
+        for index in list(remaining):
+            results[index] = native_damage_calculator.calculate(payloads[index])
+        remaining = [index for index in remaining if results[index] is None]
+    if remaining and DAMAGE_CALCULATOR != "native":
+        batch = smogon_damage_oracle.calculate_many([payloads[index] for index in remaining]) or []
+        for index, result in zip(remaining, batch):
+            if _is_valid_result(result):
+                result.setdefault("engine", "smogon")
+            results[index] = result
+    return results
+
+
+def smogon_damage_for_move(attacker, defender, move, field: Dict[str, Any] | None = None,
+                           is_critical: bool = False) -> Optional[Dict[str, Any]]:
+    payload = build_damage_payload(attacker, defender, move, field, is_critical)
+    if payload is None:
         return None
-    result["selected_damage"] = random.choice(result["damage"])
+
+    # Everything up to the roll is deterministic, so the roll table is memoized
+    # and only the random pick happens per hit.
+    key = payload_key(payload)
+    cached = damage_cache.get(key)
+    if cached is None:
+        result = calculate_damage(payload)
+        if not _is_valid_result(result):
+            return None
+        damage_cache.put(key, result)
+    else:
+        result = cached
+
+    result = dict(result)
+    result["selected_damage"] = attacker.rng.choice(result["damage"])
     return result
+
+
+def smogon_damage_matrix(attacker, moves: List[Any], defenders: List[Any], field: Dict[str, Any] | None = None) -> List[List[Optional[Dict[str, Any]]]]:
+    """Damage ranges for every move against every defender, indexed [move][defender].
+
+    Used for previews (e.g. all four moves against each possible switch-in), so
+    no roll is selected. Entries the oracle cannot calculate are None.
+    """
+    matrix: List[List[Optional[Dict[str, Any]]]] = [[None] * len(defenders) for _ in moves]
+    payloads = []
+    pending = []
+    for move_index, move in enumerate(moves):
+        for defender_index, defender in enumerate(defenders):
+            payload = build_damage_payload(attacker, defender, move, field)
+            if payload is None:
+                continue
+            key = payload_key(payload)
+            cached = damage_cache.get(key)
+            if cached is not None:
+                matrix[move_index][defender_index] = dict(cached)
+            else:
+                payloads.append(payload)
+                pending.append((move_index, defender_index, key))
+
+    results = calculate_damage_many(payloads) if payloads else []
+    for (move_index, defender_index, key), result in zip(pending, results):
+        if _is_valid_result(result):
+            damage_cache.put(key, result)
+            matrix[move_index][defender_index] = result
+    return matrix
@@ -3,6 +3,8 @@ import json
 import os
 import re
 
+from ..utils.dataset_snapshot import load_section
+
 LOGIC_PATH = os.path.join(os.path.dirname(__file__), "../../data/datasets/items_logic.json")
 
 def load_items_config():
@@ -12,7 +14,7 @@ def load_items_config():
             config = json.load(f)
     return config
 
-ITEMS_CONFIG = load_items_config()
+ITEMS_CONFIG = load_section("items_config", load_items_config)
 
 class Item:
     def __init__(self, name: str):
@@ -23,6 +25,13 @@ class Item:
         
         # State for specific items (e.g. choice lock)
         self.state = {}
+
+    def clone(self) -> 'Item':
+        """Copy with its own ``state``; ``config`` is shared."""
+        item = object.__new__(type(self))
+        item.__dict__ = self.__dict__.copy()
+        item.state = self.state.copy()
+        return item
         
     def _parse_chain_modify(self, logic_str: str) -> float:
         if not logic_str or "chainModify" not in logic_str:
@@ -0,0 +1,125 @@
+"""Vectorized damage ranges for whole-team matchups.
+
+Computes every (attacker, move, defender) combination between two teams in a
+single NumPy pass and returns a dense ``[attackers, moves, defenders, 16]``
+array of damage rolls. It uses the same integer pipeline as the native
+calculator (base damage, random roll, STAB, type effectiveness, burn), but
+takes stats as they currently stand on each Pokemon instead of modelling
+abilities and items. Use it for team building and AI lookahead; per-hit
+numbers still come from damage_engine.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from ..utils.data_loader import data_loader
+
+ROLLS = np.arange(85, 101, dtype=np.int64)
+CATEGORY_IDS = {"physical": 0, "special": 1, "status": 2}
+MOVES_PER_POKEMON = 4
+
+
+def type_order() -> List[str]:
+    return data_loader.type_chart.types
+
+
+def type_index(type_name: Optional[str]) -> int:
+    """Index into type_order(); unknown or missing types map to the neutral slot."""
+    return data_loader.type_chart.type_id(type_name)
+
+
+def effectiveness_matrix() -> np.ndarray:
+    """``[attacking type, defending type]`` multipliers, with a neutral "no type" row and column."""
+    return data_loader.type_chart.array
+
+
+class TeamArrays:
+    """Column-oriented view of a team: one row per Pokemon, one column per move slot."""
+
+    def __init__(self, level, attack, defense, special_attack, special_defense, types, burned,
+                 move_power, move_category, move_type, move_names=None):
+        self.level = np.asarray(level, dtype=np.int64)
+        self.attack = np.asarray(attack, dtype=np.int64)
+        self.defense = np.asarray(defense, dtype=np.int64)
+        self.special_attack = np.asarray(special_attack, dtype=np.int64)
+        self.special_defense = np.asarray(special_defense, dtype=np.int64)
+        self.types = np.asarray(types, dtype=np.int64).reshape(-1, 2)
+        self.burned = np.asarray(burned, dtype=bool)
+        self.move_power = np.asarray(move_power, dtype=np.int64).reshape(len(self.level), -1)
+        self.move_category = np.asarray(move_category, dtype=np.int64).reshape(self.move_power.shape)
+        self.move_type = np.asarray(move_type, dtype=np.int64).reshape(self.move_power.shape)
+        self.move_names = move_names or [[None] * self.move_power.shape[1] for _ in range(len(self.level))]
+
+    def __len__(self) -> int:
+        return len(self.level)
+
+    @classmethod
+    def from_team(cls, team: Sequence, moves_per_pokemon: int = MOVES_PER_POKEMON) -> "TeamArrays":
+        """Build arrays from Pokemon objects; empty move slots have zero power."""
+        columns = {key: [] for key in ("level", "attack", "defense", "special_attack", "special_defense",
+                                       "types", "burned", "move_power", "move_category", "move_type", "move_names")}
+        neutral = len(type_order())
+        for pokemon in team:
+            types = list(getattr(pokemon, "type_ids", None) or [type_index(t) for t in getattr(pokemon, "types", [])])[:2]
+            columns["level"].append(getattr(pokemon, "level", 100))
+            for stat in ("attack", "defense", "special_attack", "special_defense"):
+                columns[stat].append(max(1, int(getattr(pokemon, stat, 1))))
+            columns["types"].append(types + [neutral] * (2 - len(types)))
+            columns["burned"].append(getattr(pokemon, "major_status", None) == "burn" and not pokemon.has_ability("guts"))
+
+            moves = list(getattr(pokemon, "moves", {}).values())[:moves_per_pokemon]
+            power, category, move_type, names = [], [], [], []
+            for move in moves:
+                move_category = CATEGORY_IDS.get(getattr(move, "category", "status"), 2)
+                is_damaging = move_category != 2 and not getattr(move, "fixed_damage", None) and not getattr(move, "ohko", False)
+                power.append(int(getattr(move, "power", 0) or 0) if is_damaging else 0)
+                category.append(move_category)
+                move_type.append(type_index(getattr(move, "type", None)))
+                names.append(getattr(move, "name", None))
+            padding = moves_per_pokemon - len(moves)
+            columns["move_power"].append(power + [0] * padding)
+            columns["move_category"].append(category + [2] * padding)
+            columns["move_type"].append(move_type + [neutral] * padding)
+            columns["move_names"].append(names + [None] * padding)
+        return cls(**columns)
+
+
+def damage_matrix(attackers: TeamArrays, defenders: TeamArrays) -> np.ndarray:
+    """All 16 damage rolls for every attacker move against every defender.
+
+    Returns an int32 array shaped ``[attackers, moves, defenders, 16]``;
+    status moves, empty slots and immunities are all zeros.
+    """
+    special = attackers.move_category == CATEGORY_IDS["special"]                      # [A, M]
+    attack = np.where(special, attackers.special_attack[:, None], attackers.attack[:, None])
+    defense = np.where(special[:, :, None], defenders.special_defense[None, None, :],
+                       defenders.defense[None, None, :])                                # [A, M, D]
+
+    level_factor = (2 * attackers.level) // 5 + 2                                       # [A]
+    base = (level_factor[:, None, None] * attackers.move_power[:, :, None] * attack[:, :, None]) // defense
+    base = base // 50 + 2                                                               # [A, M, D]
+
+    damage = (base[..., None] * ROLLS) // 100                                           # [A, M, D, 16]
+
+    stab = (attackers.move_type[:, :, None] == attackers.types[:, None, :]).any(axis=-1)  # [A, M]
+    stabbed, remainder = np.divmod(damage * 6144, 4096)
+    stabbed = stabbed + (remainder > 2048)
+    damage = np.where(stab[:, :, None, None], stabbed, damage)
+
+    chart = effectiveness_matrix()
+    move_types = attackers.move_type[:, :, None]
+    effectiveness = (chart[move_types, defenders.types[None, None, :, 0]]
+                     * chart[move_types, defenders.types[None, None, :, 1]])            # [A, M, D]
+    damage = np.floor(damage * effectiveness[..., None]).astype(np.int64)
+
+    burned = attackers.burned[:, None] & (attackers.move_category == CATEGORY_IDS["physical"])
+    damage = np.where(burned[:, :, None, None], damage // 2, damage)
+
+    hits = (attackers.move_power[:, :, None] > 0) & (effectiveness > 0)
+    damage = np.where(hits[..., None], np.maximum(damage, 1), 0)
+    return damage.astype(np.int32)
+
+
+def team_damage_matrix(attacking_team: Sequence, defending_team: Sequence) -> np.ndarray:
+    return damage_matrix(TeamArrays.from_team(attacking_team), TeamArrays.from_team(defending_team))
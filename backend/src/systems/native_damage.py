@@ -0,0 +1,592 @@
+"""In-process port of the @smogon/calc damage formula (Gen 9 singles).
+
+Payloads are the same dicts the Node oracle takes (see damage_engine), and the
+result has the same shape: all 16 rolls plus min/max/description. Everything is
+integer arithmetic with the 4096-based modifier chain, so rolls match the
+oracle exactly for the mechanics listed here. Anything outside that set raises
+UnsupportedMechanic internally and calculate() returns None, letting the caller
+fall back to the oracle. tools/damage_diff.py replays random payloads against
+the oracle to keep the two in sync.
+"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.data_loader import data_loader
+
+
+class UnsupportedMechanic(Exception):
+    pass
+
+
+SUPPORTED_GENS = {9}
+
+STAT_IDS = ("hp", "atk", "def", "spa", "spd", "spe")
+
+# (boosted stat, lowered stat); neutral natures are omitted.
+NATURES = {
+    "lonely": ("atk", "def"), "brave": ("atk", "spe"), "adamant": ("atk", "spa"), "naughty": ("atk", "spd"),
+    "bold": ("def", "atk"), "relaxed": ("def", "spe"), "impish": ("def", "spa"), "lax": ("def", "spd"),
+    "timid": ("spe", "atk"), "hasty": ("spe", "def"), "jolly": ("spe", "spa"), "naive": ("spe", "spd"),
+    "modest": ("spa", "atk"), "mild": ("spa", "def"), "quiet": ("spa", "spe"), "rash": ("spa", "spd"),
+    "calm": ("spd", "atk"), "gentle": ("spd", "def"), "sassy": ("spd", "spe"), "careful": ("spd", "spa"),
+}
+NEUTRAL_NATURES = {"hardy", "docile", "serious", "bashful", "quirky"}
+
+# Abilities whose effect on damage is not modelled here. Abilities that are not
+# listed and not handled below have no effect on the oracle's numbers.
+UNSUPPORTED_ABILITIES = {
+    "analytic", "rivalry", "supremeoverlord", "slowstart", "stakeout", "plus", "minus",
+    "flowergift", "disguise", "iceface", "darkaura", "fairyaura", "aurabreak", "parentalbond",
+    "protosynthesis", "quarkdrive", "download", "intrepidsword", "dauntlessshield",
+    "embodyaspectcornerstone", "embodyaspecthearthflame", "embodyaspectteal", "embodyaspectwellspring",
+    "klutz", "neutralizinggas", "terashell", "terashift", "teraformzero", "imposter", "trace",
+    "forecast", "mimicry", "longreach", "simple", "electromorphosis", "windpower", "comatose",
+    "powerofalchemy", "receiver", "poisonpuppeteer",
+}
+
+UNSUPPORTED_ITEMS = {
+    "ironball", "ringtarget", "abilityshield", "boosterenergy", "protectivepads", "utilityumbrella",
+    "adamantorb", "adamantcrystal", "lustrousorb", "lustrousglobe", "griseousorb", "griseouscore",
+    "souldew", "cornerstonemask", "hearthflamemask", "wellspringmask", "deepseatooth", "deepseascale",
+    "metalpowder", "pinkbow", "polkadotbow", "vilevial",
+}
+
+# Moves the calc special-cases (variable power, type or category changes,
+# field interactions) that are not reproduced here.
+UNSUPPORTED_MOVES = {
+    "weatherball", "terrainpulse", "judgment", "multiattack", "technoblast", "naturepower",
+    "revelationdance", "aurawheel", "ivycudgel", "ragingbull", "photongeyser", "lightthatburnsthesky",
+    "expandingforce", "collisioncourse", "electrodrift", "mistyexplosion", "gravapple", "lashout",
+    "psyblade", "hydrosteam", "steelroller", "poltergeist", "skydrop", "thousandarrows", "struggle",
+    "futuresight", "doomdesire", "synchronoise", "foulplay", "shellsidearm", "hiddenpower",
+    "naturalgift", "fling", "present", "magnitude", "spectralthief", "brine", "terablast",
+    "tachyoncutter", "dynamaxcannon", "behemothblade", "behemothbash", "risingvoltage",
+}
+
+MOLD_BREAKERS = {"moldbreaker", "teravolt", "turboblaze"}
+UNBREAKABLE_ABILITIES = {"fullmetalbody", "neutralizinggas", "prismarmor", "shadowshield"}
+ATE_ABILITIES = {"aerilate": "Flying", "galvanize": "Electric", "pixilate": "Fairy", "refrigerate": "Ice"}
+UNREMOVABLE_ITEM_MARKERS = ("megaStone", "zMove", "onPlate", "onMemory", "onDrive", "isPrimalOrb")
+
+
+def to_id(text: Any) -> str:
+    return re.sub(r"[^a-z0-9]", "", str(text or "").lower())
+
+
+def poke_round(num: float) -> int:
+    return math.ceil(num) if num % 1 > 0.5 else math.floor(num)
+
+
+def of32(n):
+    return n % 4294967296 if n > 4294967295 else n
+
+
+def of16(n):
+    return n % 65536 if n > 65535 else n
+
+
+def chain_mods(mods: List[int], lower: int, upper: int) -> int:
+    modifier = 4096
+    for mod in mods:
+        if mod != 4096:
+            modifier = (modifier * mod + 2048) >> 12
+    return max(min(modifier, upper), lower)
+
+
+def modified_stat(stat: int, stage: int) -> int:
+    if stage > 0:
+        return math.floor(stat * (2 + stage) / 2)
+    if stage < 0:
+        return math.floor(stat * 2 / (2 - stage))
+    return stat
+
+
+def calc_stat(stat: str, base: int, iv: int, ev: int, level: int, nature: str) -> int:
+    if stat == "hp":
+        if base == 1:
+            return base
+        return math.floor((base * 2 + iv + math.floor(ev / 4)) * level / 100) + level + 10
+    boosted, lowered = NATURES.get(nature, (None, None))
+    multiplier = 1.1 if boosted == stat else 0.9 if lowered == stat else 1
+    return math.floor((math.floor((base * 2 + iv + math.floor(ev / 4)) * level / 100) + 5) * multiplier)
+
+
+_ITEM_TABLES: Optional[Dict[str, Dict[str, str]]] = None
+
+
+def _item_tables() -> Dict[str, Dict[str, str]]:
+    """Type-boosting items and resist berries, read from items_logic.json."""
+    global _ITEM_TABLES
+    if _ITEM_TABLES is None:
+        type_boost, resist_berry, gems = {}, {}, {}
+        boost_pattern = re.compile(r"move\.type === '(\w+)'\)\s*\{\s*return this\.chainModify\(\[4915, 4096\]\)")
+        berry_pattern = re.compile(r"move\.type === '(\w+)'")
+        for item_id, item in data_loader.items_data.items():
+            on_base_power = item.get("onBasePower") or ""
+            match = boost_pattern.search(on_base_power)
+            if match and "user." not in on_base_power:
+                type_boost[item_id] = match.group(1)
+            on_source_damage = item.get("onSourceModifyDamage") or ""
+            match = berry_pattern.search(on_source_damage)
+            if match and item.get("isBerry"):
+                resist_berry[item_id] = match.group(1)
+            if item.get("isGem") and item.get("name", "").endswith(" Gem"):
+                gems[item_id] = item["name"][:-4]
+        _ITEM_TABLES = {"type_boost": type_boost, "resist_berry": resist_berry, "gem": gems}
+    return _ITEM_TABLES
+
+
+class _Combatant:
+    def __init__(self, data: Dict[str, Any]):
+        species = data_loader.get_species(data.get("species", ""))
+        if not species or "baseStats" not in species:
+            raise UnsupportedMechanic(f"unknown species {data.get('species')!r}")
+        self.species = species
+        self.name = species["name"]
+        self.types = list(species.get("types", []))
+        self.level = int(data.get("level") or 100)
+        self.ability = to_id(data.get("ability") or species.get("abilities", {}).get("0"))
+        self.item = to_id(data.get("item"))
+        self.status = data.get("status") or ""
+        self.nature = to_id(data.get("nature") or "serious")
+        if self.nature not in NATURES and self.nature not in NEUTRAL_NATURES:
+            raise UnsupportedMechanic(f"unknown nature {data.get('nature')!r}")
+
+        evs = data.get("evs") or {}
+        ivs = data.get("ivs") or {}
+        self.evs = {stat: int(evs.get(stat, 0)) for stat in STAT_IDS}
+        self.ivs = {stat: int(ivs.get(stat, 31)) for stat in STAT_IDS}
+        self.boosts = {stat: int((data.get("boosts") or {}).get(stat, 0)) for stat in STAT_IDS if stat != "hp"}
+        self.raw_stats = {
+            stat: calc_stat(stat, species["baseStats"][stat], self.ivs[stat], self.evs[stat], self.level, self.nature)
+            for stat in STAT_IDS
+        }
+        cur_hp = data.get("curHP")
+        self.cur_hp = self.raw_stats["hp"] if cur_hp is None else min(int(cur_hp), self.raw_stats["hp"])
+
+    def has_type(self, *types: str) -> bool:
+        return any(t in self.types for t in types)
+
+    def is_grounded(self) -> bool:
+        return not self.has_type("Flying") and self.ability != "levitate" and self.item != "airballoon"
+
+    @property
+    def nfe(self) -> bool:
+        return bool(self.species.get("evos"))
+
+
+class _MoveInfo:
+    def __init__(self, name: str):
+        data = data_loader.get_move(name)
+        if not data:
+            raise UnsupportedMechanic(f"unknown move {name!r}")
+        self.id = to_id(data["name"])
+        self.name = data["name"]
+        self.bp = int(data.get("basePower") or 0)
+        self.type = data["type"]
+        self.category = data["category"]
+        self.priority = int(data.get("priority") or 0)
+        self.flags = data.get("flags") or {}
+        self.secondaries = bool(data.get("secondary") or data.get("secondaries") or data.get("hasSheerForce"))
+        self.recoil = bool(data.get("recoil"))
+        self.crash = bool(data.get("hasCrashDamage"))
+        self.will_crit = bool(data.get("willCrit"))
+        self.ignore_defensive = bool(data.get("ignoreDefensive"))
+        self.ignore_ability = bool(data.get("ignoreAbility"))
+        self.offensive_stat = data.get("overrideOffensiveStat")
+        self.defensive_stat = data.get("overrideDefensiveStat")
+        self.is_z = bool(data.get("isZ"))
+        self.is_max = bool(data.get("isMax"))
+
+        if self.id in UNSUPPORTED_MOVES:
+            raise UnsupportedMechanic(f"move {self.name} is not supported")
+        if data.get("basePowerCallback") or data.get("multihit") or data.get("damage"):
+            raise UnsupportedMechanic(f"move {self.name} has variable power or hits")
+        if self.is_z or self.is_max or data.get("overrideOffensivePokemon"):
+            raise UnsupportedMechanic(f"move {self.name} is not supported")
+
+
+class NativeDamageCalculator:
+    engine = "native"
+
+    def calculate(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            return self._calculate(payload)
+        except UnsupportedMechanic:
+            return None
+
+    def unsupported_reason(self, payload: Dict[str, Any]) -> Optional[str]:
+        try:
+            self._calculate(payload)
+        except UnsupportedMechanic as exc:
+            return str(exc)
+        return None
+
+    def _calculate(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        gen = payload.get("gen") or 9
+        if gen not in SUPPORTED_GENS:
+            raise UnsupportedMechanic(f"gen {gen} is not supported")
+
+        attacker = _Combatant(payload["attacker"])
+        defender = _Combatant(payload["defender"])
+        move = _MoveInfo(payload["move"]["name"])
+        field = payload.get("field") or {}
+        for side in (attacker, defender):
+            if side.ability in UNSUPPORTED_ABILITIES:
+                raise UnsupportedMechanic(f"ability {side.ability} is not supported")
+            if side.item in UNSUPPORTED_ITEMS:
+                raise UnsupportedMechanic(f"item {side.item} is not supported")
+        if move.id == "knockoff" and self._item_is_unremovable(defender):
+            raise UnsupportedMechanic("knock off against an unremovable item")
+
+        weather = field.get("weather") or None
+        if {"airlock", "cloudnine"} & {attacker.ability, defender.ability}:
+            weather = None
+        terrain = field.get("terrain") or None
+        screens = {
+            "reflect": bool(field.get("isReflect")),
+            "lightscreen": bool(field.get("isLightScreen")),
+            "auroraveil": bool(field.get("isAuroraVeil")),
+        }
+        if attacker.ability == "infiltrator":
+            screens = dict.fromkeys(screens, False)
+
+        if move.category == "Status":
+            return self._result(attacker, defender, move, [0])
+
+        if defender.ability not in UNBREAKABLE_ABILITIES and (attacker.ability in MOLD_BREAKERS or move.ignore_ability):
+            defender.ability = ""
+
+        is_critical = (
+            defender.ability not in ("battlearmor", "shellarmor")
+            and (
+                move.will_crit
+                or payload["move"].get("isCrit")
+                or (attacker.ability == "merciless" and defender.status in ("psn", "tox"))
+            )
+        )
+
+        move_type, ate_boost = self._move_type(attacker, move)
+        effectiveness = self._type_effectiveness(attacker, defender, move, move_type, weather)
+        if effectiveness == 0 or self._is_immune(attacker, defender, move, move_type, effectiveness, weather, terrain):
+            return self._result(attacker, defender, move, [0])
+
+        base_power = self._base_power(attacker, defender, move, move_type, ate_boost, weather, terrain)
+        attack = self._attack(attacker, defender, move, move_type, is_critical, weather, terrain)
+        defense = self._defense(attacker, defender, move, is_critical, weather, terrain)
+
+        base_damage = math.floor(of32(math.floor(of32(of32(math.floor(2 * attacker.level / 5 + 2) * base_power) * attack) / defense) / 50 + 2))
+        if (weather in ("Sun", "Harsh Sunshine") and move_type == "Fire") or (weather in ("Rain", "Heavy Rain") and move_type == "Water"):
+            base_damage = poke_round(of32(base_damage * 6144) / 4096)
+        elif (weather == "Sun" and move_type == "Water") or (weather == "Rain" and move_type == "Fire"):
+            base_damage = poke_round(of32(base_damage * 2048) / 4096)
+        if is_critical:
+            base_damage = math.floor(of32(base_damage * 1.5))
+
+        stab_mod = self._stab_mod(attacker, move_type)
+        apply_burn = attacker.status == "brn" and move.category == "Physical" and attacker.ability != "guts" and move.id != "facade"
+        final_mod = chain_mods(
+            self._final_mods(attacker, defender, move, move_type, effectiveness, is_critical, screens),
+            41,
+            131072,
+        )
+
+        damage = [
+            self._final_damage(base_damage, roll, effectiveness, apply_burn, stab_mod, final_mod)
+            for roll in range(16)
+        ]
+        return self._result(attacker, defender, move, damage)
+
+    @staticmethod
+    def _final_damage(base: int, roll: int, effectiveness: float, burned: bool, stab_mod: int, final_mod: int) -> int:
+        damage = math.floor(of32(base * (85 + roll)) / 100)
+        if stab_mod != 4096:
+            damage = of32(damage * stab_mod) / 4096
+        damage = math.floor(of32(poke_round(damage) * effectiveness))
+        if burned:
+            damage = math.floor(damage / 2)
+        return of16(poke_round(max(1, of32(damage * final_mod) / 4096)))
+
+    @staticmethod
+    def _item_is_unremovable(pokemon: _Combatant) -> bool:
+        item = data_loader.items_data.get(pokemon.item) if pokemon.item else None
+        return bool(item) and any(marker in item for marker in UNREMOVABLE_ITEM_MARKERS)
+
+    @staticmethod
+    def _move_type(attacker: _Combatant, move: _MoveInfo) -> Tuple[str, bool]:
+        if move.type == "Normal" and attacker.ability in ATE_ABILITIES:
+            return ATE_ABILITIES[attacker.ability], True
+        if attacker.ability == "liquidvoice" and move.flags.get("sound"):
+            return "Water", False
+        if attacker.ability == "normalize":
+            return "Normal", True
+        return move.type, False
+
+    @staticmethod
+    def _effectiveness(move_type: str, defending_type: str) -> float:
+        return data_loader.get_type_effectiveness(move_type, defending_type)
+
+    def _type_effectiveness(self, attacker, defender, move, move_type, weather) -> float:
+        ghost_revealed = attacker.ability in ("scrappy", "mindseye")
+        total = 1.0
+        for defending_type in defender.types:
+            if ghost_revealed and defending_type == "Ghost" and move_type in ("Normal", "Fighting"):
+                value = 1.0
+            elif move.id == "freezedry" and defending_type == "Water":
+                value = 2.0
+            else:
+                value = self._effectiveness(move_type, defending_type)
+                if move.id == "flyingpress":
+                    value *= self._effectiveness("Flying", defending_type)
+            total *= value
+        if weather == "Strong Winds" and defender.has_type("Flying") and self._effectiveness(move_type, "Flying") > 1:
+            total /= 2
+        return total
+
+    @staticmethod
+    def _is_immune(attacker, defender, move, move_type, effectiveness, weather, terrain) -> bool:
+        ability = defender.ability
+        if (
+            (ability == "wonderguard" and effectiveness <= 1)
+            or (move_type == "Grass" and ability == "sapsipper")
+            or (move_type == "Fire" and ability in ("flashfire", "wellbakedbody"))
+            or (move_type == "Water" and ability in ("dryskin", "stormdrain", "waterabsorb"))
+            or (move_type == "Electric" and ability in ("lightningrod", "motordrive", "voltabsorb"))
+            or (move_type == "Ground" and ability in ("levitate", "eartheater"))
+            or (move.flags.get("bullet") and ability == "bulletproof")
+            or (move.flags.get("sound") and ability == "soundproof")
+            or (move.priority > 0 and ability in ("queenlymajesty", "dazzling", "armortail"))
+            or (move.flags.get("wind") and ability == "windrider")
+        ):
+            return True
+        if move_type == "Ground" and defender.item == "airballoon":
+            return True
+        if move.priority > 0 and terrain == "Psychic" and defender.is_grounded():
+            return True
+        if (weather == "Harsh Sunshine" and move_type == "Water") or (weather == "Heavy Rain" and move_type == "Fire"):
+            return True
+        return False
+
+    def _base_power(self, attacker, defender, move, move_type, ate_boost, weather, terrain) -> int:
+        mods = []
+        if (
+            (move.id == "facade" and attacker.status)
+            or (move.id == "venoshock" and defender.status in ("psn", "tox"))
+        ):
+            mods.append(8192)
+        elif move.id == "knockoff" and defender.item:
+            mods.append(6144)
+        elif move.id in ("solarbeam", "solarblade") and weather in ("Rain", "Heavy Rain", "Sand", "Hail", "Snow"):
+            mods.append(2048)
+
+        if attacker.is_grounded() and (
+            (terrain == "Electric" and move_type == "Electric")
+            or (terrain == "Grassy" and move_type == "Grass")
+            or (terrain == "Psychic" and move_type == "Psychic")
+        ):
+            mods.append(5325)
+        if defender.is_grounded() and (
+            (terrain == "Misty" and move_type == "Dragon")
+            or (terrain == "Grassy" and move.id in ("bulldoze", "earthquake"))
+        ):
+            mods.append(2048)
+
+        ability = attacker.ability
+        if (
+            (ability == "technician" and move.bp <= 60)
+            or (ability == "flareboost" and attacker.status == "brn" and move.category == "Special")
+            or (ability == "toxicboost" and attacker.status in ("psn", "tox") and move.category == "Physical")
+            or (ability == "megalauncher" and move.flags.get("pulse"))
+            or (ability == "strongjaw" and move.flags.get("bite"))
+            or (ability == "steelyspirit" and move_type == "Steel")
+            or (ability == "sharpness" and move.flags.get("slicing"))
+        ):
+            mods.append(6144)
+        if (
+            (ability == "sheerforce" and move.secondaries)
+            or (ability == "sandforce" and weather == "Sand" and move_type in ("Rock", "Ground", "Steel"))
+            or (ability == "toughclaws" and move.flags.get("contact"))
+            or (ability == "punkrock" and move.flags.get("sound"))
+        ):
+            mods.append(5325)
+        if ate_boost:
+            mods.append(4915)
+        if (ability == "reckless" and (move.recoil or move.crash)) or (ability == "ironfist" and move.flags.get("punch")):
+            mods.append(4915)
+        if attacker.item == "punchingglove" and move.flags.get("punch"):
+            mods.append(4506)
+        if defender.ability == "dryskin" and move_type == "Fire":
+            mods.append(5120)
+
+        tables = _item_tables()
+        if tables["gem"].get(attacker.item) == move_type:
+            mods.append(5325)
+        elif tables["type_boost"].get(attacker.item) == move_type:
+            mods.append(4915)
+        elif (attacker.item == "muscleband" and move.category == "Physical") or (attacker.item == "wiseglasses" and move.category == "Special"):
+            mods.append(4505)
+
+        return of16(max(1, poke_round(move.bp * chain_mods(mods, 41, 2097152) / 4096)))
+
+    def _attack(self, attacker, defender, move, move_type, is_critical, weather, terrain) -> int:
+        stat = "def" if move.offensive_stat == "def" else "spa" if move.category == "Special" else "atk"
+        stage = attacker.boosts[stat]
+        if stage == 0 or (is_critical and stage < 0) or defender.ability == "unaware":
+            attack = attacker.raw_stats[stat]
+        else:
+            attack = modified_stat(attacker.raw_stats[stat], stage)
+        if attacker.ability == "hustle" and move.category == "Physical":
+            attack = poke_round(attack * 3 / 2)
+
+        mods = []
+        ability = attacker.ability
+        physical = move.category == "Physical"
+        special = move.category == "Special"
+        pinch = attacker.cur_hp <= attacker.raw_stats["hp"] / 3 and (
+            (ability == "overgrow" and move_type == "Grass")
+            or (ability == "blaze" and move_type == "Fire")
+            or (ability == "torrent" and move_type == "Water")
+            or (ability == "swarm" and move_type == "Bug")
+        )
+        if ability == "defeatist" and attacker.cur_hp <= attacker.raw_stats["hp"] / 2:
+            mods.append(2048)
+        if ability == "solarpower" and weather in ("Sun", "Harsh Sunshine") and special:
+            mods.append(6144)
+        elif ability == "gorillatactics" and physical:
+            mods.append(6144)
+        elif (ability == "guts" and attacker.status and physical) or pinch:
+            mods.append(6144)
+        elif (
+            (ability == "steelworker" and move_type == "Steel")
+            or (ability == "dragonsmaw" and move_type == "Dragon")
+            or (ability == "rockypayload" and move_type == "Rock")
+        ):
+            mods.append(6144)
+        elif ability == "transistor" and move_type == "Electric":
+            mods.append(5325)
+        elif (ability == "waterbubble" and move_type == "Water") or (ability in ("hugepower", "purepower") and physical):
+            mods.append(8192)
+        elif ability == "orichalcumpulse" and weather in ("Sun", "Harsh Sunshine") and physical:
+            mods.append(5461)
+        elif ability == "hadronengine" and terrain == "Electric" and special:
+            mods.append(5461)
+
+        if (
+            (defender.ability == "thickfat" and move_type in ("Fire", "Ice"))
+            or (defender.ability == "waterbubble" and move_type == "Fire")
+            or (defender.ability == "purifyingsalt" and move_type == "Ghost")
+        ):
+            mods.append(2048)
+        if defender.ability == "heatproof" and move_type == "Fire":
+            mods.append(2048)
+        tablets = defender.ability == "tabletsofruin" and attacker.ability != "tabletsofruin"
+        vessel = defender.ability == "vesselofruin" and attacker.ability != "vesselofruin"
+        if (tablets and physical) or (vessel and special):
+            mods.append(3072)
+
+        base_species = attacker.species.get("baseSpecies", attacker.name)
+        if (
+            (attacker.item == "thickclub" and base_species in ("Cubone", "Marowak") and physical)
+            or (attacker.item == "lightball" and "Pikachu" in attacker.name)
+        ):
+            mods.append(8192)
+        elif (attacker.item == "choiceband" and physical) or (attacker.item == "choicespecs" and special):
+            mods.append(6144)
+
+        return of16(max(1, poke_round(attack * chain_mods(mods, 410, 131072) / 4096)))
+
+    def _defense(self, attacker, defender, move, is_critical, weather, terrain) -> int:
+        hits_physical = move.defensive_stat == "def" or move.category == "Physical"
+        stat = "def" if hits_physical else "spd"
+        stage = defender.boosts[stat]
+        if stage == 0 or (is_critical and stage > 0) or move.ignore_defensive or attacker.ability == "unaware":
+            defense = defender.raw_stats[stat]
+        else:
+            defense = modified_stat(defender.raw_stats[stat], stage)
+
+        if weather == "Sand" and defender.has_type("Rock") and not hits_physical:
+            defense = poke_round(defense * 3 / 2)
+        if weather == "Snow" and defender.has_type("Ice") and hits_physical:
+            defense = poke_round(defense * 3 / 2)
+
+        mods = []
+        if defender.ability == "marvelscale" and defender.status and hits_physical:
+            mods.append(6144)
+        elif defender.ability == "grasspelt" and terrain == "Grassy" and hits_physical:
+            mods.append(6144)
+        elif defender.ability == "furcoat" and hits_physical:
+            mods.append(8192)
+        sword = attacker.ability == "swordofruin" and defender.ability != "swordofruin"
+        beads = attacker.ability == "beadsofruin" and defender.ability != "beadsofruin"
+        if (sword and hits_physical) or (beads and not hits_physical):
+            mods.append(3072)
+        if (defender.item == "eviolite" and defender.nfe) or (not hits_physical and defender.item == "assaultvest"):
+            mods.append(6144)
+
+        return of16(max(1, poke_round(defense * chain_mods(mods, 410, 131072) / 4096)))
+
+    @staticmethod
+    def _stab_mod(attacker, move_type) -> int:
+        stab = 4096
+        if attacker.has_type(move_type) or attacker.ability in ("protean", "libero"):
+            stab += 2048
+        if attacker.ability == "adaptability" and attacker.has_type(move_type):
+            stab += 2048
+        return stab
+
+    @staticmethod
+    def _final_mods(attacker, defender, move, move_type, effectiveness, is_critical, screens) -> List[int]:
+        mods = []
+        if screens["reflect"] and move.category == "Physical" and not is_critical and not screens["auroraveil"]:
+            mods.append(2048)
+        elif screens["lightscreen"] and move.category == "Special" and not is_critical and not screens["auroraveil"]:
+            mods.append(2048)
+        if screens["auroraveil"] and not is_critical:
+            mods.append(2048)
+
+        if attacker.ability == "neuroforce" and effectiveness > 1:
+            mods.append(5120)
+        elif attacker.ability == "sniper" and is_critical:
+            mods.append(6144)
+        elif attacker.ability == "tintedlens" and effectiveness < 1:
+            mods.append(8192)
+
+        if defender.ability in ("multiscale", "shadowshield") and defender.cur_hp == defender.raw_stats["hp"]:
+            mods.append(2048)
+        if defender.ability == "fluffy" and move.flags.get("contact"):
+            mods.append(2048)
+        elif (defender.ability == "punkrock" and move.flags.get("sound")) or (defender.ability == "icescales" and move.category == "Special"):
+            mods.append(2048)
+        if defender.ability in ("solidrock", "filter", "prismarmor") and effectiveness > 1:
+            mods.append(3072)
+        if defender.ability == "fluffy" and move_type == "Fire":
+            mods.append(8192)
+
+        if attacker.item == "expertbelt" and effectiveness > 1:
+            mods.append(4915)
+        elif attacker.item == "lifeorb":
+            mods.append(5324)
+
+        berry_type = _item_tables()["resist_berry"].get(defender.item)
+        if (
+            berry_type == move_type
+            and (effectiveness > 1 or move_type == "Normal")
+            and attacker.ability not in ("unnerve", "asoneglastrier", "asonespectrier")
+        ):
+            mods.append(1024 if defender.ability == "ripen" else 2048)
+        return mods
+
+    @staticmethod
+    def _result(attacker, defender, move, damage: List[int]) -> Dict[str, Any]:
+        low, high = min(damage), max(damage)
+        max_hp = defender.raw_stats["hp"]
+        description = (
+            f"Lv. {attacker.level} {attacker.name} {move.name} vs. Lv. {defender.level} {defender.name}: "
+            f"{low}-{high} ({math.floor(low * 1000 / max_hp) / 10} - {math.floor(high * 1000 / max_hp) / 10}%)"
+        )
+        return {"damage": damage, "min": low, "max": high, "description": description, "engine": "native"}
+
+
+native_damage_calculator = NativeDamageCalculator()
@@ -1,6 +1,7 @@
 from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
-import random
+
+from ..utils.battle_rng import global_rng
 
 
 # Priority level constants based on official Pokemon mechanics
@@ -76,7 +77,7 @@ class PriorityResolver:
         self.debug_enabled = True
         self.sucker_punch_handler = SuckerPunchHandler()
     
-    def resolve_turn_order(self, player_action: BattleAction, opponent_action: BattleAction) -> List[BattleAction]:
+    def resolve_turn_order(self, player_action: BattleAction, opponent_action: BattleAction, rng=global_rng) -> List[BattleAction]:
         if self.debug_enabled:
             print(f"DEBUG: Resolving turn order - Player: {player_action.move.name} (priority {player_action.effective_priority}), "
                   f"Opponent: {opponent_action.move.name} (priority {opponent_action.effective_priority})")
@@ -85,7 +86,7 @@ class PriorityResolver:
         actions_with_counters = self.check_priority_counters([player_action, opponent_action])
         
         # Sort actions by effective priority (descending) and speed (descending)
-        sorted_actions = sorted(actions_with_counters, key=self._get_sort_key, reverse=True)
+        sorted_actions = sorted(actions_with_counters, key=lambda action: self._get_sort_key(action, rng), reverse=True)
         
         if self.debug_enabled:
             for i, action in enumerate(sorted_actions):
@@ -157,11 +158,11 @@ class PriorityResolver:
         
         return effective_priority
     
-    def _get_sort_key(self, action: BattleAction) -> Tuple[int, int, float]:
+    def _get_sort_key(self, action: BattleAction, rng=global_rng) -> Tuple[int, int, float]:
         return (
             action.effective_priority,
             getattr(action.pokemon, 'speed', 0),
-            random.random()  # Random tiebreaker for equal priority and speed
+            rng.random()  # Random tiebreaker for equal priority and speed
         )
     
     def _is_priority_counter_move(self, move: Any) -> bool:
@@ -295,14 +296,16 @@ class SuckerPunchHandler:
 
 class ActionQueue:
     
-    def __init__(self, priority_resolver: PriorityResolver):
+    def __init__(self, priority_resolver: PriorityResolver, rng=global_rng):
         """
         Initialize the action queue.
         
         Args:
             priority_resolver: The priority resolver to use for action processing
+            rng: The battle's random stream, for speed tiebreakers
         """
         self.priority_resolver = priority_resolver
+        self.rng = rng
         self.actions: List[BattleAction] = []
         self.executed_actions: List[BattleAction] = []
         self.debug_enabled = True
@@ -366,7 +369,7 @@ class ActionQueue:
             key=lambda action: (
                 action.effective_priority,
                 action.get_speed_for_tiebreaker(),
-                random.random()
+                self.rng.random()
             ), 
             reverse=True
         )
@@ -521,12 +524,13 @@ def create_battle_actions_from_pokemon_moves(
     return actions
 
 
-def sort_actions_by_priority(actions: List[BattleAction]) -> List[BattleAction]:
+def sort_actions_by_priority(actions: List[BattleAction], rng=global_rng) -> List[BattleAction]:
     """
     Sort battle actions by priority and speed.
     
     Args:
         actions: List of battle actions to sort
+        rng: The battle's random stream, for speed tiebreakers
         
     Returns:
         List[BattleAction]: Actions sorted by execution order (first to last)
@@ -536,7 +540,7 @@ def sort_actions_by_priority(actions: List[BattleAction]) -> List[BattleAction]:
         key=lambda action: (
             action.effective_priority,
             action.get_speed_for_tiebreaker(),
-            random.random()  # Random tiebreaker
+            rng.random()  # Random tiebreaker
         ),
         reverse=True
     )
@@ -560,7 +564,8 @@ def create_action_queue_for_turn(
     player_move_name: str, 
     opponent_pokemon: Any, 
     opponent_move_name: str,
-    priority_resolver: PriorityResolver
+    priority_resolver: PriorityResolver,
+    rng=global_rng
 ) -> ActionQueue:
     """
     Create an action queue for a battle turn with player and opponent moves.
@@ -571,11 +576,12 @@ def create_action_queue_for_turn(
         opponent_pokemon: The opponent's Pokemon
         opponent_move_name: Name of the opponent's selected move
         priority_resolver: The priority resolver to use
+        rng: The battle's random stream, for speed tiebreakers
         
     Returns:
         ActionQueue: Configured action queue for the turn
     """
-    queue = ActionQueue(priority_resolver)
+    queue = ActionQueue(priority_resolver, rng)
     
     # Add player action
     player_move = player_pokemon.moves.get(player_move_name) if hasattr(player_pokemon, 'moves') else None
@@ -1,37 +1,266 @@
+import atexit
+import collections
 import json
 import os
+import queue
 import subprocess
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
 
 BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ORACLE_SCRIPT = os.path.join("tools", "smogon_damage_oracle.cjs")
+
+DEFAULT_POOL_SIZE = int(os.getenv("SMOGON_ORACLE_WORKERS", "2"))
+DEFAULT_TIMEOUT = float(os.getenv("SMOGON_ORACLE_TIMEOUT", "5"))
+# How often a caller waiting for a busy pool re-checks for room to start a worker
+ACQUIRE_POLL_INTERVAL = 0.05
+
+
+class OracleError(Exception):
+    def __init__(self, message: str, returncode: Optional[int] = None):
+        super().__init__(message)
+        self.returncode = returncode
+
+
+class OracleTimeout(OracleError):
+    pass
+
+
+class OracleWorkerCrashed(OracleError):
+    pass
+
+
+class OracleWorkerUnreachable(OracleWorkerCrashed):
+    """The worker was already gone before the request was written."""
+
+
+class OracleWorker:
+    """One long-lived oracle process speaking newline-delimited JSON."""
+
+    def __init__(self, command: List[str], cwd: Optional[str] = None):
+        self.command = command
+        self.process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        self._responses: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._stderr_tail = collections.deque(maxlen=20)
+        self._next_id = 0
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+    def _read_stdout(self):
+        for line in self.process.stdout:
+            self._responses.put(line)
+        self._responses.put(None)
+
+    def _read_stderr(self):
+        for line in self.process.stderr:
+            self._stderr_tail.append(line.rstrip())
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _crash_message(self) -> str:
+        tail = "\n".join(self._stderr_tail)
+        return tail or "Smogon damage oracle worker exited"
+
+    def request(self, message: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        self._next_id += 1
+        request_id = self._next_id
+        if not self.is_alive():
+            raise OracleWorkerUnreachable(self._crash_message(), self.process.returncode)
+        try:
+            self.process.stdin.write(json.dumps({"id": request_id, **message}) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError):
+            raise OracleWorkerUnreachable(self._crash_message(), self.process.poll())
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise OracleTimeout(f"Smogon damage oracle timed out after {timeout}s")
+            try:
+                line = self._responses.get(timeout=remaining)
+            except queue.Empty:
+                raise OracleTimeout(f"Smogon damage oracle timed out after {timeout}s")
+            if line is None:
+                self.process.wait()
+                raise OracleWorkerCrashed(self._crash_message(), self.process.returncode)
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if response.get("id") == request_id:
+                return response
+
+    def close(self):
+        if self.is_alive():
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+
+
+class OracleWorkerPool:
+    """Fixed-size pool of oracle workers.
+
+    Workers are started lazily, a worker that times out is killed, and a
+    worker that dies is replaced on the next request.
+    """
+
+    def __init__(self, command: List[str], size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT, cwd: Optional[str] = None):
+        self.command = command
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.cwd = cwd
+        self.restarts = 0
+        self._idle: "queue.Queue[OracleWorker]" = queue.Queue()
+        self._workers: List[OracleWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _acquire(self) -> OracleWorker:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            # Checked on every pass: a worker discarded while we wait leaves room for a new one.
+            with self._lock:
+                if self._closed:
+                    raise OracleError("Smogon damage oracle pool is closed")
+                if len(self._workers) < self.size:
+                    worker = OracleWorker(self.command, cwd=self.cwd)
+                    self._workers.append(worker)
+                    return worker
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise OracleTimeout("No Smogon damage oracle worker became free in time")
+            try:
+                return self._idle.get(timeout=min(ACQUIRE_POLL_INTERVAL, remaining))
+            except queue.Empty:
+                pass
+
+    def _release(self, worker: OracleWorker):
+        if worker.is_alive() and not self._closed:
+            self._idle.put(worker)
+        else:
+            self._discard(worker)
+
+    def _discard(self, worker: OracleWorker):
+        worker.close()
+        if worker.process.poll() is None:
+            worker.process.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+                self.restarts += 1
+
+    def request(self, message: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        timeout = self.timeout if timeout is None else timeout
+        # A worker can die while idle; give the request one more try on a fresh
+        # process, but only if it never reached the dead one. A worker that dies
+        # after reading the request may have been killed by it, so that is final.
+        for attempt in range(2):
+            worker = self._acquire()
+            try:
+                response = worker.request(message, timeout)
+            except OracleWorkerUnreachable:
+                self._discard(worker)
+                if attempt == 0:
+                    continue
+                raise
+            except OracleWorkerCrashed:
+                self._discard(worker)
+                raise
+            except OracleTimeout:
+                self._discard(worker)
+                raise
+            self._release(worker)
+            return response
+        raise OracleError("Smogon damage oracle request failed")
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
 
 
 class SmogonDamageOracle:
-    def __init__(self, backend_dir: str = BACKEND_DIR):
+    def __init__(self, backend_dir: str = BACKEND_DIR, pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT):
         self.backend_dir = backend_dir
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._pool: Optional[OracleWorkerPool] = None
+        self._pool_lock = threading.Lock()
 
     def is_available(self) -> bool:
         return os.path.exists(os.path.join(self.backend_dir, "node_modules", "@smogon", "calc"))
 
+    def _get_pool(self) -> OracleWorkerPool:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = OracleWorkerPool(
+                        ["node", ORACLE_SCRIPT, "--worker"],
+                        size=self.pool_size,
+                        timeout=self.timeout,
+                        cwd=self.backend_dir,
+                    )
+                    atexit.register(self._pool.close)
+        return self._pool
+
     def calculate(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         if not self.is_available():
             return None
 
-        proc = subprocess.run(
-            ["npm", "--prefix", self.backend_dir, "run", "smogon:damage", "--silent"],
-            input=json.dumps(payload),
-            text=True,
-            capture_output=True,
-            timeout=5,
-            check=False,
-        )
-        if proc.returncode != 0:
-            return {
-                "error": proc.stderr.strip() or proc.stdout.strip() or "Smogon damage oracle failed",
-                "returncode": proc.returncode,
-            }
-        return json.loads(proc.stdout)
+        try:
+            response = self._get_pool().request({"payload": payload})
+        except OracleError as exc:
+            return {"error": str(exc), "returncode": exc.returncode}
+        if "error" in response:
+            return {"error": response["error"], "returncode": 1}
+        return response["result"]
+
+    def calculate_many(self, payloads: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """Run a batch of payloads in one worker round-trip.
+
+        Results keep the order of ``payloads``; a failed entry comes back as
+        ``{"error": ...}`` without failing the rest of the batch.
+        """
+        if not self.is_available():
+            return None
+        if not payloads:
+            return []
+
+        try:
+            # The timeout is per request, so let a batch scale with its size.
+            timeout = self.timeout * max(1, len(payloads) / 50)
+            response = self._get_pool().request({"payloads": payloads}, timeout=timeout)
+        except OracleError as exc:
+            return [{"error": str(exc), "returncode": exc.returncode} for _ in payloads]
+        if "error" in response:
+            return [{"error": response["error"], "returncode": 1} for _ in payloads]
+        return response["results"]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
 
 smogon_damage_oracle = SmogonDamageOracle()
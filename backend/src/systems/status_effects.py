@@ -1,7 +1,8 @@
-import random
 from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
 
+from ..utils.battle_rng import global_rng
+
 
 class StatusType(Enum):
     BURN = "burn"
@@ -13,7 +14,7 @@ class StatusType(Enum):
 
 
 class StatusEffect:
-    def __init__(self, status_type: str, duration: int = -1, counter: int = 0):
+    def __init__(self, status_type: str, duration: int = -1, counter: int = 0, rng=None):
         self.status_type = status_type
         self.duration = duration
         self.counter = counter
@@ -24,7 +25,15 @@ class StatusEffect:
         # Initialize sleep duration if this is a sleep status
         if status_type == StatusType.SLEEP.value and duration == -1:
             duration_range = self.config.get('duration_range', (1, 3))
-            self.duration = random.randint(*duration_range)
+            self.duration = (rng or global_rng).randint(*duration_range)
+
+    def clone(self) -> 'StatusEffect':
+        effect = object.__new__(type(self))
+        effect.__dict__ = self.__dict__.copy()
+        return effect
+    
+    def _message(self, key: str, default: str) -> str:
+        return self.config.get('messages', {}).get(key, default)
     
     def can_apply(self, pokemon) -> bool:
         # Major status conditions cannot be applied if Pokemon already has one
@@ -55,10 +64,12 @@ class StatusEffect:
         # Check for specific failure reasons and return appropriate messages
         if hasattr(pokemon, 'status_effects') and self.status_type in pokemon.status_effects:
             # Pokemon already has this specific status
+            message_template = self._message('fail_already_has', "{pokemon} is already affected by {status}!")
             return message_template.format(pokemon=pokemon.get_display_name(), status=self.name.lower())
         
         if self.is_major and hasattr(pokemon, 'major_status') and pokemon.major_status:
             # Pokemon already has a major status condition
+            message_template = self._message('fail_major_status', "{pokemon} already has a major status condition!")
             return message_template.format(pokemon=pokemon.get_display_name())
         
         # Check for ability-based immunities
@@ -95,6 +106,7 @@ class StatusEffect:
             pokemon._add_status_change_event('status_applied', self.status_type, self.name)
             
         # Return application message
+        message_template = self._message('apply', "{pokemon} is affected by {status}!")
         return message_template.format(pokemon=pokemon.get_display_name(), status=self.name.lower())
     
     def process_turn_start(self, pokemon) -> List[str]:
@@ -103,7 +115,7 @@ class StatusEffect:
         # Handle freeze thaw chance
         if self.status_type == StatusType.FREEZE.value:
             recovery_chance = self.config.get('recovery_chance', 0)
-            if random.random() < recovery_chance:
+            if pokemon.rng.random() < recovery_chance:
                 messages.append(self._recover_status(pokemon))
                 return messages
         
@@ -144,10 +156,12 @@ class StatusEffect:
         if not prevents_move:
             return False, ""
         
+        message = self._message('prevent_move', "{pokemon} can't move!")
+        
         # Handle chance-based move prevention (paralysis)
         if self.status_type == StatusType.PARALYSIS.value:
             prevention_chance = self.config.get('move_prevention_chance', 0)
-            if random.random() < prevention_chance:
+            if pokemon.rng.random() < prevention_chance:
                 return True, message.format(pokemon=pokemon.get_display_name())
             return False, ""
         
@@ -179,6 +193,7 @@ class StatusEffect:
             pokemon._add_status_change_event('status_removed', self.status_type, self.name)
         
         # Return recovery message
+        message_template = self._message('recover', "{pokemon} recovered from {status}!")
         return message_template.format(pokemon=pokemon.get_display_name(), status=self.name)
 
 
@@ -310,7 +325,7 @@ class ParalysisStatusEffect(StatusEffect):
     def affects_move_usage(self, pokemon) -> Tuple[bool, str]:
         # 25% chance to prevent move usage
         prevention_chance = 0.25
-        if random.random() < prevention_chance:
+        if pokemon.rng.random() < prevention_chance:
             message = "{pokemon} is paralyzed! It can't move!".format(pokemon=pokemon.get_display_name())
             return True, message
         
@@ -347,7 +362,7 @@ class FreezeStatusEffect(StatusEffect):
         
         # 20% chance to thaw out
         recovery_chance = 0.2
-        if random.random() < recovery_chance:
+        if pokemon.rng.random() < recovery_chance:
             messages.append(self._recover_status(pokemon))
         
         return messages
@@ -379,7 +394,7 @@ class SleepStatusEffect(StatusEffect):
         # Set random duration if not provided
         if 'duration' not in kwargs or kwargs['duration'] == -1:
             duration_range = STATUS_EFFECTS_CONFIG[StatusType.SLEEP.value].get('duration_range', (1, 3))
-            kwargs['duration'] = random.randint(*duration_range)
+            kwargs['duration'] = (kwargs.get('rng') or global_rng).randint(*duration_range)
         
         super().__init__(StatusType.SLEEP.value, **kwargs)
     
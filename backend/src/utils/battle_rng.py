@@ -0,0 +1,129 @@
+"""Per-battle random number streams.
+
+Every random decision in a battle (accuracy, crits, damage rolls, secondary
+effects, status durations, speed ties, AI picks) draws from the Game's
+BattleRNG: PCG64 seeded through numpy's SeedSequence, so a seed reproduces
+the whole battle and spawn() hands out independent child streams for
+parallel work. Floats are drawn in blocks of BLOCK_SIZE and served from a
+list, which is what keeps a draw cheap on the hot path; the sequence is the
+same whatever the block size.
+
+Objects that are not part of a Game (a Pokemon built on its own, the
+standalone tools) fall back to global_rng, which forwards to the ``random``
+module.
+"""
+
+import os
+import random
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+BLOCK_SIZE = int(os.getenv('BATTLE_RNG_BLOCK_SIZE', '256'))
+
+
+class BattleRNG:
+    def __init__(self, seed: Optional[int] = None, block_size: int = BLOCK_SIZE,
+                 seed_sequence: Optional[np.random.SeedSequence] = None):
+        self.seed_sequence = seed_sequence or np.random.SeedSequence(seed)
+        self.block_size = block_size
+        self._generator = np.random.Generator(np.random.PCG64(self.seed_sequence))
+        self._block: List[float] = []
+        self._index = 0
+        # Generator state the current block was drawn from, for getstate()
+        self._block_state = self._generator.bit_generator.state
+
+    @property
+    def seed(self) -> int:
+        """The root seed; a fresh BattleRNG(seed) replays this stream (for spawned streams, with the spawn key)."""
+        return self.seed_sequence.entropy
+
+    def copy(self) -> 'BattleRNG':
+        """Same stream at the same position: the copy draws exactly what this one would.
+
+        Cheap: the current block is shared (blocks are never modified) and the copy only
+        builds its own generator when it needs a new block. The SeedSequence is shared too,
+        so spawn() on either advances both.
+        """
+        rng = object.__new__(type(self))
+        rng.__dict__ = self.__dict__.copy()
+        rng._generator = None
+        rng._resume_state = self._generator.bit_generator.state if self._generator is not None else self._resume_state
+        return rng
+
+    def random(self) -> float:
+        index = self._index
+        if index >= len(self._block):
+            self._refill()
+            index = 0
+        self._index = index + 1
+        return self._block[index]
+
+    def _refill(self):
+        if self._generator is None:
+            self._generator = np.random.Generator(np.random.PCG64(0))
+            self._generator.bit_generator.state = self._resume_state
+        self._block_state = self._generator.bit_generator.state
+        self._block = self._generator.random(self.block_size).tolist() if self.block_size > 1 else [self._generator.random()]
+
+    def randint(self, a: int, b: int) -> int:
+        """Integer in [a, b], both inclusive, like random.randint."""
+        return a + int(self.random() * (b - a + 1))
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        if not seq:
+            raise IndexError('Cannot choose from an empty sequence')
+        return seq[int(self.random() * len(seq))]
+
+    def spawn(self) -> 'BattleRNG':
+        """An independent child stream; spawning is itself deterministic."""
+        return BattleRNG(block_size=self.block_size, seed_sequence=self.seed_sequence.spawn(1)[0])
+
+    def getstate(self) -> list:
+        """Plain-data state (msgpack/JSON friendly) for from_state()."""
+        sequence = self.seed_sequence
+        pcg = self._block_state
+        return [str(sequence.entropy), list(sequence.spawn_key), sequence.n_children_spawned,
+                str(pcg['state']['state']), str(pcg['state']['inc']), pcg['has_uint32'], pcg['uinteger'],
+                self._index, self.block_size]
+
+    @classmethod
+    def from_state(cls, state: list) -> 'BattleRNG':
+        entropy, spawn_key, spawned, pcg_state, inc, has_uint32, uinteger, index, block_size = state
+        sequence = np.random.SeedSequence(int(entropy), spawn_key=tuple(spawn_key), n_children_spawned=spawned)
+        rng = cls(block_size=block_size, seed_sequence=sequence)
+        rng._generator.bit_generator.state = {
+            'bit_generator': 'PCG64',
+            'state': {'state': int(pcg_state), 'inc': int(inc)},
+            'has_uint32': has_uint32,
+            'uinteger': uinteger,
+        }
+        # Redraw the block the saved stream was in and skip what it had used
+        rng._refill()
+        rng._index = index
+        return rng
+
+
+class GlobalRNG:
+    """BattleRNG's interface over the ``random`` module, for objects outside a Game."""
+
+    def random(self) -> float:
+        return random.random()
+
+    def randint(self, a: int, b: int) -> int:
+        return random.randint(a, b)
+
+    def uniform(self, a: float, b: float) -> float:
+        return random.uniform(a, b)
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        return random.choice(seq)
+
+    def spawn(self) -> 'GlobalRNG':
+        return self
+
+
+global_rng = GlobalRNG()
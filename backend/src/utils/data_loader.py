@@ -2,55 +2,138 @@ import re
 import json
 from typing import Dict, Any, List, Optional
 import os
+import threading
+import time
+
+from . import dataset_snapshot
+from .lookup_index import LookupIndex
+from .type_chart import TypeChart
 
 # Resolve data paths robustly
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(CURRENT_DIR)), 'data')
 DATASETS_DIR = os.path.join(DATA_DIR, 'datasets')
 
+class _LazyDataset:
+    """Non-data descriptor: the first access loads the dataset and stores it in
+    the instance __dict__, so later reads never come back through here."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance._materialize(self.name)
+
+
 class DataLoader:
-    def __init__(self):
-        self.moves_data = {}
-        self.moves_desc_data = {}
-        self.learnsets_data = {}
-        self.typechart_data = {}
-        self.abilities_data = {}
-        self.items_data = {}
-        self._load_all_data()
-    
-    def _load_all_data(self):
-        self._load_moves()
-        self._load_moves_descriptions()
-        self._load_learnsets()
-        self._load_typechart()
-        self._load_abilities()
-        self._load_items()
+    # Dataset attribute -> JSON loader. These are also the sections of the
+    # compiled snapshot (see tools/build_dataset_snapshot.py).
+    DATASETS = {
+        'moves_data': '_load_moves',
+        'moves_desc_data': '_load_moves_descriptions',
+        'learnsets_data': '_load_learnsets',
+        'typechart_data': '_load_typechart',
+        'abilities_data': '_load_abilities',
+        'items_data': '_load_items',
+        'pokedex_data': '_load_pokedex',
+    }
+
+    moves_data = _LazyDataset()
+    moves_desc_data = _LazyDataset()
+    learnsets_data = _LazyDataset()
+    typechart_data = _LazyDataset()
+    abilities_data = _LazyDataset()
+    items_data = _LazyDataset()
+    pokedex_data = _LazyDataset()
+
+    def __init__(self, use_snapshot: bool = True):
+        self.use_snapshot = use_snapshot
+        # dataset -> (seconds, "snapshot" | "json")
+        self.load_times: Dict[str, tuple] = {}
+        self._locks = {name: threading.Lock() for name in self.DATASETS}
+        self._indexes: Dict[str, LookupIndex] = {}
+        self._type_chart: Optional[TypeChart] = None
+
+    def _materialize(self, name: str):
+        with self._locks[name]:
+            if name not in self.__dict__:
+                started = time.perf_counter()
+                snapshot = dataset_snapshot.get_snapshot() if self.use_snapshot else None
+                if snapshot is not None and name in snapshot:
+                    data, source = snapshot.section(name), "snapshot"
+                else:
+                    data, source = getattr(self, self.DATASETS[name])(), "json"
+                self.__dict__[name] = data
+                self.load_times[name] = (time.perf_counter() - started, source)
+        return self.__dict__[name]
+
+    def _lookup_index(self, name: str) -> LookupIndex:
+        table = getattr(self, name)
+        index = self._indexes.get(name)
+        if index is None or index.table is not table:
+            with self._locks[name]:
+                index = self._indexes.get(name)
+                if index is None or index.table is not table:
+                    index = self._indexes[name] = LookupIndex(table)
+        return index
+
+    @property
+    def type_chart(self) -> TypeChart:
+        chart = self._type_chart
+        if chart is None or chart.source is not self.typechart_data:
+            chart = self._type_chart = TypeChart(self.typechart_data)
+        return chart
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self.__dict__
+
+    def preload(self, names: Optional[List[str]] = None) -> Dict[str, tuple]:
+        """Load every dataset (or just ``names``) now instead of on first use."""
+        for name in names or self.DATASETS:
+            getattr(self, name)
+        return dict(self.load_times)
+
+    def timing_report(self) -> str:
+        lines = []
+        for name in self.DATASETS:
+            if name in self.load_times:
+                seconds, source = self.load_times[name]
+                lines.append(f"  {name:<16} {seconds * 1000:7.1f} ms ({source})")
+            else:
+                lines.append(f"  {name:<16} not loaded")
+        total = sum(seconds for seconds, _ in self.load_times.values())
+        return "Dataset load times:\n" + "\n".join(lines) + f"\n  {'total':<16} {total * 1000:7.1f} ms"
     
     def _load_moves(self):
         try:
             moves_path = os.path.join(DATASETS_DIR, 'moves.json')
             with open(moves_path, 'r', encoding='utf-8') as f:
-                moves_data = json.load(f)
+                raw_moves = json.load(f)
             
-            for move_key, move_data in moves_data.items():
+            moves_data = {}
+            for move_key, move_data in raw_moves.items():
                 move_name = move_data.get('name', '').lower()
                 if not move_name:
                     continue
                 
-                self.moves_data[move_key.lower()] = move_data
+                moves_data[move_key.lower()] = move_data
                 clean_name = move_name.lower().replace(' ', '').replace('-', '')
                 if move_key.lower() != clean_name:
-                     self.moves_data[clean_name] = move_data
+                     moves_data[clean_name] = move_data
                 
-            pass
+            return moves_data
             
         except FileNotFoundError:
             print("Warning: moves.json file not found")
+            return {}
         except Exception as e:
             print(f"Error loading moves data: {e}")
             raise
     
     def _load_moves_descriptions(self):
+        moves_desc_data = {}
         try:
             desc_path = os.path.join(DATASETS_DIR, 'moves_desc.json')
             with open(desc_path, 'r', encoding='utf-8') as f:
@@ -83,7 +166,7 @@ class DataLoader:
                         if boost_match:
                             move_desc['boost'] = boost_match.group(1)
                         
-                        self.moves_desc_data[move_key.lower()] = move_desc
+                        moves_desc_data[move_key.lower()] = move_desc
                         
                     except Exception as e:
                         print(f"Warning: Failed to parse move description for {move_key}: {e}")
@@ -94,20 +177,24 @@ class DataLoader:
             print("Warning: moves_desc.json file not found")
         except Exception as e:
             print(f"Error loading move descriptions: {e}")
+        return moves_desc_data
     
     def _load_learnsets(self):
         try:
             learnsets_path = os.path.join(DATASETS_DIR, 'learnsets.json')
             with open(learnsets_path, 'r', encoding='utf-8') as f:
-                learnsets_data = json.load(f)
+                raw_learnsets = json.load(f)
             
-            for pokemon_name, data in learnsets_data.items():
+            learnsets_data = {}
+            for pokemon_name, data in raw_learnsets.items():
                 if 'learnset' in data:
                     moves = [move.lower() for move in data['learnset'].keys()]
-                    self.learnsets_data[pokemon_name.lower()] = moves
+                    learnsets_data[pokemon_name.lower()] = moves
+            return learnsets_data
             
         except FileNotFoundError:
             print("Warning: learnsets.json file not found")
+            return {}
         except Exception as e:
             print(f"Error loading learnset data: {e}")
             raise
@@ -116,7 +203,7 @@ class DataLoader:
         try:
             typechart_path = os.path.join(DATASETS_DIR, 'typechart.json')
             with open(typechart_path, 'r', encoding='utf-8') as f:
-                self.typechart_data = json.load(f)
+                return json.load(f)
             
         except FileNotFoundError:
             print("Warning: typechart.json file not found")
@@ -125,17 +212,17 @@ class DataLoader:
         except Exception as e:
             print(f"Error loading type chart data: {e}")
             raise
+        return {}
             
     def _load_abilities(self):
         try:
             abilities_path = os.path.join(DATASETS_DIR, 'abilities_logic.json')
             with open(abilities_path, 'r', encoding='utf-8') as f:
-                self.abilities_data = json.load(f)
-            
-            pass
+                return json.load(f)
             
         except FileNotFoundError:
             print("Warning: abilities_logic.json file not found")
+            return {}
         except Exception as e:
             print(f"Error loading abilities data: {e}")
             raise
@@ -144,16 +231,40 @@ class DataLoader:
         try:
             items_path = os.path.join(DATASETS_DIR, 'items_logic.json')
             with open(items_path, 'r', encoding='utf-8') as f:
-                self.items_data = json.load(f)
-            
-            pass
+                return json.load(f)
             
         except FileNotFoundError:
             print("Warning: items_logic.json file not found")
+            return {}
         except Exception as e:
             print(f"Error loading items data: {e}")
             raise
     
+    def _load_pokedex(self):
+        try:
+            pokedex_path = os.path.join(DATASETS_DIR, 'pokedex.json')
+            with open(pokedex_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+            
+        except FileNotFoundError:
+            print("Warning: pokedex.json file not found")
+            return {}
+        except Exception as e:
+            print(f"Error loading pokedex data: {e}")
+            raise
+    
+    def get_species(self, species_name: str) -> Optional[Dict[str, Any]]:
+        if not species_name:
+            return None
+        
+        species_key = re.sub(r'[^a-z0-9]', '', species_name.lower())
+        species = self.pokedex_data.get(species_key)
+        if species and 'baseStats' not in species and species.get('baseSpecies'):
+            # Cosmetic formes only list what differs from the base species
+            base = self.pokedex_data.get(re.sub(r'[^a-z0-9]', '', species['baseSpecies'].lower()), {})
+            species = {**base, **species}
+        return species
+    
     def get_item(self, item_name: str) -> Optional[Dict[str, Any]]:
         if not item_name:
             return None
@@ -224,26 +335,8 @@ class DataLoader:
     def get_type_effectiveness(self, attacking_type: str, defending_type: str) -> float:
         if not attacking_type or not defending_type:
             return 1.0
-            
-        attacking_type = attacking_type.title()
-        defending_type = defending_type.title()
-        
-        defending_data = self.typechart_data.get(defending_type, {})
-        damage_taken = defending_data.get('damageTaken', {})
-        
-        effectiveness_code = damage_taken.get(attacking_type, 0)
-        
-        multiplier = 1.0
-        if effectiveness_code == 0:
-            multiplier = 1.0
-        elif effectiveness_code == 1:
-            multiplier = 2.0
-        elif effectiveness_code == 2:
-            multiplier = 0.5
-        elif effectiveness_code == 3:
-            multiplier = 0.0
-            
-        return multiplier
+        chart = self.type_chart
+        return chart.matrix[chart.type_id(attacking_type)][chart.type_id(defending_type)]
     
     def get_move_power(self, move_name: str) -> int:
         move_data = self.get_move_data(move_name)
@@ -263,12 +356,8 @@ class DataLoader:
         if not move_type or not target_types:
             return 1.0, ""
             
-        effectiveness = 1.0
-        
-        for target_type in target_types:
-            effectiveness *= self.get_type_effectiveness(move_type, target_type)
-        
-        effectiveness = round(effectiveness, 2)
+        chart = self.type_chart
+        effectiveness = round(chart.against(chart.type_id(move_type), chart.type_ids(target_types)), 2)
         
         if effectiveness == 0:
             message = "It had no effect..."
@@ -299,15 +388,13 @@ class DataLoader:
         if move_key in self.moves_data:
             return self.moves_data[move_key]
             
-        for key, data in self.moves_data.items():
-            if data.get('name', '').lower() == move_name.lower():
-                return data
-                
-        for key, data in self.moves_data.items():
-            if move_name.lower() in key.lower() or move_name.lower() in data.get('name', '').lower():
-                return data
-                
-        return None
+        # Display name, alias, then first move whose id or name contains the text
+        index = self._lookup_index('moves_data')
+        return index.cached(
+            'move',
+            move_name,
+            lambda name: index.by_name(name) or index.by_alias(name) or index.search(name),
+        )
         
     def get_ability(self, ability_name: str) -> Optional[Dict[str, Any]]:
         if not ability_name:
@@ -326,11 +413,8 @@ class DataLoader:
         if move_key in self.moves_desc_data:
             return self.moves_desc_data[move_key]
             
-        for key, data in self.moves_desc_data.items():
-            if data.get('name', '').lower() == move_name.lower():
-                return data
-                
-        return None
+        index = self._lookup_index('moves_desc_data')
+        return index.cached('description', move_name, lambda name: index.by_name(name) or index.by_alias(name))
 
 # Global instance
 data_loader = DataLoader()
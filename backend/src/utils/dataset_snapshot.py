@@ -0,0 +1,159 @@
+import hashlib
+import os
+import pickle
+import struct
+import threading
+from typing import Any, Callable, Dict, Optional
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(CURRENT_DIR)), 'data')
+DATASETS_DIR = os.path.join(DATA_DIR, 'datasets')
+
+# Bump whenever a loader changes what it builds from the source files, so
+# snapshots compiled by older code are rejected even if the JSON is unchanged.
+SNAPSHOT_VERSION = 3
+SNAPSHOT_MAGIC = b"PKDS"
+SNAPSHOT_PATH = os.getenv("DATASET_SNAPSHOT_PATH", os.path.join(DATA_DIR, "datasets.snapshot"))
+
+SOURCE_FILES = [
+    "moves.json",
+    "moves_desc.json",
+    "learnsets.json",
+    "typechart.json",
+    "abilities_logic.json",
+    "abilities.json",
+    "items_logic.json",
+    "pokedex.json",
+]
+
+_HEADER = struct.Struct("<4sII")  # magic, version, index length
+
+
+def _file_hash(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_stamp(path: str):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class DatasetSnapshot:
+    """A compiled snapshot file: a small index followed by one pickle per section.
+
+    Sections are only unpickled when first requested, so a process that never
+    touches learnsets never pays for them.
+    """
+
+    def __init__(self, path: str, blob: bytes, data_start: int, index: Dict[str, Any]):
+        self.path = path
+        self._blob = memoryview(blob)
+        self._data_start = data_start
+        self._sections = index["sections"]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sections
+
+    def section(self, name: str) -> Any:
+        """Fresh copy of a section. Every call unpickles again, so callers never share mutable state."""
+        offset, length = self._sections[name]
+        start = self._data_start + offset
+        return pickle.loads(self._blob[start:start + length])
+
+
+def _sources_match(recorded: Dict[str, Any], datasets_dir: str) -> bool:
+    for filename in SOURCE_FILES:
+        entry = recorded.get(filename)
+        if entry is None:
+            return False
+        path = os.path.join(datasets_dir, filename)
+        # Matching size and mtime mean the file is the one that was hashed; otherwise
+        # (fresh checkout, touched file) fall back to comparing content hashes.
+        if entry["stamp"] is not None and entry["stamp"] == _file_stamp(path):
+            continue
+        if entry["sha256"] != _file_hash(path):
+            return False
+    return True
+
+
+def load_snapshot(path: str = SNAPSHOT_PATH, datasets_dir: str = DATASETS_DIR) -> Optional[DatasetSnapshot]:
+    """Open a snapshot if it exists, was built by this code version and matches the source files."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+        magic, version, index_length = _HEADER.unpack_from(blob)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            print(f"Warning: Dataset snapshot {path} has an old format, loading JSON instead")
+            return None
+        index = pickle.loads(blob[_HEADER.size:_HEADER.size + index_length])
+    except (OSError, struct.error, pickle.UnpicklingError, EOFError, ValueError) as e:
+        print(f"Warning: Could not read dataset snapshot {path}: {e}")
+        return None
+
+    if not _sources_match(index["sources"], datasets_dir):
+        print(f"Warning: Dataset snapshot {path} is stale, loading JSON instead")
+        return None
+    return DatasetSnapshot(path, blob, _HEADER.size + index_length, index)
+
+
+def write_snapshot(sections: Dict[str, Any], path: str = SNAPSHOT_PATH, datasets_dir: str = DATASETS_DIR) -> Dict[str, int]:
+    """Write ``sections`` atomically and return the pickled size of each one."""
+    sources = {
+        filename: {
+            "sha256": _file_hash(os.path.join(datasets_dir, filename)),
+            "stamp": _file_stamp(os.path.join(datasets_dir, filename)),
+        }
+        for filename in SOURCE_FILES
+    }
+    payloads = {name: pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL) for name, data in sections.items()}
+
+    offsets = {}
+    position = 0
+    for name, payload in payloads.items():
+        offsets[name] = (position, len(payload))
+        position += len(payload)
+    index_bytes = pickle.dumps({"sections": offsets, "sources": sources}, protocol=pickle.HIGHEST_PROTOCOL)
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for payload in payloads.values():
+            f.write(payload)
+    os.replace(temp_path, path)
+    return {name: len(payload) for name, payload in payloads.items()}
+
+
+_snapshot: Optional[DatasetSnapshot] = None
+_snapshot_loaded = False
+_snapshot_lock = threading.Lock()
+
+
+def get_snapshot() -> Optional[DatasetSnapshot]:
+    """Process-wide snapshot, opened and validated once."""
+    global _snapshot, _snapshot_loaded
+    if not _snapshot_loaded:
+        with _snapshot_lock:
+            if not _snapshot_loaded:
+                _snapshot = load_snapshot()
+                _snapshot_loaded = True
+    return _snapshot
+
+
+def load_section(name: str, fallback: Callable[[], Any]) -> Any:
+    """Section ``name`` from the snapshot, or ``fallback()`` when there is no valid snapshot."""
+    snapshot = get_snapshot()
+    if snapshot is not None and name in snapshot:
+        return snapshot.section(name)
+    return fallback()
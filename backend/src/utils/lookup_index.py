@@ -0,0 +1,99 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+NGRAM = 3
+_MISSING = object()
+
+
+def to_id(text: str) -> str:
+    return re.sub(r'[^a-z0-9]', '', text.lower())
+
+
+def _ngrams(text: str) -> Iterable[str]:
+    return (text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1))
+
+
+class LookupIndex:
+    """Multi-key index over a ``{key: record}`` table (moves, move descriptions).
+
+    Resolves the same way a scan of the table in insertion order would: by key,
+    by display name (first record wins), by alias, and by substring of a key or
+    name (first record containing the text wins). Substring queries are narrowed
+    with a trigram index, and every answer, including "not found", is kept in
+    a bounded LRU so repeated misses never rescan.
+    """
+
+    def __init__(self, table: Dict[str, Dict[str, Any]], max_cached: int = 4096):
+        self.table = table
+        self.max_cached = max_cached
+        self._entries: List[Dict[str, Any]] = []
+        self._texts: List[tuple] = []
+        self._names: Dict[str, Dict[str, Any]] = {}
+        self._aliases: Dict[str, Dict[str, Any]] = {}
+        self._ngrams: Dict[str, Set[int]] = {}
+        self._short: Dict[str, int] = {}
+        self._cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        for position, (key, record) in enumerate(table.items()):
+            key = key.lower()
+            name = record.get('name', '').lower()
+            self._entries.append(record)
+            self._texts.append((key, name))
+            self._names.setdefault(name, record)
+            for alias in (to_id(key), to_id(name)):
+                self._aliases.setdefault(alias, record)
+            for text in (key, name):
+                for gram in _ngrams(text):
+                    self._ngrams.setdefault(gram, set()).add(position)
+                # Queries shorter than an n-gram: remember the first record holding each piece.
+                for length in range(1, NGRAM):
+                    for i in range(len(text) - length + 1):
+                        self._short.setdefault(text[i:i + length], position)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.table.get(key)
+
+    def by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._names.get(name.lower())
+
+    def by_alias(self, text: str) -> Optional[Dict[str, Any]]:
+        return self._aliases.get(to_id(text))
+
+    def search(self, text: str) -> Optional[Dict[str, Any]]:
+        """First record (in table order) whose key or name contains ``text``."""
+        query = text.lower()
+        if len(query) < NGRAM:
+            position = self._short.get(query)
+            return self._entries[position] if position is not None else None
+
+        candidates = None
+        for gram in set(_ngrams(query)):
+            postings = self._ngrams.get(gram)
+            if not postings:
+                return None
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                return None
+        for position in sorted(candidates):
+            key, name = self._texts[position]
+            if query in key or query in name:
+                return self._entries[position]
+        return None
+
+    def cached(self, kind: str, text: str, resolve) -> Optional[Dict[str, Any]]:
+        """Memoize ``resolve(text)`` (hits and misses alike) under ``(kind, text)``."""
+        cache_key = (kind, text)
+        with self._lock:
+            result = self._cache.get(cache_key, _MISSING)
+            if result is not _MISSING:
+                self._cache.move_to_end(cache_key)
+                return result
+        result = resolve(text)
+        with self._lock:
+            self._cache[cache_key] = result
+            if len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return result
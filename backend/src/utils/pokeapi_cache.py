@@ -0,0 +1,237 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+import requests
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(CURRENT_DIR)), 'data')
+
+POKEAPI_BASE_URL = os.getenv('POKEAPI_BASE_URL', 'https://pokeapi.co/api/v2')
+CACHE_PATH = os.getenv('POKEAPI_CACHE_PATH', os.path.join(DATA_DIR, 'pokeapi_cache.sqlite3'))
+
+# PokeAPI data changes rarely; "not found" answers expire sooner in case the name gets added.
+DEFAULT_TTL = 30 * 24 * 3600
+NEGATIVE_TTL = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    path TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    body BLOB,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+
+
+class PokeAPICache:
+    """PokeAPI GETs backed by a SQLite file shared by every worker process.
+
+    Bodies are stored zlib-compressed. 200s live for ``ttl`` seconds and 404s
+    for ``negative_ttl``. Timeouts, connection errors and 5xx responses are
+    never stored, so a network blip doesn't hide a Pokemon until restart.
+    Concurrent misses on the same path in one process share one request.
+    If the SQLite file can't be used (locked, corrupt, read-only disk), the
+    error is logged and requests go straight to PokeAPI uncached.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, base_url: str = POKEAPI_BASE_URL,
+                 ttl: float = DEFAULT_TTL, negative_ttl: float = NEGATIVE_TTL, timeout: float = 5):
+        self.path = path
+        self.base_url = base_url.rstrip('/')
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.timeout = timeout
+        self.stats = {'hits': 0, 'negative_hits': 0, 'misses': 0, 'errors': 0, 'store_errors': 0}
+        self._local = threading.local()
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self._async_flights: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._session = requests.Session()
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute(_SCHEMA)
+            self._local.db = db
+        return db
+
+    def lookup(self, path: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """(found, data) from the store; expired rows and unreadable stores count as not found."""
+        try:
+            row = self._db().execute(
+                'SELECT status, body, expires_at FROM responses WHERE path = ?', (path,)
+            ).fetchone()
+            if row is None or row[2] <= time.time():
+                return False, None
+            status, body, _ = row
+            if status != 200:
+                return True, None
+            return True, json.loads(zlib.decompress(body))
+        except (sqlite3.Error, OSError, zlib.error, ValueError) as e:
+            self._store_error('read', path, e)
+            return False, None
+
+    def store(self, path: str, status: int, data: Optional[Dict[str, Any]] = None):
+        now = time.time()
+        body = zlib.compress(json.dumps(data, separators=(',', ':')).encode()) if data is not None else None
+        ttl = self.ttl if status == 200 else self.negative_ttl
+        try:
+            self._db().execute(
+                'INSERT OR REPLACE INTO responses (path, status, body, fetched_at, expires_at) VALUES (?, ?, ?, ?, ?)',
+                (path, status, body, now, now + ttl),
+            )
+        except (sqlite3.Error, OSError) as e:
+            self._store_error('write', path, e)
+
+    def _store_error(self, action: str, path: str, error: Exception):
+        self.stats['store_errors'] += 1
+        print(f"Warning: could not {action} {path} in the PokeAPI cache at {self.path}, continuing uncached: {error}")
+
+    def _fetch(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = self._session.get(f'{self.base_url}/{path}', timeout=self.timeout)
+        except requests.RequestException as e:
+            self.stats['errors'] += 1
+            print(f"PokeAPI request for {path} failed: {e}")
+            return None
+        return self._handle_response(path, response.status_code, response.json)
+
+    def get(self, path: str, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """JSON for ``{base_url}/{path}`` (e.g. ``pokemon/25``), or None if PokeAPI doesn't have it."""
+        path = path.strip('/').lower()
+        if not refresh:
+            found, data = self.lookup(path)
+            if found:
+                self.stats['hits' if data is not None else 'negative_hits'] += 1
+                return data
+
+        with self._flights_lock:
+            flight = self._flights.get(path)
+            leader = flight is None
+            if leader:
+                flight = self._flights[path] = _Flight()
+        if not leader:
+            flight.done.wait()
+            return flight.result
+
+        try:
+            self.stats['misses'] += 1
+            flight.result = self._fetch(path)
+        finally:
+            with self._flights_lock:
+                del self._flights[path]
+            flight.done.set()
+        return flight.result
+
+    def _handle_response(self, path: str, status_code: int, data_factory) -> Optional[Dict[str, Any]]:
+        if status_code == 200:
+            try:
+                data = data_factory()
+            except ValueError as e:
+                self.stats['errors'] += 1
+                print(f"PokeAPI returned invalid JSON for {path}: {e}")
+                return None
+            self.store(path, 200, data)
+            return data
+        if status_code == 404:
+            self.store(path, 404)
+        else:
+            self.stats['errors'] += 1
+        return None
+
+    async def _afetch(self, path: str, client: httpx.AsyncClient) -> Optional[Dict[str, Any]]:
+        try:
+            response = await client.get(f'{self.base_url}/{path}', timeout=self.timeout)
+        except httpx.HTTPError as e:
+            self.stats['errors'] += 1
+            print(f"PokeAPI request for {path} failed: {e}")
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._handle_response, path, response.status_code, response.json)
+
+    async def aget(self, path: str, client: httpx.AsyncClient, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """``get`` without blocking the event loop: SQLite work runs in the default executor, HTTP on ``client``."""
+        path = path.strip('/').lower()
+        loop = asyncio.get_running_loop()
+        if not refresh:
+            found, data = await loop.run_in_executor(None, self.lookup, path)
+            if found:
+                self.stats['hits' if data is not None else 'negative_hits'] += 1
+                return data
+
+        key = (id(loop), path)
+        flight = self._async_flights.get(key)
+        if flight is not None:
+            return await asyncio.shield(flight)
+
+        flight = self._async_flights[key] = loop.create_future()
+        try:
+            self.stats['misses'] += 1
+            result = await self._afetch(path, client)
+            flight.set_result(result)
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # waiters re-raise it; don't warn when there are none
+            raise
+        finally:
+            del self._async_flights[key]
+        return result
+
+    def purge_expired(self) -> int:
+        cursor = self._db().execute('DELETE FROM responses WHERE expires_at <= ?', (time.time(),))
+        return cursor.rowcount
+
+
+def warmup_names() -> List[str]:
+    """Every name in pokemon_ids.json and all_pokemon_names.json."""
+    names = {}
+    for filename in ('pokemon_ids.json', 'all_pokemon_names.json'):
+        try:
+            with open(os.path.join(DATA_DIR, filename), 'r') as f:
+                names.update(dict.fromkeys(json.load(f)))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: could not read {filename}: {e}")
+    return list(names)
+
+
+def warm(names: Iterable[str], cache: Optional[PokeAPICache] = None, workers: int = 8,
+         refresh: bool = False) -> Dict[str, int]:
+    """Fetch ``pokemon/{name}`` for every name into the cache; returns counts per outcome."""
+    cache = cache or pokeapi_cache
+    counts = {'cached': 0, 'fetched': 0, 'missing': 0, 'failed': 0}
+
+    def warm_one(name: str) -> str:
+        path = f'pokemon/{name.lower()}'
+        if not refresh and cache.lookup(path)[0]:
+            return 'cached'
+        if cache.get(path, refresh=refresh) is not None:
+            return 'fetched'
+        return 'missing' if cache.lookup(path)[0] else 'failed'
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for outcome in pool.map(warm_one, names):
+            counts[outcome] += 1
+    return counts
+
+
+pokeapi_cache = PokeAPICache()
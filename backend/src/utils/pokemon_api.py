@@ -1,23 +1,16 @@
-import requests
 from typing import Dict, Any, List, Optional
-from functools import lru_cache
 import os
-import json
 import re
 
+from .pokeapi_cache import pokeapi_cache
+from .species_store import load_pokemon_id_map, species_store
+
 # Resolve data path robustly
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DATA_DIR = os.path.join(BASE_DIR, 'data')
 
 # Load name-to-ID mapping
-POKEMON_ID_MAP = {}
-try:
-    id_map_path = os.path.join(DATA_DIR, 'pokemon_ids.json')
-    if os.path.exists(id_map_path):
-        with open(id_map_path, 'r') as f:
-            POKEMON_ID_MAP = json.load(f)
-except Exception:
-    pass
+POKEMON_ID_MAP = load_pokemon_id_map()
 
 # We import POKEAPI_NAME_MAP inside functions to avoid circular imports if needed, 
 # but here it's fine as long as we don't import pokemon_api from pokemon_utils.
@@ -111,9 +104,32 @@ def get_best_sprite(data, side='front', shiny=False):
     
     return url_pixel_static
 
-@lru_cache(maxsize=1000)
-def get_pokemon_data(pokemon_name):
-    """Fetch Pokemon data from PokeAPI with caching and name normalization."""
+def _form_candidates(api_name: str) -> List[str]:
+    # Common form patterns, then everything before the first hyphen (e.g. silvally-fairy -> silvally)
+    candidates = [
+        f"{api_name}-galar", f"{api_name}-alola", f"{api_name}-hisui",
+        f"{api_name}-origin", f"{api_name}-altered", f"{api_name}-single-strike",
+        f"{api_name}-amped", f"{api_name}-low-key"
+    ]
+    if '-' in api_name:
+        candidates.append(api_name.split('-')[0])
+    return candidates
+
+def _fetch_from_pokeapi(api_name: str, identifier: str):
+    # Goes through the shared on-disk cache, so each name hits the network at most once per TTL
+    data = pokeapi_cache.get(f'pokemon/{identifier}')
+    if data:
+        return data
+
+    for p_name in _form_candidates(api_name):
+        data = pokeapi_cache.get(f'pokemon/{p_name}')
+        if data:
+            return data
+
+    return None
+
+def _resolve_names(pokemon_name):
+    """(api_name, normalized_name) for a user-facing name."""
     # 1. Try normalizing to map (e.g. "Giratina Origin" -> "giratinaorigin" -> "giratina-origin")
     normalized_name = re.sub(r'[^a-z0-9]', '', pokemon_name.lower())
     api_name = POKEAPI_NAME_MAP.get(normalized_name, None)
@@ -123,43 +139,46 @@ def get_pokemon_data(pokemon_name):
         # Strip special chars like % and then check if it looks like a PokeAPI name
         cleaned_name = pokemon_name.lower().replace('%', '').strip()
         api_name = cleaned_name if '-' in cleaned_name else normalized_name
+    return api_name, normalized_name
 
-    # 3. Check for ID in our map (ID is more reliable)
+def _pokeapi_identifier(api_name, normalized_name):
+    # ID is more reliable than the name
     pokemon_id = POKEMON_ID_MAP.get(api_name) or POKEMON_ID_MAP.get(normalized_name)
-    identifier = str(pokemon_id) if pokemon_id else api_name
-
-    url = f'https://pokeapi.co/api/v2/pokemon/{identifier}'
-    try:
-        response = requests.get(url, timeout=5)
-        if response.status_code == 200:
-            return response.json()
-    except Exception:
-        pass
-        
-    # Try common form patterns if direct hit fails
-    patterns = [
-        f"{api_name}-galar", f"{api_name}-alola", f"{api_name}-hisui", 
-        f"{api_name}-origin", f"{api_name}-altered", f"{api_name}-single-strike",
-        f"{api_name}-amped", f"{api_name}-low-key"
-    ]
-    for p_name in patterns:
-        try:
-            res = requests.get(f'https://pokeapi.co/api/v2/pokemon/{p_name}', timeout=5)
-            if res.status_code == 200:
-                return res.json()
-        except:
-            continue
-            
-    # Final fallback: try stripping everything after the first hyphen (e.g. silvally-fairy -> silvally)
-    if '-' in api_name:
-        base_name = api_name.split('-')[0]
-        try:
-            res = requests.get(f'https://pokeapi.co/api/v2/pokemon/{base_name}', timeout=5)
-            if res.status_code == 200:
-                return res.json()
-        except:
-            pass
-            
+    return str(pokemon_id) if pokemon_id else api_name
+
+def get_local_pokemon_data(pokemon_name):
+    """Bundled species data for a name, or None if the pokedex doesn't know it."""
+    api_name, _ = _resolve_names(pokemon_name)
+    data = species_store.get(api_name) or species_store.get(pokemon_name)
+    if data:
+        return data
+    for candidate in _form_candidates(api_name):
+        data = species_store.get(candidate)
+        if data:
+            return data
+    return None
+
+def get_pokemon_data(pokemon_name):
+    """Species data in PokeAPI's shape, from the bundled pokedex; PokeAPI is only asked about unknown names."""
+    data = get_local_pokemon_data(pokemon_name)
+    if data:
+        return data
+
+    # 3. Not bundled: ask PokeAPI
+    api_name, normalized_name = _resolve_names(pokemon_name)
+    return _fetch_from_pokeapi(api_name, _pokeapi_identifier(api_name, normalized_name))
+
+async def get_pokemon_data_async(pokemon_name, client):
+    """``get_pokemon_data`` for async callers; unknown names are fetched with the given httpx client."""
+    data = get_local_pokemon_data(pokemon_name)
+    if data:
+        return data
+
+    api_name, normalized_name = _resolve_names(pokemon_name)
+    for identifier in [_pokeapi_identifier(api_name, normalized_name)] + _form_candidates(api_name):
+        data = await pokeapi_cache.aget(f'pokemon/{identifier}', client)
+        if data:
+            return data
     return None
 
 def get_forme_data(species_name: str, side='front', shiny=False):
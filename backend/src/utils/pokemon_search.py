@@ -0,0 +1,185 @@
+"""In-memory search over species names for /api/search-pokemon.
+
+Names are normalized to ids (lowercase letters and digits only, so
+"Mr. Mime", "mr-mime" and "mrmime" are the same key). The index holds:
+
+- every prefix of every id, each with its ranked list of species (a
+  flattened trie: one dict lookup answers a prefix query);
+- bigram and trigram postings for substring queries;
+- one precomputed result card per species (api name, display name, item,
+  moveset, has_sets).
+
+Ranking is exact match, then prefix matches, then other substring matches;
+within each group more popular species (more sets in gen8_stats_sets.json)
+come first. The index is built once, off the request path when possible,
+and rebuilt when the sets file changes; queries look for a change at most
+once every SETS_CHECK_INTERVAL seconds, so a keystroke is a pure in-memory
+lookup.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from ..models.moveset import get_strategic_moveset
+from .lookup_index import to_id
+from .pokemon_api import to_display_name
+from .pokemon_utils import POKEAPI_NAME_MAP, get_mandatory_item
+from .sets_database import BATTLE_ONLY_FORM_SUFFIXES, sets_database
+from .species_store import load_pokemon_id_map
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(CURRENT_DIR)), 'data')
+
+MAX_RESULTS = 15
+SETS_CHECK_INTERVAL = float(os.getenv('SEARCH_SETS_CHECK_INTERVAL', '5'))
+
+
+def comprehensive_names() -> List[str]:
+    """Battle-ready names, pokemon_ids.json and all_pokemon_names.json, without battle-only forms."""
+    names = set(sets_database.battle_ready_names())
+    names.update(load_pokemon_id_map())
+    try:
+        with open(os.path.join(DATA_DIR, 'all_pokemon_names.json'), 'r') as f:
+            names.update(json.load(f))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error loading PokeAPI names: {e}")
+
+    lower_suffixes = [s.lower() for s in BATTLE_ONLY_FORM_SUFFIXES]
+    return sorted(n for n in names if not any(n.lower().endswith(s) for s in lower_suffixes))
+
+
+def api_name(pokemon_name: str) -> str:
+    normalized = pokemon_name.lower().replace(' ', '').replace('-', '').replace('.', '')
+    return POKEAPI_NAME_MAP.get(normalized, pokemon_name.lower().replace(' ', '-').replace('.', ''))
+
+
+def popularity(pokemon_name: str) -> int:
+    """Sets listed for the species across all formats."""
+    return sum(len(sets) for sets in sets_database.sets_by_normalized_name(pokemon_name).values())
+
+
+def build_card(pokemon_name: str) -> Dict[str, Any]:
+    moveset = get_strategic_moveset(pokemon_name, debug=False)
+    return {
+        'name': api_name(pokemon_name),
+        'display_name': to_display_name(pokemon_name),
+        'item': get_mandatory_item(pokemon_name) or '',
+        'moveset': moveset[:4] if moveset else ['Tackle'],
+        'has_sets': bool(moveset),
+    }
+
+
+def _grams(text: str, n: int) -> Iterable[str]:
+    return (text[i:i + n] for i in range(len(text) - n + 1))
+
+
+class _Index:
+    def __init__(self, names: List[str], sets_version: int):
+        self.sets_version = sets_version
+        # One card per api name; the first spelling in sorted order builds it (as the old scan did)
+        keys_by_api: Dict[str, Set[str]] = {}
+        first_name: Dict[str, str] = {}
+        for name in names:
+            api = api_name(name)
+            first_name.setdefault(api, name)
+            key = to_id(name)
+            if key:
+                keys_by_api.setdefault(api, set()).add(key)
+
+        weights = {api: max(popularity(name) for name in (first_name[api], api)) for api in keys_by_api}
+        # Card position is its rank: most popular first, then alphabetical
+        ranked = sorted(keys_by_api, key=lambda api: (-weights[api], first_name[api].lower()))
+        self.cards: List[Dict[str, Any]] = [build_card(first_name[api]) for api in ranked]
+        self.keys: List[tuple] = [tuple(sorted(keys_by_api[api])) for api in ranked]
+
+        self.exact: Dict[str, int] = {}
+        prefixes: Dict[str, Set[int]] = {}
+        grams: Dict[str, Set[int]] = {}
+        for position, keys in enumerate(self.keys):
+            for key in keys:
+                self.exact.setdefault(key, position)
+                for end in range(1, len(key) + 1):
+                    prefixes.setdefault(key[:end], set()).add(position)
+                for n in (2, 3):
+                    for gram in _grams(key, n):
+                        grams.setdefault(gram, set()).add(position)
+        self.prefixes: Dict[str, List[int]] = {prefix: sorted(ids) for prefix, ids in prefixes.items()}
+        self.grams: Dict[str, frozenset] = {gram: frozenset(ids) for gram, ids in grams.items()}
+
+    def substring_matches(self, key: str) -> List[int]:
+        if len(key) <= 3:
+            return sorted(self.grams.get(key, ()))
+        candidates = None
+        for gram in set(_grams(key, 3)):
+            postings = self.grams.get(gram)
+            if not postings:
+                return []
+            candidates = postings if candidates is None else candidates & postings
+        return sorted(p for p in candidates if any(key in k for k in self.keys[p]))
+
+    def search(self, key: str, sets_only: bool, limit: int) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        seen: Set[int] = set()
+        exact = self.exact.get(key)
+        groups = ([exact] if exact is not None else [], self.prefixes.get(key, ()), None)
+        for group in groups:
+            if group is None:
+                # Substring matches are only worked out when exact and prefix ones don't fill the page
+                group = self.substring_matches(key)
+            for position in group:
+                if position in seen:
+                    continue
+                seen.add(position)
+                card = self.cards[position]
+                if sets_only and not card['has_sets']:
+                    continue
+                results.append(card)
+                if len(results) >= limit:
+                    return results
+        return results
+
+
+class PokemonSearchIndex:
+    def __init__(self, names_source: Callable[[], List[str]] = comprehensive_names,
+                 check_interval: float = SETS_CHECK_INTERVAL, clock=time.monotonic):
+        self.names_source = names_source
+        self.check_interval = check_interval
+        self.clock = clock
+        self._index: Optional[_Index] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def _current(self) -> _Index:
+        index = self._index
+        now = self.clock()
+        if index is not None and now < self._next_check:
+            return index
+        self._next_check = now + self.check_interval
+        # Re-reads the sets file if it changed, which bumps its version
+        sets_database.is_available()
+        if index is None or index.sets_version != sets_database.version:
+            with self._lock:
+                index = self._index
+                if index is None or index.sets_version != sets_database.version:
+                    index = self._index = _Index(self.names_source(), sets_database.version)
+        return index
+
+    def build(self):
+        self._current()
+
+    def warm(self):
+        """Build the index on a background thread."""
+        threading.Thread(target=self.build, name='pokemon-search-index', daemon=True).start()
+
+    def search(self, query: str, sets_only: bool = False, limit: int = MAX_RESULTS) -> List[Dict[str, Any]]:
+        """Result cards for ``query``; cards are shared, treat them as read-only."""
+        key = to_id(query)
+        if not key:
+            return []
+        return self._current().search(key, sets_only, limit)
+
+
+pokemon_search = PokemonSearchIndex()
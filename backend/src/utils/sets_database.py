@@ -0,0 +1,210 @@
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from .lookup_index import LookupIndex
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(CURRENT_DIR)), 'data')
+SETS_PATH = os.path.join(DATA_DIR, 'gen8_stats_sets.json')
+
+# Formats that typically only contain fully evolved/battle-ready Pokémon
+BATTLE_READY_FORMATS = [
+    'gen8ou',
+    'gen8ubers',
+    'gen8uu',
+    'gen8ru',
+    'gen8nu',
+    'gen8pu',
+    'gen8monotype'
+]
+
+# Forms that cannot be obtained/selected normally in a teambuilder (battle-only)
+BATTLE_ONLY_FORM_SUFFIXES = [
+    '-Mega', '-Mega-X', '-Mega-Y', '-Mega-Z',
+    '-Primal',
+    '-Complete',  # Zygarde-Complete
+    '-Power-Construct',  # Zygarde-Power-Construct
+    '-Eternamax',
+    '-Ultra',  # Necrozma-Ultra
+    '-Zen',  # Darmanitan-Zen
+    '-Pirouette',  # Meloetta-Pirouette
+    '-Blade',  # Aegislash-Blade
+    '-School',  # Wishiwashi-School
+    '-Gulping', '-Gorging',  # Cramorant
+    '-Noice',  # Eiscue
+    '-Hangry',  # Morpeko
+    '-Busted',  # Mimikyu-Busted
+    '-Gmax',  # Gigantamax
+    '-Totem',  # Totem Pokemon
+    '-Gliding-Build', '-Sprinting-Build', '-Swimming-Build', '-Limited-Build',  # Koraidon/Miraidon
+    '-Drive-Mode', '-Aquatic-Mode', '-Glide-Mode', '-Low-Power-Mode'  # Miraidon
+]
+
+
+def normalize_name(name: str) -> str:
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def _squash(name: str) -> str:
+    return name.lower().replace('-', '').replace(' ', '')
+
+
+class _FormatIndex:
+    """Lookup tables for one format's ``stats`` block."""
+
+    def __init__(self, stats: Dict[str, Dict[str, Any]]):
+        self.stats = stats
+        self.names = list(stats)
+        self.lower: Dict[str, str] = {}
+        self.squashed: Dict[str, str] = {}
+        self.default_moves: Dict[str, List[str]] = {}
+        for key, sets in stats.items():
+            self.lower.setdefault(key.lower(), key)
+            self.squashed.setdefault(_squash(key), key)
+            if sets:
+                first_set = next(iter(sets.values()))
+                moves = (first_set.get('moves') or [])[:4]
+                moves = [str(move).strip() for move in moves if move and str(move).strip()]
+                if moves:
+                    self.default_moves[key] = moves
+        self._substrings: Optional[LookupIndex] = None
+
+    def _index(self) -> LookupIndex:
+        # Built on first use; its bounded LRU also memoizes prefix_match, so user input can't grow it
+        if self._substrings is None:
+            self._substrings = LookupIndex({key: {'name': key} for key in self.stats})
+        return self._substrings
+
+    def contains_match(self, name: str) -> Optional[str]:
+        """First key (in file order) containing the name, case-insensitively."""
+        index = self._index()
+        match = index.cached('contains', name.lower(), index.search)
+        return match['name'] if match else None
+
+    def prefix_match(self, name: str) -> Optional[str]:
+        """First key (in file order) whose dash-free form starts with the dash-free name."""
+        return self._index().cached('prefix', name.lower().replace('-', ''), self._scan_prefix)
+
+    def _scan_prefix(self, query: str) -> Optional[str]:
+        return next((key for key in self.names if key.lower().replace('-', '').startswith(query)), None)
+
+
+class SetsDatabase:
+    """gen8_stats_sets.json loaded once and indexed.
+
+    The file is re-read when its mtime changes. Returned set dicts are shared
+    with the index; callers must treat them as read-only.
+    """
+
+    def __init__(self, path: str = SETS_PATH):
+        self.path = path
+        self.version = 0
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+        self.formats: Dict[str, _FormatIndex] = {}
+        self.by_name: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.battle_ready: List[str] = []
+
+    def _current_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh(self):
+        mtime = self._current_mtime()
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            self._load(mtime)
+
+    def _load(self, mtime):
+        data = {}
+        if mtime is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error loading {os.path.basename(self.path)}: {e}")
+                data = {}
+        if not isinstance(data, dict):
+            data = {}
+
+        formats = {}
+        by_name: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for format_name, format_data in data.items():
+            if not isinstance(format_data, dict) or not isinstance(format_data.get('stats'), dict):
+                continue
+            index = formats[format_name] = _FormatIndex(format_data['stats'])
+            for key, sets in index.stats.items():
+                if sets:
+                    by_name.setdefault(normalize_name(key), {}).setdefault(format_name, sets)
+
+        battle_ready = set()
+        for format_name in BATTLE_READY_FORMATS:
+            if format_name in formats:
+                battle_ready.update(
+                    name for name in formats[format_name].names
+                    if not any(name.endswith(suffix) for suffix in BATTLE_ONLY_FORM_SUFFIXES)
+                )
+
+        self.formats, self.by_name, self.battle_ready = formats, by_name, sorted(battle_ready)
+        self._mtime = mtime
+        self.version += 1
+
+    def is_available(self) -> bool:
+        self._refresh()
+        return self._mtime is not None
+
+    def format_index(self, format_name: str) -> Optional[_FormatIndex]:
+        self._refresh()
+        return self.formats.get(format_name)
+
+    def battle_ready_names(self) -> List[str]:
+        self._refresh()
+        return list(self.battle_ready)
+
+    def sets_by_normalized_name(self, pokemon_name: str) -> Dict[str, Dict[str, Any]]:
+        """``{format: sets}`` for the Pokemon whose normalized name matches exactly."""
+        self._refresh()
+        return self.by_name.get(normalize_name(pokemon_name), {})
+
+    def all_sets(self, pokemon_name: str) -> Dict[str, Dict[str, Any]]:
+        """``{format: sets}`` across every format (exact, case-insensitive, then substring match)."""
+        self._refresh()
+        lowered = pokemon_name.lower()
+        result = {}
+        for format_name, index in self.formats.items():
+            if 'urshifu' in lowered:
+                key = 'Urshifu-Rapid-Strike' if 'rapid' in lowered else 'Urshifu'
+            elif pokemon_name in index.stats:
+                key = pokemon_name
+            else:
+                key = index.lower.get(lowered) or index.contains_match(lowered)
+            sets = index.stats.get(key) if key else None
+            if sets:
+                result[format_name] = sets
+        return result
+
+    def default_moves(self, pokemon_name: str, format_name: str) -> Optional[List[str]]:
+        """First four moves of the first set in ``format_name`` (exact, normalized, then prefix match)."""
+        index = self.format_index(format_name)
+        if index is None:
+            return None
+        lowered = pokemon_name.lower()
+        if 'urshifu' in lowered:
+            key = 'Urshifu-Rapid-Strike' if 'rapid' in lowered else 'Urshifu'
+        elif pokemon_name in index.stats:
+            key = pokemon_name
+        else:
+            key = index.squashed.get(_squash(pokemon_name)) or index.prefix_match(pokemon_name)
+        moves = index.default_moves.get(key) if key else None
+        return list(moves) if moves else None
+
+
+sets_database = SetsDatabase()
@@ -0,0 +1,161 @@
+import json
+import os
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+from .data_loader import data_loader
+from .pokemon_utils import POKEAPI_NAME_MAP
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(CURRENT_DIR)), 'data')
+
+CRY_URL = "https://raw.githubusercontent.com/PokeAPI/cries/main/cries/pokemon/latest/{}.ogg"
+
+# Showdown baseStats keys -> PokeAPI stat names, in PokeAPI order
+STAT_NAMES = [
+    ('hp', 'hp'),
+    ('atk', 'attack'),
+    ('def', 'defense'),
+    ('spa', 'special-attack'),
+    ('spd', 'special-defense'),
+    ('spe', 'speed'),
+]
+
+
+def _ascii(name: str) -> str:
+    # Fold accents and gender signs so 'Flabébé' and 'Nidoran♀' match 'flabebe' and 'nidoranf'
+    name = name.replace('♀', '-f').replace('♂', '-m')
+    return unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+
+
+def to_id(name: str) -> str:
+    name = _ascii(name)
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def _slug(name: str) -> str:
+    """PokeAPI-style name for a display name (e.g. 'Mr. Mime' -> 'mr-mime')."""
+    name = re.sub(r"[.'’:%]", '', _ascii(name).lower())
+    return re.sub(r'[^a-z0-9]+', '-', name).strip('-')
+
+
+def load_pokemon_id_map() -> Dict[str, int]:
+    try:
+        with open(os.path.join(DATA_DIR, 'pokemon_ids.json'), 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+class SpeciesStore:
+    """PokeAPI-shaped species records built from the bundled pokedex.
+
+    Records carry the fields the battle code reads from a ``/pokemon/{name}``
+    response (``id``, ``name``, ``types``, ``stats``, ``abilities``, ``cries``,
+    ``height``, ``weight``) and are keyed by their PokeAPI name, so existing
+    name handling keeps working. Built once on first use; records are shared
+    and must be treated as read-only.
+    """
+
+    def __init__(self, pokedex: Optional[Dict[str, Dict]] = None, id_map: Optional[Dict[str, int]] = None):
+        self._pokedex = pokedex
+        self._id_map = id_map
+        self._lock = threading.Lock()
+        self._records: Optional[Dict[str, Dict[str, Any]]] = None
+        self._aliases: Dict[str, str] = {}
+
+    def _build(self):
+        pokedex = self._pokedex if self._pokedex is not None else data_loader.pokedex_data
+        id_map = self._id_map if self._id_map is not None else load_pokemon_id_map()
+        api_names_by_id = {}
+        for api_name in id_map:
+            api_names_by_id.setdefault(to_id(api_name), api_name)
+
+        records, aliases = {}, {}
+        for key, species in pokedex.items():
+            if 'baseStats' not in species and species.get('baseSpecies'):
+                # Cosmetic formes only list what differs from the base species
+                species = {**pokedex.get(to_id(species['baseSpecies']), {}), **species}
+            if not species.get('baseStats') or not species.get('types'):
+                continue
+
+            api_name = self._api_name(key, species, api_names_by_id)
+            if api_name not in records:
+                records[api_name] = self._record(api_name, species, id_map)
+            for alias in (key, to_id(api_name)):
+                aliases.setdefault(alias, api_name)
+
+        for short_name, api_name in POKEAPI_NAME_MAP.items():
+            if api_name in records:
+                aliases.setdefault(short_name, api_name)
+        self._records, self._aliases = records, aliases
+
+    @staticmethod
+    def _api_name(key: str, species: Dict[str, Any], api_names_by_id: Dict[str, str]) -> str:
+        if key in POKEAPI_NAME_MAP:
+            return POKEAPI_NAME_MAP[key]
+        # PokeAPI names the default forme explicitly (landorus-incarnate, urshifu-single-strike)
+        if species.get('baseForme') and not species.get('forme'):
+            api_name = api_names_by_id.get(key + to_id(species['baseForme']))
+            if api_name:
+                return api_name
+        return api_names_by_id.get(key) or _slug(species['name'])
+
+    @staticmethod
+    def _record(api_name: str, species: Dict[str, Any], id_map: Dict[str, int]) -> Dict[str, Any]:
+        pokemon_id = id_map.get(api_name) or species.get('num', 0)
+        abilities: List[Dict[str, Any]] = []
+        for slot, ability in sorted(species.get('abilities', {}).items(), key=lambda item: item[0] == 'H'):
+            abilities.append({
+                'ability': {'name': _slug(ability)},
+                'is_hidden': slot == 'H',
+                'slot': len(abilities) + 1,
+            })
+        base_stats = species['baseStats']
+        return {
+            'id': pokemon_id,
+            'name': api_name,
+            'species_name': species['name'],
+            'types': [{'slot': slot, 'type': {'name': name.lower()}} for slot, name in enumerate(species['types'], 1)],
+            'stats': [
+                {'base_stat': base_stats.get(short, 0), 'effort': 0, 'stat': {'name': name}}
+                for short, name in STAT_NAMES
+            ],
+            'abilities': abilities,
+            'cries': {'latest': CRY_URL.format(pokemon_id) if pokemon_id > 0 else ''},
+            'height': round(species.get('heightm', 0) * 10),
+            'weight': round(species.get('weightkg', 0) * 10),
+        }
+
+    def is_loaded(self) -> bool:
+        return self._records is not None
+
+    @property
+    def records(self) -> Dict[str, Dict[str, Any]]:
+        if self._records is None:
+            with self._lock:
+                if self._records is None:
+                    self._build()
+        return self._records
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Record for a PokeAPI name, Showdown id or display name."""
+        if not name:
+            return None
+        records = self.records
+        record = records.get(name.lower())
+        if record is None:
+            api_name = self._aliases.get(to_id(name))
+            record = records.get(api_name) if api_name else None
+        return record
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+species_store = SpeciesStore()
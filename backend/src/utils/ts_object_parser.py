@@ -0,0 +1,269 @@
+"""Single-pass reader for the object-literal syntax used by the Showdown data files.
+
+Handles what appears in ``moves_desc.json``, ``moves.ts``, ``abilities.ts`` and
+``items.ts``: unquoted or quoted keys, single/double quoted strings, numbers,
+booleans, null, arrays, nested objects, trailing commas and comments. Methods
+(``onBasePower(...) {...}``) and other code-valued entries are skipped, so the
+result is the plain data of each entry. A key that appears twice in one object
+keeps its first value, as DataLoader's regex loader does for moves_desc.json.
+"""
+
+import json
+import re
+from typing import Any, Dict, Optional
+
+_SKIP = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.S)
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+_NUMBER = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_DOUBLE = re.compile(r'"((?:[^"\\\n]|\\.)*)"', re.S)
+_SINGLE = re.compile(r"'((?:[^'\\\n]|\\.)*)'", re.S)
+_TEMPLATE = re.compile(r'`(?:[^`\\]|\\.)*`', re.S)
+# Everything that can change nesting depth or hide a bracket inside code.
+_CODE_TOKEN = re.compile(r'[{}()\[\],"\'`]|//|/\*')
+_ESCAPE = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)', re.S)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+# Data-only literals are rewritten into JSON with regex passes over the text
+# between double quoted strings: drop comments, re-quote single quoted strings,
+# quote bare keys, drop trailing commas.
+_DOUBLE_SPLIT = re.compile(r'("[^"\\\n]*(?:\\.[^"\\\n]*)*")')
+_COMMENT = re.compile(r'//[^\n]*|/\*.*?\*/', re.S)
+_BARE_KEY = re.compile(r'([A-Za-z_$][\w$]*|\d+)(?=\s*:)')
+_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+_SINGLE_QUOTED = re.compile(r"'((?:[^'\\\n]|\\.)*)'")
+
+
+def _first_wins(pairs):
+    result = dict(pairs)
+    if len(result) != len(pairs):
+        result = {}
+        for key, value in pairs:
+            result.setdefault(key, value)
+    return result
+
+
+_JSON_DECODER = json.JSONDecoder(object_pairs_hook=_first_wins)
+
+_LITERALS = {"true": True, "false": False, "null": None, "undefined": None}
+_OPENERS = {"{": "}", "(": ")", "[": "]"}
+
+
+class TSParseError(ValueError):
+    pass
+
+
+def _unescape(raw: str) -> str:
+    if "\\" not in raw:
+        return raw
+
+    def replace(match):
+        escape = match.group(1)
+        if escape[0] in "ux" and len(escape) > 1:
+            return chr(int(escape[1:], 16))
+        return _ESCAPES.get(escape, escape)
+
+    return _ESCAPE.sub(replace, raw)
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message: str):
+        line = self.text.count("\n", 0, self.pos) + 1
+        raise TSParseError(f"{message} at line {line}")
+
+    def skip(self) -> str:
+        self.pos = _SKIP.match(self.text, self.pos).end()
+        return self.text[self.pos:self.pos + 1]
+
+    def string(self) -> Optional[str]:
+        pattern = _DOUBLE if self.text[self.pos] == '"' else _SINGLE
+        match = pattern.match(self.text, self.pos)
+        if not match:
+            self.error("Unterminated string")
+        self.pos = match.end()
+        return _unescape(match.group(1))
+
+    def key(self) -> str:
+        char = self.text[self.pos]
+        if char in "\"'":
+            return self.string()
+        match = _IDENT.match(self.text, self.pos) or _NUMBER.match(self.text, self.pos)
+        if not match:
+            self.error(f"Unexpected {char!r} where a key was expected")
+        self.pos = match.end()
+        return match.group(0)
+
+    def object(self) -> Dict[str, Any]:
+        self.pos += 1  # {
+        result = {}
+        while True:
+            char = self.skip()
+            if char == "}":
+                self.pos += 1
+                return result
+            if char == ",":
+                self.pos += 1
+                continue
+            if self.text.startswith("...", self.pos):
+                self.skip_code()
+                continue
+
+            key = self.key()
+            char = self.skip()
+            if char == "(" or char == "<":
+                # Method shorthand: name(args) { body }
+                self.skip_code()
+                continue
+            if char != ":":
+                self.error(f"Expected ':' after {key!r}")
+            self.pos += 1
+            self.skip()
+            value, is_data = self.value()
+            if is_data:
+                result.setdefault(key, value)
+
+    def array(self) -> list:
+        self.pos += 1  # [
+        result = []
+        while True:
+            char = self.skip()
+            if char == "]":
+                self.pos += 1
+                return result
+            if char == ",":
+                self.pos += 1
+                continue
+            value, is_data = self.value()
+            if is_data:
+                result.append(value)
+
+    def value(self):
+        """Parse one value; returns (value, is_data). Code-valued entries come back with is_data False."""
+        char = self.text[self.pos:self.pos + 1]
+        if char == "{":
+            return self.object(), True
+        if char == "[":
+            return self.array(), True
+        if char in "\"'":
+            value = self.string()
+            if self.skip() not in ",}]":
+                self.skip_code()
+                return None, False
+            return value, True
+
+        match = _NUMBER.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            text = match.group(0)
+            if self.skip() not in ",}]":
+                self.skip_code()
+                return None, False
+            return (float(text) if any(c in text for c in ".eE") else int(text)), True
+
+        match = _IDENT.match(self.text, self.pos)
+        if match and match.group(0) in _LITERALS:
+            self.pos = match.end()
+            if self.skip() in ",}]":
+                return _LITERALS[match.group(0)], True
+
+        # Functions, arrow functions, references, expressions.
+        self.skip_code()
+        return None, False
+
+    def skip_code(self):
+        """Skip to the ',' or closing bracket that ends the current entry."""
+        depth = 0
+        text = self.text
+        while True:
+            match = _CODE_TOKEN.search(text, self.pos)
+            if not match:
+                self.pos = len(text)
+                return
+            token = match.group(0)
+            self.pos = match.start()
+            if token in _OPENERS:
+                depth += 1
+                self.pos += 1
+            elif token in "}])":
+                if depth == 0:
+                    return
+                depth -= 1
+                self.pos += 1
+                if depth == 0 and token == "}" and self._ends_entry():
+                    return
+            elif token == ",":
+                if depth == 0:
+                    return
+                self.pos += 1
+            elif token in "\"'":
+                pattern = _DOUBLE if token == '"' else _SINGLE
+                string = pattern.match(text, self.pos)
+                self.pos = string.end() if string else self.pos + 1
+            elif token == "`":
+                template = _TEMPLATE.match(text, self.pos)
+                self.pos = template.end() if template else self.pos + 1
+            else:
+                self.pos = _SKIP.match(text, self.pos).end()
+
+    def _ends_entry(self) -> bool:
+        # A method body closes the entry unless something like `.call(...)` follows.
+        return self.skip() in (",", "}", "")
+
+
+def _data_literal_to_json(text: str) -> Optional[str]:
+    parts = _DOUBLE_SPLIT.split(text)
+    code = "\0".join(parts[0::2])
+    if "`" in code or "\0" in text:
+        return None
+    code = _COMMENT.sub("", code)
+    if "'" in code:
+        code = _SINGLE_QUOTED.sub(lambda match: json.dumps(_unescape(match.group(1))), code)
+    pieces = _BARE_KEY.split(code)
+    pieces[1::2] = [f'"{key}"' for key in pieces[1::2]]
+    code = "".join(pieces)
+    code = _TRAILING_COMMA.sub(r"\1", code)
+    parts[0::2] = code.split("\0")
+    return "".join(parts)
+
+
+def parse_ts_object(text: str) -> Dict[str, Any]:
+    """Parse the first top-level object literal in ``text`` (after ``= `` when it is an export)."""
+    start = text.find("= {")
+    start = start + 2 if start != -1 else text.find("{")
+    if start == -1:
+        raise TSParseError("No object literal found")
+
+    # Pure data (moves_desc.json) converts straight to JSON and goes through the C
+    # decoder; anything with code in it fails to decode and takes the full parser.
+    converted = _data_literal_to_json(text[start:])
+    if converted is not None:
+        try:
+            return _JSON_DECODER.raw_decode(converted)[0]
+        except ValueError:
+            pass
+
+    parser = _Parser(text)
+    parser.pos = start
+    return parser.object()
+
+
+def load_ts_object(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_ts_object(f.read())
+
+
+DESCRIPTION_FIELDS = ("name", "desc", "shortDesc", "boost")
+
+
+def load_descriptions(path: str) -> Dict[str, Dict[str, str]]:
+    """``{id: {name, desc, shortDesc, boost}}`` records; empty or missing fields are left out."""
+    records = {}
+    for key, entry in load_ts_object(path).items():
+        if isinstance(entry, dict):
+            records[key.lower()] = {
+                field: entry[field] for field in DESCRIPTION_FIELDS if isinstance(entry.get(field), str) and entry[field]
+            }
+    return records
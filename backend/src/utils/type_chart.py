@@ -0,0 +1,73 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# damageTaken codes in typechart.json
+_MULTIPLIERS = {0: 1.0, 1: 2.0, 2: 0.5, 3: 0.0}
+
+
+class TypeChart:
+    """The type chart compiled to integer ids.
+
+    ``matrix[attacking][defending]`` is a plain nested list; ``dual`` holds
+    every attacking type against every mono/dual typing, so a Pokemon's
+    interned ``type_ids`` resolve in one index. Id ``NONE`` (one past the last
+    real type) stands for "no second type" and for unknown types, and is
+    always neutral, like ``DataLoader.get_type_effectiveness`` on unknown input.
+    """
+
+    def __init__(self, typechart_data: Dict[str, Dict]):
+        self.source = typechart_data
+        self.types: List[str] = sorted(name.lower() for name in typechart_data)
+        self.NONE = len(self.types)
+        self._ids: Dict[str, int] = {}
+        for type_id, name in enumerate(self.types):
+            for spelling in (name, name.title(), name.upper()):
+                self._ids[spelling] = type_id
+
+        size = self.NONE + 1
+        self.matrix: List[List[float]] = [[1.0] * size for _ in range(size)]
+        for defending_id, defending in enumerate(self.types):
+            damage_taken = typechart_data.get(defending.title(), {}).get('damageTaken', {})
+            for attacking_id, attacking in enumerate(self.types):
+                self.matrix[attacking_id][defending_id] = _MULTIPLIERS.get(damage_taken.get(attacking.title(), 0), 1.0)
+
+        # dual[attacking][first][second]; mono types use second == NONE
+        self.dual: List[List[List[float]]] = [
+            [[row[first] * row[second] for second in range(size)] for first in range(size)]
+            for row in self.matrix
+        ]
+        self._array = None
+
+    def type_id(self, name: Optional[str]) -> int:
+        if not name:
+            return self.NONE
+        type_id = self._ids.get(name)
+        if type_id is None:
+            type_id = self._ids.get(str(name).lower(), self.NONE)
+        return type_id
+
+    def type_ids(self, names: Iterable[str]) -> Tuple[int, ...]:
+        ids = tuple(self.type_id(name) for name in names or ())
+        return ids or (self.NONE,)
+
+    def effectiveness(self, attacking_id: int, defending_id: int) -> float:
+        return self.matrix[attacking_id][defending_id]
+
+    def against(self, attacking_id: int, defending_ids: Tuple[int, ...]) -> float:
+        """Multiplier of an attacking type against a whole typing."""
+        if len(defending_ids) == 2:
+            return self.dual[attacking_id][defending_ids[0]][defending_ids[1]]
+        if len(defending_ids) == 1:
+            return self.matrix[attacking_id][defending_ids[0]]
+        row = self.matrix[attacking_id]
+        multiplier = 1.0
+        for defending_id in defending_ids:
+            multiplier *= row[defending_id]
+        return multiplier
+
+    @property
+    def array(self):
+        """NumPy view of ``matrix`` (imported on first use)."""
+        if self._array is None:
+            import numpy as np
+            self._array = np.array(self.matrix, dtype=np.float64)
+        return self._array
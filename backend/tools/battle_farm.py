@@ -0,0 +1,52 @@
+"""Run large numbers of AI-vs-AI battles on random teams across worker processes.
+
+    python tools/battle_farm.py --out results.csv --battles 100000 [--policies ai random]
+                                [--start-seed N] [--team-size N] [--workers N] [--chunk N]
+
+Writes one row per battle (winner, turns, remaining Pokemon, teams, damage
+dealt and move usage per side) to a .csv file, or to a directory of Parquet
+files for any other --out (needs pyarrow). Run the same command again after a
+crash or Ctrl-C to resume from the checkpoint next to the output.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.battle_farm import POLICIES, FarmError, run_farm  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out', required=True, help='results .csv file, or a directory for Parquet parts')
+    parser.add_argument('--battles', type=int, default=1000)
+    parser.add_argument('--start-seed', type=int, default=0)
+    parser.add_argument('--policies', nargs=2, choices=sorted(POLICIES), default=['ai', 'random'],
+                        metavar=('A', 'B'), help=f"policies to pit against each other ({', '.join(sorted(POLICIES))})")
+    parser.add_argument('--team-size', type=int, default=6)
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--chunk', type=int, default=50, help='battles per task and per checkpoint')
+    parser.add_argument('--progress-every', type=float, default=10.0, help='seconds between progress lines')
+    args = parser.parse_args()
+
+    seeds = range(args.start_seed, args.start_seed + args.battles)
+    try:
+        totals = run_farm(args.out, seeds, *args.policies, team_size=args.team_size, workers=args.workers,
+                          chunk_size=args.chunk, progress_every=args.progress_every)
+    except FarmError as e:
+        parser.exit(1, f"battle_farm: {e}\n")
+    except KeyboardInterrupt:
+        parser.exit(130, "\nInterrupted; run the same command to resume.\n")
+
+    battles = totals.get('battles', 0)
+    for policy in sorted(set(args.policies)) + ['draw']:
+        wins = totals.get('wins:' + policy, 0)
+        print(f"{policy:>8}: {wins:8,} ({wins / battles:.1%})" if battles else f"{policy:>8}: 0")
+    if battles:
+        print(f"mean turns: {totals['turns'] / battles:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Game copies per second: Game.clone() vs copy.deepcopy and a snapshot round trip.
+
+    python tools/bench_clone.py [--games N] [--turns N] [--seconds S] [--seed N]
+
+Plays --games random-team battles --turns turns in (so there are statuses,
+used PP and side conditions to copy), then copies them round-robin for about
+--seconds each way: Game.clone(), copy.deepcopy(game), and
+load_game(dump_game(game)).
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.battle_state import dump_game, load_game  # noqa: E402
+from src.core.game import Game  # noqa: E402
+from src.core.simulation import _player_switch, random_team  # noqa: E402
+
+
+def played_game(seed: int, turns: int) -> Game:
+    game = Game(headless=True, seed=seed)
+    game.start_battle(random_team(), random_team())
+    for _ in range(turns):
+        if game.battle_over:
+            break
+        if game.pending_player_self_switch or game.player_pokemon.is_fainted():
+            game.process_turn(switch_index=_player_switch(game, game.ai))
+            continue
+        move_name, _ = game.ai.select_move(game.player_pokemon, game.opponent_pokemon, game.weather)
+        game.process_turn(move_name=move_name)
+    return game
+
+
+def run(label, copy_game, games, seconds):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for game in games:
+            copy_game(game)
+        count += len(games)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>10}: {count / elapsed:9.0f} copies/s  {elapsed / count * 1e6:8.1f} us/copy")
+    return count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=10)
+    parser.add_argument('--turns', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    games = [played_game(args.seed + i, args.turns) for i in range(args.games)]
+
+    clone = run('clone', Game.clone, games, args.seconds)
+    deep = run('deepcopy', copy.deepcopy, games, args.seconds)
+    snapshot = run('snapshot', lambda game: load_game(dump_game(game)), games, args.seconds)
+    print(f"clone is {clone / deep:.1f}x deepcopy, {clone / snapshot:.1f}x a snapshot round trip")
+
+
+if __name__ == '__main__':
+    main()
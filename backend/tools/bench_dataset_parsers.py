@@ -0,0 +1,51 @@
+"""Load-time comparison: DataLoader's regex parse of moves_desc.json vs. the TS object tokenizer.
+
+    python tools/bench_dataset_parsers.py [--repeat 5]
+
+Also times the tokenizer on moves.ts, abilities.ts and items.ts. The regex
+loader is still the faster one on moves_desc.json, so DataLoader keeps it.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.data_loader import DATASETS_DIR, DataLoader  # noqa: E402
+from src.utils.ts_object_parser import load_descriptions, load_ts_object  # noqa: E402
+
+
+def best_of(repeat: int, fn, *args):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    desc_path = os.path.join(DATASETS_DIR, "moves_desc.json")
+    legacy_seconds, legacy = best_of(args.repeat, DataLoader()._load_moves_descriptions)
+    new_seconds, new = best_of(args.repeat, load_descriptions, desc_path)
+    print(f"moves_desc.json  regex loader: {legacy_seconds * 1000:8.1f} ms  ({len(legacy)} records)")
+    print(f"moves_desc.json  tokenizer:    {new_seconds * 1000:8.1f} ms  ({len(new)} records)")
+    print(f"speedup: {legacy_seconds / new_seconds:.1f}x")
+    changed = sorted(key for key in legacy if key in new and legacy[key] != new[key])
+    missing = sorted(set(new) - set(legacy))
+    print(f"records the regex loader missed: {len(missing)}  records that differ: {len(changed)}")
+
+    for filename in ("moves.ts", "abilities.ts", "items.ts"):
+        seconds, table = best_of(args.repeat, load_ts_object, os.path.join(DATASETS_DIR, filename))
+        print(f"{filename:<16} tokenizer:    {seconds * 1000:8.1f} ms  ({len(table)} entries)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Bytes per /api/move turn: full team payloads vs state deltas.
+
+    python tools/bench_move_payload.py [--battles N] [--turns N] [--seed N]
+
+Plays the same seeded random 6v6 battles twice in-process, once with the
+full response and once as a delta client ({"delta": true, "ack_version"}),
+and prints mean JSON bytes per turn, raw and gzipped.
+"""
+
+import argparse
+import gzip
+import os
+import random
+import statistics
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.core.battle_sessions import battle_sessions  # noqa: E402
+from src.core.fastapi_server import app  # noqa: E402
+
+
+def next_action(game) -> dict:
+    """Same policy in both modes: switch to the first healthy Pokemon when needed, else a random move."""
+    if game.pending_player_self_switch or game.player_pokemon.is_fainted():
+        for i, pokemon in enumerate(game.player_team):
+            if not pokemon.is_fainted() and pokemon is not game.player_pokemon:
+                return {"switch_index": i}
+    return {"move": random.choice(list(game.player_pokemon.moves))}
+
+
+def play(client: TestClient, battles: int, turns: int, seed: int, delta: bool):
+    raw, packed = [], []
+    for battle in range(battles):
+        random.seed(seed + battle)
+        start = client.post("/api/start", json={"team": "random", "opponent": "random", "mode": "6v6"}).json()
+        game = battle_sessions.get(start["battle_id"]).game
+        ack_version = None  # a delta client gets the full state on its first turn
+        for _ in range(turns):
+            if game.battle_over:
+                break
+            body = {"battle_id": start["battle_id"], **next_action(game)}
+            if delta:
+                body.update(delta=True, ack_version=ack_version)
+            response = client.post("/api/move", json=body)
+            raw.append(len(response.content))
+            packed.append(len(gzip.compress(response.content)))
+            ack_version = response.json()["state_version"]
+    return raw, packed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--battles", type=int, default=5)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    results = {}
+    for label, delta in (("full", False), ("delta", True)):
+        raw, packed = play(client, args.battles, args.turns, args.seed, delta)
+        results[label] = (statistics.mean(raw), statistics.mean(packed), len(raw))
+
+    for label, (raw, packed, count) in results.items():
+        print(f"{label:>5}: {raw:8.0f} B/turn  {packed:7.0f} B/turn gzipped  ({count} turns)")
+    full, delta = results["full"], results["delta"]
+    print(f"delta is {full[0] / delta[0]:.1f}x smaller raw, {full[1] / delta[1]:.1f}x gzipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Battles per second: headless simulate() vs the interactive turn loop.
+
+    python tools/bench_simulate.py [--battles N] [--pairs N] [--seed N] [--policy ai|random]
+
+Builds --pairs random team pairs, then plays --battles seeded battles over
+them twice: through simulate() (headless Game, compact events) and through
+the loop /api/move drives (default Game, full event dicts kept per turn,
+debug output written to /dev/null). Both play the same battles.
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.ai import BattleAI  # noqa: E402
+from src.core.game import Game  # noqa: E402
+from src.core.simulation import MAX_TURNS, RandomPolicy, _player_switch, random_team, simulate  # noqa: E402
+
+POLICIES = {'ai': BattleAI, 'random': RandomPolicy}
+
+
+def interactive(team_a, team_b, policy_a, policy_b, seed):
+    """simulate()'s loop on a default Game, keeping every turn's event dicts like the server does."""
+    game = Game(seed=seed)
+    game.ai = policy_b
+    policy_a.rng = game.rng
+    log = [game.start_battle(team_a, team_b)]
+    turns = 0
+    while not game.battle_over and turns < MAX_TURNS:
+        turns += 1
+        if game.pending_player_self_switch or game.player_pokemon.is_fainted():
+            index = _player_switch(game, policy_a)
+            if index is None:
+                break
+            log.append(game.process_turn(switch_index=index))
+            continue
+        move_name, _ = policy_a.select_move(game.player_pokemon, game.opponent_pokemon, game.weather)
+        if move_name is None:
+            break
+        log.append(game.process_turn(move_name=move_name))
+    return turns
+
+
+def run(label, play, pairs, battles, seed):
+    turns = 0
+    start = time.perf_counter()
+    for i in range(battles):
+        turns += play(*pairs[i % len(pairs)], seed + i)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>11}: {battles / elapsed:7.1f} battles/s  {elapsed / turns * 1e3:6.3f} ms/turn  ({turns} turns)")
+    return battles / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--battles', type=int, default=200)
+    parser.add_argument('--pairs', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='ai')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    pairs = [(random_team(), random_team()) for _ in range(args.pairs)]
+    policy = POLICIES[args.policy]
+
+    def headless(team_a, team_b, seed):
+        return simulate(team_a, team_b, policy(), policy(), seed=seed).turns
+
+    def loop(team_a, team_b, seed):
+        with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+            return interactive(team_a, team_b, policy(), policy(), seed)
+
+    slow = run('interactive', loop, pairs, args.battles, args.seed)
+    fast = run('headless', headless, pairs, args.battles, args.seed)
+    print(f"headless is {fast / slow:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
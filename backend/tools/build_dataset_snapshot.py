@@ -0,0 +1,50 @@
+"""Compile the JSON datasets into data/datasets.snapshot.
+
+    python tools/build_dataset_snapshot.py [--output PATH]
+
+The snapshot records the hash of every source file; DataLoader and the
+ability/item configs ignore it (and parse the JSON) as soon as any of them
+changes, so re-run this after editing data/datasets.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems import ability_system, item_system  # noqa: E402
+from src.utils import dataset_snapshot  # noqa: E402
+from src.utils.data_loader import DataLoader  # noqa: E402
+
+
+def build(path: str) -> None:
+    started = time.perf_counter()
+    loader = DataLoader(use_snapshot=False)
+    sections = {name: getattr(loader, name) for name in DataLoader.DATASETS}
+    sections["abilities_config"] = ability_system.load_abilities_config()
+    sections["items_config"] = item_system.load_items_config()
+    parsed = time.perf_counter()
+
+    sizes = dataset_snapshot.write_snapshot(sections, path)
+    for name, size in sizes.items():
+        print(f"  {name:<18} {size / 1024:8.1f} KiB")
+    print(f"Wrote {path} (JSON parse {(parsed - started) * 1000:.0f} ms, write {(time.perf_counter() - parsed) * 1000:.0f} ms)")
+
+    started = time.perf_counter()
+    snapshot = dataset_snapshot.load_snapshot(path)
+    for name in sizes:
+        snapshot.section(name)
+    print(f"Snapshot load: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=dataset_snapshot.SNAPSHOT_PATH)
+    args = parser.parse_args()
+    build(args.output)
+
+
+if __name__ == "__main__":
+    main()
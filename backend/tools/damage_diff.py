@@ -0,0 +1,149 @@
+"""Differential test: native damage calculator vs. the @smogon/calc oracle.
+
+Generates random (seeded) payloads, runs every payload the native calculator
+supports through both engines and reports roll-level mismatches.
+
+    python tools/damage_diff.py --count 5000 --seed 1
+
+Exits with status 1 when any mismatch is found, so it can gate CI before
+DAMAGE_CALCULATOR=native is rolled out.
+"""
+
+import argparse
+import collections
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.systems.native_damage import native_damage_calculator  # noqa: E402
+from src.systems.smogon_oracle import smogon_damage_oracle  # noqa: E402
+from src.utils.data_loader import data_loader  # noqa: E402
+
+NATURES = ["Hardy", "Adamant", "Modest", "Jolly", "Timid", "Bold", "Impish", "Calm", "Careful", "Brave", "Quiet"]
+ITEMS = [
+    None, "Leftovers", "Choice Band", "Choice Specs", "Life Orb", "Expert Belt", "Assault Vest", "Eviolite",
+    "Heavy-Duty Boots", "Focus Sash", "Air Balloon", "Muscle Band", "Wise Glasses", "Punching Glove",
+    "Charcoal", "Mystic Water", "Magnet", "Miracle Seed", "Black Glasses", "Normal Gem", "Occa Berry",
+    "Yache Berry", "Chilan Berry", "Shuca Berry", "Light Ball", "Thick Club",
+]
+WEATHERS = [None, None, "Sun", "Rain", "Sand", "Snow", "Harsh Sunshine", "Heavy Rain", "Strong Winds"]
+TERRAINS = [None, None, "Electric", "Grassy", "Psychic", "Misty"]
+STATUSES = [None, None, None, "brn", "par", "psn", "tox"]
+
+
+def _spread(rng: random.Random) -> dict:
+    evs = dict.fromkeys(["hp", "atk", "def", "spa", "spd", "spe"], 0)
+    for stat in rng.sample(list(evs), 2):
+        evs[stat] = 252
+    evs[rng.choice(list(evs))] += 4
+    return {stat: min(value, 252) for stat, value in evs.items()}
+
+
+def _pokemon(rng: random.Random, species_pool: list) -> dict:
+    species = rng.choice(species_pool)
+    abilities = list(species.get("abilities", {}).values()) or [None]
+    return {
+        "species": species["name"],
+        "level": rng.choice([100, 100, 100, 50, 80]),
+        "ability": rng.choice(abilities),
+        "item": rng.choice(ITEMS),
+        "nature": rng.choice(NATURES),
+        "evs": _spread(rng),
+        "ivs": {stat: rng.choice([31, 31, 31, 0]) for stat in ["hp", "atk", "def", "spa", "spd", "spe"]},
+        "boosts": {stat: rng.choice([0, 0, 0, 1, 2, -1, 6]) for stat in ["atk", "def", "spa", "spd", "spe"]},
+        "status": rng.choice(STATUSES),
+    }
+
+
+def generate_payloads(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    species_pool = [
+        s for s in data_loader.pokedex_data.values()
+        if "baseStats" in s and s.get("num", 0) > 0 and not s.get("battleOnly") and "Gmax" not in s.get("forme", "")
+    ]
+    move_pool = [
+        m["name"] for m in data_loader.moves_data.values()
+        if m.get("category") != "Status" and m.get("basePower", 0) > 0 and not m.get("isNonstandard")
+    ]
+    move_pool = sorted(set(move_pool))
+    payloads = []
+    for _ in range(count):
+        payloads.append({
+            "gen": 9,
+            "attacker": _pokemon(rng, species_pool),
+            "defender": _pokemon(rng, species_pool),
+            "move": {"name": rng.choice(move_pool)},
+            "field": {
+                "weather": rng.choice(WEATHERS),
+                "terrain": rng.choice(TERRAINS),
+                "isReflect": rng.random() < 0.15,
+                "isLightScreen": rng.random() < 0.15,
+                "isAuroraVeil": rng.random() < 0.05,
+            },
+        })
+    return payloads
+
+
+def run(count: int, seed: int, batch_size: int, show: int) -> int:
+    if not smogon_damage_oracle.is_available():
+        print("@smogon/calc is not installed (run `npm ci` in backend/); nothing to compare against.")
+        return 2
+
+    payloads = generate_payloads(count, seed)
+    unsupported = collections.Counter()
+    supported = []
+    native_results = []
+    started = time.perf_counter()
+    for payload in payloads:
+        result = native_damage_calculator.calculate(payload)
+        if result is None:
+            reason = native_damage_calculator.unsupported_reason(payload) or "unknown"
+            unsupported[reason] += 1
+            continue
+        supported.append(payload)
+        native_results.append(result)
+    native_seconds = time.perf_counter() - started
+
+    mismatches = []
+    oracle_errors = 0
+    started = time.perf_counter()
+    for offset in range(0, len(supported), batch_size):
+        chunk = supported[offset:offset + batch_size]
+        oracle_results = smogon_damage_oracle.calculate_many(chunk) or []
+        for payload, native, oracle in zip(chunk, native_results[offset:offset + batch_size], oracle_results):
+            if not oracle or oracle.get("error"):
+                oracle_errors += 1
+                continue
+            if list(oracle["damage"]) != list(native["damage"]):
+                mismatches.append({"payload": payload, "native": native["damage"], "oracle": oracle["damage"]})
+    oracle_seconds = time.perf_counter() - started
+
+    compared = len(supported) - oracle_errors
+    print(f"payloads: {count}  supported: {len(supported)} ({len(supported) / max(count, 1):.1%})  compared: {compared}")
+    print(f"mismatches: {len(mismatches)}  oracle errors: {oracle_errors}")
+    print(f"native: {native_seconds * 1000:.1f} ms total  oracle: {oracle_seconds * 1000:.1f} ms total")
+    if unsupported:
+        print("most common unsupported mechanics:")
+        for reason, hits in unsupported.most_common(10):
+            print(f"  {hits:6d}  {reason}")
+    for mismatch in mismatches[:show]:
+        print(json.dumps(mismatch))
+    return 1 if mismatches else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch", type=int, default=200, help="payloads per oracle round-trip")
+    parser.add_argument("--show", type=int, default=5, help="mismatches to print in full")
+    args = parser.parse_args()
+    sys.exit(run(args.count, args.seed, args.batch, args.show))
+
+
+if __name__ == "__main__":
+    main()
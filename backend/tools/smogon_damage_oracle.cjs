@@ -1,52 +1,121 @@
 #!/usr/bin/env node
 
 const fs = require('fs');
+const readline = require('readline');
 const {Generations, Pokemon, Move, Field, calculate} = require('@smogon/calc');
 
-const input = JSON.parse(fs.readFileSync(0, 'utf8'));
-const gen = Generations.get(input.gen || 9);
-
-const attacker = new Pokemon(gen, input.attacker.species, {
-  level: input.attacker.level || 100,
-  ability: input.attacker.ability,
-  item: input.attacker.item,
-  nature: input.attacker.nature,
-  evs: input.attacker.evs,
-  ivs: input.attacker.ivs,
-  boosts: input.attacker.boosts,
-  status: input.attacker.status,
-});
-
-const defender = new Pokemon(gen, input.defender.species, {
-  level: input.defender.level || 100,
-  ability: input.defender.ability,
-  item: input.defender.item,
-  nature: input.defender.nature,
-  evs: input.defender.evs,
-  ivs: input.defender.ivs,
-  boosts: input.defender.boosts,
-  status: input.defender.status,
-});
-
-const move = new Move(gen, input.move.name, {
-  ability: input.attacker.ability,
-  item: input.attacker.item,
-});
-
-const field = new Field({
-  weather: input.field && input.field.weather,
-  terrain: input.field && input.field.terrain,
-  isReflect: input.field && input.field.isReflect,
-  isLightScreen: input.field && input.field.isLightScreen,
-  isAuroraVeil: input.field && input.field.isAuroraVeil,
-});
-
-const result = calculate(gen, attacker, defender, move, field);
-const damage = Array.isArray(result.damage) ? result.damage.flat(Infinity) : [result.damage];
-
-process.stdout.write(JSON.stringify({
-  damage,
-  min: Math.min(...damage),
-  max: Math.max(...damage),
-  description: result.desc && result.desc(),
-}) + '\n');
+function buildPokemon(gen, data) {
+  return new Pokemon(gen, data.species, {
+    level: data.level || 100,
+    ability: data.ability,
+    item: data.item,
+    nature: data.nature,
+    evs: data.evs,
+    ivs: data.ivs,
+    boosts: data.boosts,
+    status: data.status,
+    curHP: data.curHP === null ? undefined : data.curHP,
+  });
+}
+
+// Batches repeat the same generation and the same attacker/defender sets many
+// times over (4 moves x 6 switch-ins), so both are built once per batch.
+// calculate() clones its inputs, which makes sharing the Pokemon objects safe.
+function createBatchCache() {
+  return {gens: new Map(), pokemon: new Map()};
+}
+
+function getGeneration(cache, num) {
+  if (!cache) return Generations.get(num);
+  if (!cache.gens.has(num)) cache.gens.set(num, Generations.get(num));
+  return cache.gens.get(num);
+}
+
+function getPokemon(cache, gen, data) {
+  if (!cache) return buildPokemon(gen, data);
+  const key = `${gen.num}:${JSON.stringify(data)}`;
+  if (!cache.pokemon.has(key)) cache.pokemon.set(key, buildPokemon(gen, data));
+  return cache.pokemon.get(key);
+}
+
+function calculateDamage(input, cache) {
+  const gen = getGeneration(cache, input.gen || 9);
+  const attacker = getPokemon(cache, gen, input.attacker);
+  const defender = getPokemon(cache, gen, input.defender);
+
+  const move = new Move(gen, input.move.name, {
+    ability: input.attacker.ability,
+    item: input.attacker.item,
+    isCrit: Boolean(input.move.isCrit),
+  });
+
+  const fieldInput = input.field || {};
+  const field = new Field({
+    weather: fieldInput.weather,
+    terrain: fieldInput.terrain,
+    // Screens are per side in @smogon/calc; only the defender's matter here.
+    defenderSide: {
+      isReflect: fieldInput.isReflect,
+      isLightScreen: fieldInput.isLightScreen,
+      isAuroraVeil: fieldInput.isAuroraVeil,
+    },
+  });
+
+  const result = calculate(gen, attacker, defender, move, field);
+  const damage = Array.isArray(result.damage) ? result.damage.flat(Infinity) : [result.damage];
+
+  return {
+    damage,
+    min: Math.min(...damage),
+    max: Math.max(...damage),
+    description: result.desc && result.desc(),
+  };
+}
+
+function calculateBatch(inputs) {
+  const cache = createBatchCache();
+  return inputs.map((input) => {
+    try {
+      return calculateDamage(input, cache);
+    } catch (err) {
+      return {error: String((err && err.message) || err)};
+    }
+  });
+}
+
+// Worker mode: one JSON request per line ({"id", "payload"} or {"id", "payloads"}),
+// one JSON response per line ({"id", "result"}, {"id", "results"} or {"id", "error"}).
+// The process stays alive so the calc package is only loaded once.
+function runWorker() {
+  const rl = readline.createInterface({input: process.stdin, terminal: false});
+  rl.on('line', (line) => {
+    if (!line.trim()) return;
+    let request;
+    try {
+      request = JSON.parse(line);
+    } catch (err) {
+      process.stdout.write(JSON.stringify({id: null, error: `Invalid JSON: ${err.message}`}) + '\n');
+      return;
+    }
+    let response;
+    try {
+      if (Array.isArray(request.payloads)) {
+        response = {id: request.id, results: calculateBatch(request.payloads)};
+      } else {
+        response = {id: request.id, result: calculateDamage(request.payload)};
+      }
+    } catch (err) {
+      response = {id: request.id, error: String((err && err.message) || err)};
+    }
+    process.stdout.write(JSON.stringify(response) + '\n');
+  });
+  rl.on('close', () => process.exit(0));
+}
+
+if (process.argv.includes('--worker')) {
+  runWorker();
+} else {
+  const input = JSON.parse(fs.readFileSync(0, 'utf8'));
+  const output = Array.isArray(input) ? calculateBatch(input) : calculateDamage(input);
+  process.stdout.write(JSON.stringify(output) + '\n');
+}
@@ -0,0 +1,40 @@
+"""Pre-fetch PokeAPI /pokemon responses into the shared on-disk cache.
+
+    python tools/warm_pokeapi_cache.py [--workers N] [--refresh] [--purge]
+
+Covers every name in data/pokemon_ids.json and data/all_pokemon_names.json.
+Run it after a deploy (or on a schedule shorter than the cache TTL) so that
+no request ever waits on PokeAPI. POKEAPI_CACHE_PATH and POKEAPI_BASE_URL
+are honoured.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.pokeapi_cache import pokeapi_cache, warm, warmup_names  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8, help="concurrent requests (default 8)")
+    parser.add_argument("--refresh", action="store_true", help="re-fetch entries that are still fresh")
+    parser.add_argument("--purge", action="store_true", help="drop expired entries first")
+    args = parser.parse_args()
+
+    if args.purge:
+        print(f"Purged {pokeapi_cache.purge_expired()} expired entries")
+
+    names = warmup_names()
+    started = time.perf_counter()
+    counts = warm(names, workers=args.workers, refresh=args.refresh)
+    elapsed = time.perf_counter() - started
+    summary = ", ".join(f"{outcome} {count}" for outcome, count in counts.items())
+    print(f"Warmed {len(names)} names into {pokeapi_cache.path} in {elapsed:.1f}s ({summary})")
+
+
+if __name__ == "__main__":
+    main()
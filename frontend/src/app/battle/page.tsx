@@ -232,7 +232,8 @@ export default function BattlePage() {
     setIsProcessing(true);
     
     try {
-      const result: TurnResult | any = moveName ? await executeMove(moveName, undefined, isMegaEvolving) : await executeMove(undefined, switchIndex);
+      const battleId = battleState?.battle_id ?? '';
+      const result: TurnResult | any = moveName ? await executeMove(battleId, moveName, undefined, isMegaEvolving) : await executeMove(battleId, undefined, switchIndex);
       if (!result || !result.turn_info) {
         setIsProcessing(false);
         return;
@@ -230,19 +230,14 @@ export default function PokemonBuilder() {
   useEffect(() => {
     const fetchCommonData = async () => {
       try {
-        const [itemsRes, speciesRes, customItemsRes, movesRes] = await Promise.all([
-          fetch('https://pokeapi.co/api/v2/item?limit=2000').then(r => r.json()).catch(() => ({ results: [] })),
-          fetch('https://pokeapi.co/api/v2/pokemon-species?limit=1000').then(r => r.json()).catch(() => ({ results: [] })),
+        const [itemsRes, speciesRes, movesRes] = await Promise.all([
           fetch(`${API_BASE_URL}/items`).then(r => r.json()).catch(() => ({ items: [] })),
+          fetch(`${API_BASE_URL}/species`).then(r => r.json()).catch(() => ({ species: [] })),
           fetch(`${API_BASE_URL}/all-moves`).then(r => r.json()).catch(() => ({ success: false, moves: [] }))
         ]);
 
-        const pokeApiItems = (itemsRes.results || []).map((i: any) => i.name.replace(/-/g, ' ').replace(/\b\w/g, (l: string) => l.toUpperCase()));
-        const customItems = customItemsRes.items || [];
-        const mergedItems = Array.from(new Set([...pokeApiItems, ...customItems])).sort();
-
-        setAllItems(mergedItems);
-        setAllSpecies(speciesRes.results || []);
+        setAllItems(itemsRes.items || []);
+        setAllSpecies(speciesRes.species || []);
         if (movesRes.success) {
           setAllMoves(movesRes.moves || []);
         }
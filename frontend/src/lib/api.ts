@@ -61,6 +61,7 @@ export interface PokemonData {
 }
 
 export interface BattleState {
+  battle_id: string;
   player_pokemon: PokemonData;
   opponent_pokemon: PokemonData;
   player_team?: PokemonData[];
@@ -168,12 +169,12 @@ export const startBattle = async (pokemonName: string, selectedSet?: any, oppone
   }
 };
 
-export const executeMove = async (moveName?: string, switchIndex?: number, mega?: boolean): Promise<any> => {
+export const executeMove = async (battleId: string, moveName?: string, switchIndex?: number, mega?: boolean): Promise<any> => {
   try {
     const response = await fetch(`${API_BASE_URL}/move`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ move: moveName, switch_index: switchIndex, mega: mega }),
+      body: JSON.stringify({ battle_id: battleId, move: moveName, switch_index: switchIndex, mega: mega }),
     });
     return await safeJson(response);
   } catch (e) {
@@ -181,6 +182,51 @@ export const executeMove = async (moveName?: string, switchIndex?: number, mega?
   }
 };
 
+// ===== BATTLE SOCKET =====
+
+export type BattleSocketMessage =
+  | { type: 'state'; battle_id: string; state: any }
+  | { type: 'event'; event: any }
+  | { type: 'turn'; turn_info: any; delta: any; battle_result: string | null }
+  | { type: 'error'; detail: string };
+
+// ws(s)://host/ws/battle/<id>, next to the /api base
+export const battleSocketUrl = (battleId: string) => {
+  const base = API_BASE_URL.replace(/\/api$/, '').replace(/^http/, 'ws');
+  const absolute = base.startsWith('ws') ? base : `${window.location.origin.replace(/^http/, 'ws')}${base}`;
+  return `${absolute}/ws/battle/${battleId}`;
+};
+
+// Events arrive one by one while the turn is played, then a 'turn' message with the state delta.
+export const openBattleSocket = (battleId: string, onMessage: (message: BattleSocketMessage) => void) => {
+  const socket = new WebSocket(battleSocketUrl(battleId));
+  socket.onmessage = (e) => onMessage(JSON.parse(e.data));
+  return {
+    socket,
+    move: (moveName: string, mega?: boolean) => socket.send(JSON.stringify({ move: moveName, mega: !!mega })),
+    switchTo: (switchIndex: number) => socket.send(JSON.stringify({ switch_index: switchIndex })),
+    sync: () => socket.send(JSON.stringify({ type: 'sync' })),
+    close: () => socket.close(),
+  };
+};
+
+// Apply a 'turn' delta to the last full state: team entries are patched per slot.
+export const applyBattleDelta = (state: any, delta: any) => {
+  const next = { ...state };
+  for (const [key, value] of Object.entries<any>(delta)) {
+    if (key === 'player_team' || key === 'opponent_team') {
+      const team = [...(next[key] || [])];
+      for (const [index, changed] of Object.entries<any>(value)) {
+        team[Number(index)] = { ...team[Number(index)], ...changed };
+      }
+      next[key] = team;
+    } else {
+      next[key] = value;
+    }
+  }
+  return next;
+};
+
 // ===== FORM VALIDATION API FUNCTIONS =====
 
 export interface PokemonFormInfo {
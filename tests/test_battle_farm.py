@@ -0,0 +1,56 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from backend.src.core.battle_farm import Checkpoint, FarmError, play_seed, run_farm
+
+
+class BattleFarmTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self.tmp.name, 'farm.csv')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def rows(self):
+        with open(self.out, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    def test_seed_is_reproducible_and_odd_seeds_swap_sides(self):
+        row = play_seed(3, 'ai', 'random', team_size=2)
+        self.assertEqual(row, play_seed(3, 'ai', 'random', team_size=2))
+        self.assertEqual((row['player_policy'], row['opponent_policy']), ('random', 'ai'))
+        self.assertEqual(len(row['player_team'].split('/')), 2)
+        self.assertIn(row['winner'], ('player', 'opponent', 'draw'))
+
+    def test_resume_plays_only_new_chunks(self):
+        totals = run_farm(self.out, range(4), team_size=2, workers=1, chunk_size=2, progress_every=1e9)
+        self.assertEqual(totals['battles'], 4)
+        first = self.rows()
+        self.assertEqual([int(r['seed']) for r in first], [0, 1, 2, 3])
+
+        # Same arguments again: everything is done, nothing is appended
+        totals = run_farm(self.out, range(4), team_size=2, workers=1, chunk_size=2, progress_every=1e9)
+        self.assertEqual(totals['battles'], 4)
+        self.assertEqual(self.rows(), first)
+
+    def test_draws_are_counted_once(self):
+        checkpoint = Checkpoint(self.out + '.checkpoint.json', {})
+        checkpoint.record(0, [
+            {'turns': 10, 'winner': 'player', 'winner_policy': 'ai'},
+            {'turns': 1000, 'winner': 'draw', 'winner_policy': ''},
+        ], 0)
+        self.assertEqual(checkpoint.totals['wins:draw'], 1)
+        self.assertEqual(checkpoint.totals['wins:ai'], 1)
+        self.assertEqual(checkpoint.totals['battles'], 2)
+
+    def test_refuses_a_checkpoint_from_other_arguments(self):
+        run_farm(self.out, range(2), team_size=2, workers=1, chunk_size=2, progress_every=1e9)
+        with self.assertRaises(FarmError):
+            run_farm(self.out, range(4), team_size=2, workers=1, chunk_size=2, progress_every=1e9)
+
+
+if __name__ == '__main__':
+    unittest.main()
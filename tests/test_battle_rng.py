@@ -0,0 +1,52 @@
+import unittest
+
+from backend.src.core.game import Game
+from backend.src.utils.battle_rng import BattleRNG
+
+
+def draws(rng, n=600):
+    return [rng.random() for _ in range(n)]
+
+
+class BattleRNGTests(unittest.TestCase):
+    def test_seed_fixes_the_stream_whatever_the_block_size(self):
+        expected = draws(BattleRNG(42))
+        self.assertEqual(draws(BattleRNG(42, block_size=1)), expected)
+        self.assertEqual(draws(BattleRNG(42, block_size=7)), expected)
+        self.assertNotEqual(draws(BattleRNG(43)), expected)
+
+    def test_integers_and_choices_stay_in_range(self):
+        rng = BattleRNG(1)
+        rolls = {rng.randint(85, 100) for _ in range(2000)}
+        self.assertEqual(rolls, set(range(85, 101)))
+        self.assertIn(rng.choice("abc"), "abc")
+        with self.assertRaises(IndexError):
+            rng.choice([])
+
+    def test_state_round_trip_resumes_mid_block(self):
+        rng = BattleRNG(5, block_size=16)
+        draws(rng, 21)
+        copy = BattleRNG.from_state(rng.getstate())
+        self.assertEqual(draws(copy, 40), draws(rng, 40))
+
+    def test_spawned_streams_are_independent_and_reproducible(self):
+        first, second = BattleRNG(9).spawn(), BattleRNG(9).spawn()
+        self.assertEqual(draws(first, 50), draws(second, 50))
+        parent = BattleRNG(9)
+        self.assertNotEqual(draws(parent.spawn(), 50), draws(parent.spawn(), 50))
+
+    def test_games_with_the_same_seed_play_out_identically(self):
+        team = [{"name": "Pikachu", "types": ["electric"], "stats": {}, "moves": ["Thunderbolt", "Quick Attack"]}]
+        foes = [{"name": "Snorlax", "types": ["normal"], "stats": {}, "moves": ["Body Slam", "Crunch"]}]
+        turns = []
+        for _ in range(2):
+            game = Game(headless=True, seed=11)
+            game.start_battle(team, foes)
+            turns.append([game.process_turn(move_name="Thunderbolt") for _ in range(3)])
+            self.assertIs(game.player_pokemon.rng, game.rng)
+            self.assertIs(game.ai.rng, game.rng)
+        self.assertEqual(turns[0], turns[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
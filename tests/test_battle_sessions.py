@@ -0,0 +1,102 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from backend.src.core import battle_sessions
+from backend.src.core.battle_sessions import BattleLimitError, BattleSessionManager
+from backend.src.core.fastapi_server import app
+from backend.src.core.game import Game
+from backend.src.utils.data_loader import DataLoader
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class BattleSessionManagerTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.manager = BattleSessionManager(max_battles=2, idle_ttl=60, clock=self.clock)
+
+    def test_idle_battles_expire(self):
+        session = self.manager.create(Game())
+        self.clock.now = 59
+        self.assertIs(self.manager.get(session.battle_id), session)
+        self.clock.now = 110
+        self.assertIs(self.manager.get(session.battle_id), session)
+        self.clock.now = 171
+        self.assertIsNone(self.manager.get(session.battle_id))
+        self.assertEqual(len(self.manager), 0)
+
+    def test_cap_evicts_least_recently_used(self):
+        first = self.manager.create(Game())
+        second = self.manager.create(Game())
+        self.manager.get(first.battle_id)
+        third = self.manager.create(Game())
+        self.assertIn(first.battle_id, self.manager)
+        self.assertNotIn(second.battle_id, self.manager)
+        self.assertIn(third.battle_id, self.manager)
+
+    def test_busy_battles_are_not_evicted(self):
+        async def fill():
+            sessions = [self.manager.create(Game()) for _ in range(2)]
+            for session in sessions:
+                await session.lock.acquire()
+            with self.assertRaises(BattleLimitError):
+                self.manager.create(Game())
+
+        asyncio.run(fill())
+
+    def test_sessions_report_their_size(self):
+        session = self.manager.create(Game())
+        self.assertGreater(session.size_bytes, 0)
+        self.assertEqual(self.manager.stats()["total_bytes"], session.size_bytes)
+
+    def test_checkpoints_only_remeasure_every_interval(self):
+        manager = BattleSessionManager(clock=self.clock, measure_interval=3)
+        session = manager.create(Game())
+        session.size_bytes = -1
+        manager.checkpoint(session)
+        manager.checkpoint(session)
+        self.assertEqual(session.size_bytes, -1)
+        manager.checkpoint(session)
+        self.assertGreater(session.size_bytes, 0)
+
+    def test_datasets_loaded_later_are_not_counted(self):
+        loader = DataLoader(use_snapshot=False)
+        with patch("backend.src.utils.data_loader.data_loader", loader), patch.object(battle_sessions, "_shared_ids", None):
+            battle_sessions._shared_object_ids()
+            table = loader.typechart_data
+            self.assertIn(id(table), battle_sessions._shared_object_ids())
+            self.assertEqual(battle_sessions.estimate_size({"chart": table}), battle_sessions.estimate_size({"chart": None}))
+
+
+class BattleEndpointsTests(unittest.TestCase):
+    def test_battles_are_independent(self):
+        client = TestClient(app)
+        first = client.post("/api/start", json={"pokemon": "garchomp", "opponent": "toxapex"}).json()
+        second = client.post("/api/start", json={"pokemon": "gengar", "opponent": "ferrothorn"}).json()
+        self.assertNotEqual(first["battle_id"], second["battle_id"])
+
+        move = first["player_moves"][0]["name"]
+        result = client.post("/api/move", json={"battle_id": first["battle_id"], "move": move}).json()
+        self.assertEqual(result["battle_id"], first["battle_id"])
+        self.assertEqual(result["player_pokemon"]["name"], first["player_pokemon"]["name"])
+
+        team = client.get("/api/team", params={"battle_id": second["battle_id"]}).json()["player_team"]
+        self.assertEqual(team[0]["name"], second["player_pokemon"]["name"])
+        self.assertEqual(team[0]["hp"], team[0]["max_hp"])
+
+        self.assertEqual(client.post("/api/move", json={"move": move}).status_code, 400)
+        self.assertEqual(client.post("/api/move", json={"battle_id": "nope", "move": move}).status_code, 404)
+        self.assertEqual(client.get("/api/team").status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from backend.src.core.battle_sessions import BattleLimitError, battle_sessions
+from backend.src.core.battle_view import apply_delta, battle_view
+from backend.src.core.fastapi_server import app
+
+
+class BattleSocketTests(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+        self.start = self.client.post("/api/start", json={"pokemon": "garchomp", "opponent": "toxapex"}).json()
+        self.battle_id = self.start["battle_id"]
+
+    def test_turn_streams_events_then_a_delta(self):
+        move = self.start["player_moves"][0]["name"]
+        with self.client.websocket_connect(f"/ws/battle/{self.battle_id}") as socket:
+            state = socket.receive_json()
+            self.assertEqual(state["type"], "state")
+
+            socket.send_json({"move": move})
+            events = []
+            message = socket.receive_json()
+            while message["type"] == "event":
+                events.append(message["event"])
+                message = socket.receive_json()
+
+        self.assertEqual(message["type"], "turn")
+        self.assertTrue(events)
+        self.assertEqual(message["turn_info"]["player_move"], move)
+        # Applying the delta to the view from connect gives the server's current view
+        game = battle_sessions.get(self.battle_id).game
+        self.assertEqual(apply_delta(state["state"], message["delta"]), battle_view(game))
+
+    def test_unknown_battle_is_rejected(self):
+        with self.client.websocket_connect("/ws/battle/nope") as socket:
+            self.assertEqual(socket.receive_json()["type"], "error")
+
+    def test_no_room_to_restore_is_reported(self):
+        with self.client.websocket_connect(f"/ws/battle/{self.battle_id}") as socket:
+            socket.receive_json()
+            with patch.object(battle_sessions, "get", side_effect=BattleLimitError("Too many concurrent battles (500)")):
+                socket.send_json({"type": "sync"})
+                self.assertEqual(socket.receive_json(), {"type": "error", "detail": "Too many concurrent battles (500)"})
+
+
+if __name__ == "__main__":
+    unittest.main()
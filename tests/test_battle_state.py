@@ -0,0 +1,140 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from backend.src.core.battle_sessions import BattleSessionManager
+from backend.src.core.battle_state import SnapshotError, dump_game, load_game
+from backend.src.core.battle_store import MemoryBattleStore, SQLiteBattleStore
+from backend.src.core.game import Game
+from backend.src.utils.data_loader import data_loader
+
+
+BASE_STATS = {
+    "hp": 100,
+    "attack": 100,
+    "defense": 100,
+    "special_attack": 100,
+    "special_defense": 100,
+    "speed": 100,
+}
+
+
+def mon(name, types, moves, ability="noability", item="", speed=100):
+    stats = BASE_STATS.copy()
+    stats["speed"] = speed
+    return {"name": name, "types": types, "stats": stats, "moves": moves, "ability": ability, "item": item}
+
+
+def played_game():
+    game = Game()
+    game.start_battle(
+        [
+            mon("Gengar", ["ghost", "poison"], ["Toxic", "Shadow Ball"], item="leftovers", speed=200),
+            mon("Pikachu", ["electric"], ["Thunderbolt"]),
+        ],
+        [
+            mon("Snorlax", ["normal"], ["Body Slam", "Rest"], ability="thickfat", speed=50),
+            mon("Blissey", ["normal"], ["Seismic Toss"]),
+        ],
+    )
+    game.process_turn(move_name="Toxic")
+    return game
+
+
+class BattleStateTests(unittest.TestCase):
+    def test_round_trip_keeps_state_and_shared_references(self):
+        game = played_game()
+        snapshot = dump_game(game)
+        restored = load_game(snapshot)
+
+        self.assertEqual(dump_game(restored), snapshot)
+        self.assertIs(restored.player_pokemon, restored.player_team[0])
+        self.assertEqual(
+            [(p.name, p.current_hp) for p in restored.opponent_team],
+            [(p.name, p.current_hp) for p in game.opponent_team],
+        )
+        self.assertEqual(restored.opponent_pokemon.major_status, game.opponent_pokemon.major_status)
+        # Dataset records are re-bound, not copied
+        toxic = restored.player_pokemon.moves["Toxic"]
+        self.assertIs(toxic.data, data_loader.get_move("Toxic"))
+        self.assertEqual(toxic.pp, game.player_pokemon.moves["Toxic"].pp)
+        self.assertIsNot(restored.hooks, None)
+
+        restored.process_turn(move_name="Shadow Ball")
+
+    def test_restored_battle_continues_with_the_same_rolls(self):
+        game = played_game()
+        restored = load_game(dump_game(game))
+        for _ in range(3):
+            expected = game.process_turn(move_name="Shadow Ball")
+            self.assertEqual(restored.process_turn(move_name="Shadow Ball"), expected)
+        self.assertEqual(dump_game(restored), dump_game(game))
+
+    def test_snapshots_from_another_format_are_rejected(self):
+        snapshot = bytearray(dump_game(played_game()))
+        snapshot[4] += 1
+        with self.assertRaises(SnapshotError):
+            load_game(bytes(snapshot))
+        with self.assertRaises(SnapshotError):
+            load_game(b"nope")
+
+
+class ParkedBattleTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_evicted_battles_are_parked_and_restored(self):
+        manager = BattleSessionManager(max_battles=1, store=MemoryBattleStore())
+        first = manager.create(played_game())
+        manager.create(Game())
+        self.assertNotIn(first.battle_id, manager)
+
+        restored = manager.get(first.battle_id)
+        self.assertIsNotNone(restored)
+        self.assertEqual(dump_game(restored.game), dump_game(first.game))
+        self.assertEqual(manager.stats()["restores"], 1)
+
+    def test_memory_store_keeps_the_most_recently_parked_battles(self):
+        store = MemoryBattleStore(max_entries=2, max_bytes=9)
+        for battle_id in ("a", "b", "c"):
+            store.put(battle_id, b"1234", 0, 60)
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(len(store), 2)
+        store.put("d", b"123456", 0, 60)
+        self.assertEqual([store.get(battle_id) is not None for battle_id in "bcd"], [False, False, True])
+        self.assertEqual(store.total_bytes, 6)
+
+    def test_expired_snapshots_are_purged(self):
+        now = [0.0]
+        store = MemoryBattleStore(clock=lambda: now[0])
+        manager = BattleSessionManager(max_battles=1, idle_ttl=60, store=store, clock=lambda: now[0],
+                                       purge_interval=30)
+        manager.create(played_game())
+        manager.create(Game())
+        self.assertEqual(len(store), 1)
+
+        now[0] = 61
+        manager.evict_expired()
+        self.assertEqual(len(store), 0)
+
+    def test_workers_sharing_a_sqlite_store_resume_each_others_battles(self):
+        path = os.path.join(self.directory, "battles.sqlite3")
+        worker_a = BattleSessionManager(store=SQLiteBattleStore(path))
+        worker_b = BattleSessionManager(store=SQLiteBattleStore(path))
+
+        session_a = worker_a.create(played_game())
+        session_b = worker_b.get(session_a.battle_id)
+        session_b.game.process_turn(move_name="Shadow Ball")
+        worker_b.checkpoint(session_b)
+
+        refreshed = worker_a.get(session_a.battle_id)
+        self.assertEqual(refreshed.revision, 1)
+        self.assertEqual(dump_game(refreshed.game), dump_game(session_b.game))
+
+
+if __name__ == "__main__":
+    unittest.main()
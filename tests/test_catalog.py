@@ -0,0 +1,51 @@
+import unittest
+
+from fastapi.testclient import TestClient
+
+from backend.src.core.catalog import CatalogPayload, choose_encoding
+from backend.src.core.fastapi_server import app
+
+
+class CatalogPayloadTests(unittest.TestCase):
+    def test_each_encoding_has_its_own_strong_etag(self):
+        payload = CatalogPayload({"moves": ["Tackle"]})
+        self.assertEqual(payload.bodies["identity"], b'{"moves":["Tackle"]}')
+        self.assertEqual(len(set(payload.etags.values())), len(payload.bodies))
+        self.assertTrue(all(not etag.startswith("W/") for etag in payload.etags.values()))
+        self.assertTrue(payload.not_modified('W/' + payload.etags["gzip"]))
+        self.assertFalse(payload.not_modified('"stale"'))
+
+    def test_encoding_follows_accept_encoding(self):
+        self.assertEqual(choose_encoding("gzip, deflate", {"identity", "gzip"}), "gzip")
+        self.assertEqual(choose_encoding("gzip;q=0, br", {"identity", "gzip"}), "identity")
+        self.assertEqual(choose_encoding("br, gzip", {"identity", "gzip", "br"}), "br")
+        self.assertEqual(choose_encoding("", {"identity", "gzip"}), "identity")
+
+
+class CatalogEndpointTests(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_catalogs_are_compressed_and_revalidate(self):
+        for path in ("/api/all-moves", "/api/items", "/api/species", "/api/battle-ready-pokemon"):
+            response = self.client.get(path, headers={"Accept-Encoding": "gzip"})
+            self.assertEqual(response.headers["content-encoding"], "gzip")
+            self.assertIn("max-age", response.headers["cache-control"])
+            self.assertTrue(response.json()["success"])
+
+            again = self.client.get(path, headers={"If-None-Match": response.headers["etag"]})
+            self.assertEqual(again.status_code, 304)
+
+    def test_species_catalog_replaces_pokeapi_listing(self):
+        species = {s["id"]: s for s in self.client.get("/api/species").json()["species"]}
+        self.assertEqual(species["garchomp"]["types"], ["Dragon", "Ground"])
+        self.assertEqual(species["garchompmega"]["base_species"], "Garchomp")
+
+    def test_learnsets_keep_their_list_shape(self):
+        moves = self.client.get("/api/pokemon/garchomp/moves").json()
+        self.assertIn("Earthquake", moves)
+        self.assertEqual(moves, sorted(moves))
+
+
+if __name__ == "__main__":
+    unittest.main()
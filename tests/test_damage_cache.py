@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from backend.src.models.move import Move
+from backend.src.models.pokemon import Pokemon
+from backend.src.systems.damage_cache import DamageCache, payload_key
+from backend.src.systems.damage_engine import build_damage_payload, smogon_damage_for_move
+
+
+ROLLS = {"damage": [40, 41, 42, 43], "min": 40, "max": 43, "description": "test"}
+
+
+class DamageCacheTests(unittest.TestCase):
+    def test_payload_key_ignores_key_order(self):
+        self.assertEqual(
+            payload_key({"gen": 9, "move": {"name": "Tackle"}}),
+            payload_key({"move": {"name": "Tackle"}, "gen": 9}),
+        )
+        self.assertNotEqual(payload_key({"gen": 9}), payload_key({"gen": 8}))
+
+    def test_lru_counts_hits_misses_and_evictions(self):
+        cache = DamageCache(max_entries=2)
+        cache.put("a", ROLLS)
+        cache.put("b", ROLLS)
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", ROLLS)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (2, 1, 1))
+
+    def test_sqlite_store_survives_new_instance(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "damage.sqlite")
+            writer = DamageCache(db_path=path)
+            writer.put("key", ROLLS)
+            writer.flush()  # as at exit
+
+            cache = DamageCache(db_path=path)
+            self.assertEqual(cache.get("key")["damage"], ROLLS["damage"])
+            self.assertEqual(cache.stats()["disk_hits"], 1)
+
+    def test_sqlite_writes_are_committed_in_batches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "damage.sqlite")
+            cache = DamageCache(db_path=path, commit_every=3, commit_interval=3600)
+            cache.put("a", ROLLS)
+            cache.put("b", ROLLS)
+            self.assertIsNone(DamageCache(db_path=path).get("a"))
+            self.assertEqual(cache.stats()["pending_writes"], 2)
+
+            cache.put("c", ROLLS)
+            self.assertIsNotNone(DamageCache(db_path=path).get("a"))
+            cache.put("d", ROLLS)
+            cache.flush()
+            self.assertIsNotNone(DamageCache(db_path=path).get("d"))
+            self.assertEqual(cache.stats()["pending_writes"], 0)
+
+    def test_oracle_is_only_called_once_per_matchup(self):
+        stats = {"hp": 80, "attack": 80, "defense": 80, "special_attack": 80, "special_defense": 80, "speed": 80}
+        attacker = Pokemon("Pikachu", ["electric"], None, stats.copy(), moves=[], level=100)
+        defender = Pokemon("Squirtle", ["water"], None, stats.copy(), moves=[], level=100)
+        move = Move("Thunderbolt")
+
+        with patch("backend.src.systems.damage_engine.damage_cache", DamageCache()), \
+                patch("backend.src.systems.damage_engine.DAMAGE_CALCULATOR", "oracle"), \
+                patch("backend.src.systems.damage_engine.smogon_damage_oracle.calculate", return_value=dict(ROLLS)) as oracle:
+            first = smogon_damage_for_move(attacker, defender, move)
+            second = smogon_damage_for_move(attacker, defender, move)
+
+        oracle.assert_called_once()
+        self.assertIn(first["selected_damage"], ROLLS["damage"])
+        self.assertIn(second["selected_damage"], ROLLS["damage"])
+
+    def test_payload_only_carries_hp_that_changes_the_result(self):
+        stats = {"hp": 90, "attack": 80, "defense": 80, "special_attack": 80, "special_defense": 80, "speed": 80}
+
+        def key(attacker_hp, defender_hp, move="Flamethrower", attacker_ability="noability", defender_ability="noability"):
+            attacker = Pokemon("Charizard", ["fire"], None, stats.copy(), moves=[], level=100, ability=attacker_ability)
+            defender = Pokemon("Dragonite", ["dragon"], None, stats.copy(), moves=[], level=100, ability=defender_ability)
+            attacker.current_hp = attacker.max_hp * attacker_hp // 100
+            defender.current_hp = defender.max_hp * defender_hp // 100
+            return payload_key(build_damage_payload(attacker, defender, Move(move)))
+
+        self.assertEqual(key(100, 100), key(20, 45))
+        self.assertEqual(key(100, 100, attacker_ability="blaze"), key(60, 100, attacker_ability="blaze"))
+        self.assertEqual(key(30, 100, attacker_ability="blaze"), key(10, 100, attacker_ability="blaze"))
+        self.assertNotEqual(key(100, 100, attacker_ability="blaze"), key(30, 100, attacker_ability="blaze"))
+        self.assertEqual(key(100, 90, defender_ability="multiscale"), key(100, 10, defender_ability="multiscale"))
+        self.assertNotEqual(key(100, 100, defender_ability="multiscale"), key(100, 90, defender_ability="multiscale"))
+        self.assertNotEqual(key(80, 100, move="Eruption"), key(70, 100, move="Eruption"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -36,8 +36,8 @@ class DamageCalculationTests(unittest.TestCase):
     def tearDown(self):
         self.smogon_patch.stop()
 
-    @patch("backend.src.models.move.random.randint", return_value=100)
-    @patch("backend.src.models.move.random.random", return_value=1.0)
+    @patch("backend.src.utils.battle_rng.random.randint", return_value=100)
+    @patch("backend.src.utils.battle_rng.random.random", return_value=1.0)
     def test_damage_uses_attacker_level(self, _random, _randint):
         defender = make_pokemon("Snorlax", ["normal"], level=100)
         level_50_attacker = make_pokemon("Pikachu", ["electric"], level=50)
@@ -48,8 +48,8 @@ class DamageCalculationTests(unittest.TestCase):
 
         self.assertGreater(high_damage, low_damage)
 
-    @patch("backend.src.models.move.random.randint", return_value=85)
-    @patch("backend.src.models.move.random.random", return_value=0.0)
+    @patch("backend.src.utils.battle_rng.random.randint", return_value=85)
+    @patch("backend.src.utils.battle_rng.random.random", return_value=0.0)
     def test_fixed_damage_ignores_random_critical_and_stab_modifiers(self, _random, _randint):
         attacker = make_pokemon("Dragonite", ["dragon"], level=100)
         defender = make_pokemon("Blissey", ["normal"], level=100)
@@ -67,8 +67,8 @@ class DamageCalculationTests(unittest.TestCase):
         self.assertEqual(damage, 0)
         self.assertEqual(message, "It had no effect...")
 
-    @patch("backend.src.models.move.random.randint", return_value=100)
-    @patch("backend.src.models.move.random.random", return_value=1.0)
+    @patch("backend.src.utils.battle_rng.random.randint", return_value=100)
+    @patch("backend.src.utils.battle_rng.random.random", return_value=1.0)
     def test_effectiveness_is_available_to_damage_modifying_items(self, _random, _randint):
         attacker = make_pokemon("Pikachu", ["electric"], level=100, item="Expert Belt")
         defender = make_pokemon("Squirtle", ["water"], level=100)
@@ -80,8 +80,8 @@ class DamageCalculationTests(unittest.TestCase):
         self.assertEqual(move.effectiveness, 2.0)
         self.assertEqual(boosted_damage, int(raw_damage * 1.2))
 
-    @patch("backend.src.models.move.random.randint", return_value=100)
-    @patch("backend.src.models.move.random.random", return_value=1.0)
+    @patch("backend.src.utils.battle_rng.random.randint", return_value=100)
+    @patch("backend.src.utils.battle_rng.random.random", return_value=1.0)
     def test_single_hit_damage_is_absorbed_by_substitute(self, _random, _randint):
         attacker = make_pokemon("Pikachu", ["electric"], level=100)
         defender = make_pokemon("Snorlax", ["normal"], level=100)
@@ -94,8 +94,8 @@ class DamageCalculationTests(unittest.TestCase):
         self.assertGreater(substitute_damage, 0)
         self.assertEqual(defender.substitute_hp, starting_substitute_hp - substitute_damage)
 
-    @patch("backend.src.models.move.random.randint", return_value=100)
-    @patch("backend.src.models.move.random.random", return_value=1.0)
+    @patch("backend.src.utils.battle_rng.random.randint", return_value=100)
+    @patch("backend.src.utils.battle_rng.random.random", return_value=1.0)
     def test_choice_band_is_not_applied_twice(self, _random, _randint):
         defender = make_pokemon("Snorlax", ["normal"], level=100)
         no_item_attacker = make_pokemon("Tauros", ["normal"], level=100)
@@ -106,8 +106,8 @@ class DamageCalculationTests(unittest.TestCase):
 
         self.assertLess(band_damage, normal_damage * 2)
 
-    @patch("backend.src.models.move.random.randint", return_value=100)
-    @patch("backend.src.models.move.random.random", return_value=1.0)
+    @patch("backend.src.utils.battle_rng.random.randint", return_value=100)
+    @patch("backend.src.utils.battle_rng.random.random", return_value=1.0)
     def test_burn_halves_physical_damage_once(self, _random, _randint):
         defender = make_pokemon("Snorlax", ["normal"], level=100)
         healthy_attacker = make_pokemon("Tauros", ["normal"], level=100)
@@ -119,8 +119,8 @@ class DamageCalculationTests(unittest.TestCase):
 
         self.assertEqual(burned_damage, healthy_damage // 2)
 
-    @patch("backend.src.models.move.random.randint", return_value=100)
-    @patch("backend.src.models.move.random.random", return_value=0.0)
+    @patch("backend.src.utils.battle_rng.random.randint", return_value=100)
+    @patch("backend.src.utils.battle_rng.random.random", return_value=0.0)
     def test_critical_hit_ignores_bad_attack_and_good_defense_stages(self, _random, _randint):
         attacker = make_pokemon("Tauros", ["normal"], level=100)
         defender = make_pokemon("Snorlax", ["normal"], level=100)
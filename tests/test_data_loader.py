@@ -0,0 +1,47 @@
+import threading
+import unittest
+
+from backend.src.utils.data_loader import DataLoader
+
+
+class LazyDataLoaderTests(unittest.TestCase):
+    def test_datasets_load_on_first_access_only(self):
+        loader = DataLoader(use_snapshot=False)
+
+        self.assertFalse(loader.is_loaded("learnsets_data"))
+        self.assertIsNotNone(loader.get_move("Tackle"))
+
+        self.assertTrue(loader.is_loaded("moves_data"))
+        self.assertFalse(loader.is_loaded("learnsets_data"))
+        self.assertEqual(loader.load_times["moves_data"][1], "json")
+
+    def test_concurrent_first_access_loads_once(self):
+        loader = DataLoader(use_snapshot=False)
+        calls = []
+        original = loader._load_typechart
+
+        def counting_loader():
+            calls.append(1)
+            return original()
+
+        loader._load_typechart = counting_loader
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(loader.typechart_data)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_preload_reports_every_dataset(self):
+        loader = DataLoader(use_snapshot=False)
+        timings = loader.preload(["typechart_data", "items_data"])
+
+        self.assertEqual(set(timings), {"typechart_data", "items_data"})
+        self.assertIn("learnsets_data   not loaded", loader.timing_report())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+from backend.src.utils import dataset_snapshot
+
+
+class DatasetSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.datasets_dir = os.path.join(self.tmp.name, "datasets")
+        os.makedirs(self.datasets_dir)
+        for filename in ("moves.json", "typechart.json"):
+            with open(os.path.join(self.datasets_dir, filename), "w") as f:
+                f.write("{}")
+        self.path = os.path.join(self.tmp.name, "datasets.snapshot")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trips_sections_as_independent_copies(self):
+        dataset_snapshot.write_snapshot({"moves_data": {"tackle": {"basePower": 40}}, "typechart_data": {}},
+                                        self.path, self.datasets_dir)
+
+        snapshot = dataset_snapshot.load_snapshot(self.path, self.datasets_dir)
+        first = snapshot.section("moves_data")
+        first["tackle"]["basePower"] = 0
+
+        self.assertIn("typechart_data", snapshot)
+        self.assertNotIn("learnsets_data", snapshot)
+        self.assertEqual(snapshot.section("moves_data"), {"tackle": {"basePower": 40}})
+
+    def test_changed_source_file_invalidates_snapshot(self):
+        dataset_snapshot.write_snapshot({"moves_data": {}}, self.path, self.datasets_dir)
+        with open(os.path.join(self.datasets_dir, "moves.json"), "w") as f:
+            f.write('{"tackle": {}}')
+
+        self.assertIsNone(dataset_snapshot.load_snapshot(self.path, self.datasets_dir))
+
+    def test_touched_but_identical_source_is_still_valid(self):
+        dataset_snapshot.write_snapshot({"moves_data": {}}, self.path, self.datasets_dir)
+        os.utime(os.path.join(self.datasets_dir, "moves.json"), ns=(0, 0))
+
+        self.assertIsNotNone(dataset_snapshot.load_snapshot(self.path, self.datasets_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
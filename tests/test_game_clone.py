@@ -0,0 +1,69 @@
+import unittest
+
+from backend.src.core.battle_state import dump_game
+from backend.src.core.game import Game
+
+
+BASE_STATS = {
+    "hp": 100,
+    "attack": 100,
+    "defense": 100,
+    "special_attack": 100,
+    "special_defense": 100,
+    "speed": 100,
+}
+
+
+def mon(name, types, moves, item="", speed=100):
+    stats = BASE_STATS.copy()
+    stats["speed"] = speed
+    return {"name": name, "types": types, "stats": stats, "moves": moves, "item": item}
+
+
+def played_game():
+    game = Game(headless=True, seed=4)
+    game.start_battle(
+        [mon("Gengar", ["ghost", "poison"], ["Toxic", "Shadow Ball", "Future Sight"], item="leftovers", speed=200),
+         mon("Pikachu", ["electric"], ["Thunderbolt"])],
+        [mon("Snorlax", ["normal"], ["Body Slam", "Rest"], speed=50), mon("Blissey", ["normal"], ["Seismic Toss"])],
+    )
+    game.process_turn(move_name="Toxic")
+    game.process_turn(move_name="Future Sight")
+    return game
+
+
+class GameCloneTests(unittest.TestCase):
+    def test_clone_copies_battle_state_and_shares_dataset_records(self):
+        game = played_game()
+        clone = game.clone()
+
+        self.assertIsNot(clone.player_pokemon, game.player_pokemon)
+        self.assertIs(clone.player_pokemon, clone.player_team[0])
+        self.assertIs(clone.player_pokemon.rng, clone.rng)
+        self.assertIs(clone.opponent_side.future_move["attacker"], clone.player_pokemon)
+        self.assertIs(clone.opponent_side.future_move["move"], clone.player_pokemon.moves["Future Sight"])
+        self.assertIsNot(clone.opponent_pokemon.status_effects["toxic"], game.opponent_pokemon.status_effects["toxic"])
+
+        self.assertIs(clone.hooks, game.hooks)
+        toxic = clone.player_pokemon.moves["Toxic"]
+        self.assertIs(toxic.data, game.player_pokemon.moves["Toxic"].data)
+        self.assertIs(clone.opponent_pokemon.ability.config, game.opponent_pokemon.ability.config)
+
+    def test_playing_a_clone_leaves_the_original_alone(self):
+        game = played_game()
+        before = dump_game(game)
+        clone = game.clone()
+        for _ in range(3):
+            clone.process_turn(move_name="Shadow Ball")
+        self.assertNotEqual(dump_game(clone), before)
+        self.assertEqual(dump_game(game), before)
+
+    def test_clone_rolls_what_the_original_would(self):
+        game = played_game()
+        clone = game.clone()
+        for _ in range(3):
+            self.assertEqual(clone.process_turn(move_name="Shadow Ball"), game.process_turn(move_name="Shadow Ball"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from backend.src.utils.lookup_index import LookupIndex
+
+
+TABLE = {
+    "thunderbolt": {"name": "Thunderbolt"},
+    "thunder": {"name": "Thunder"},
+    "kingsshield": {"name": "King's Shield"},
+    "vcreate": {"name": "V-create"},
+}
+
+
+def scan(text):
+    text = text.lower()
+    for key, record in TABLE.items():
+        if text in key or text in record["name"].lower():
+            return record
+    return None
+
+
+class LookupIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = LookupIndex(TABLE)
+
+    def test_name_and_alias_lookups(self):
+        self.assertIs(self.index.by_name("king's shield"), TABLE["kingsshield"])
+        self.assertIs(self.index.by_alias("Kings Shield"), TABLE["kingsshield"])
+        self.assertIsNone(self.index.by_name("Kings Shield"))
+
+    def test_substring_search_matches_a_table_scan(self):
+        for query in ["thunder", "bolt", "nder", "V-cr", "'s", "e", "x", "shieldx", "create"]:
+            self.assertIs(self.index.search(query), scan(query), query)
+
+    def test_misses_are_cached(self):
+        calls = []
+
+        def resolve(text):
+            calls.append(text)
+            return self.index.search(text)
+
+        self.assertIsNone(self.index.cached("move", "thunderbolts", resolve))
+        self.assertIsNone(self.index.cached("move", "thunderbolts", resolve))
+        self.assertEqual(calls, ["thunderbolts"])
+
+
+if __name__ == "__main__":
+    unittest.main()
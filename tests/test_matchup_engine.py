@@ -0,0 +1,58 @@
+import unittest
+
+from backend.src.models.pokemon import Pokemon
+from backend.src.systems.matchup_engine import team_damage_matrix
+from backend.src.systems.native_damage import native_damage_calculator
+from backend.src.utils.data_loader import data_loader
+
+
+def make_pokemon(species, moves):
+    entry = data_loader.get_species(species)
+    base = entry["baseStats"]
+    stats = {
+        "hp": base["hp"],
+        "attack": base["atk"],
+        "defense": base["def"],
+        "special_attack": base["spa"],
+        "special_defense": base["spd"],
+        "speed": base["spe"],
+    }
+    return Pokemon(species, [t.lower() for t in entry["types"]], None, stats,
+                   moves=[{"name": m} for m in moves], ability="noability")
+
+
+def native_rolls(attacker, defender, move):
+    return native_damage_calculator.calculate({
+        "gen": 9,
+        "attacker": {"species": attacker, "level": 100, "nature": "Hardy", "ability": "No Ability"},
+        "defender": {"species": defender, "level": 100, "nature": "Hardy", "ability": "No Ability"},
+        "move": {"name": move},
+        "field": {},
+    })["damage"]
+
+
+class MatchupEngineTests(unittest.TestCase):
+    def test_matrix_shape_and_rolls_match_native_calculator(self):
+        attackers = [make_pokemon("Pikachu", ["Thunderbolt", "Quick Attack", "Thunder Wave"]),
+                     make_pokemon("Garchomp", ["Earthquake", "Dragon Claw"])]
+        defenders = [make_pokemon("Squirtle", []), make_pokemon("Pidgeot", []), make_pokemon("Snorlax", [])]
+
+        matrix = team_damage_matrix(attackers, defenders)
+
+        self.assertEqual(matrix.shape, (2, 4, 3, 16))
+        for a, attacker in enumerate(attackers):
+            for m, move in enumerate(attacker.moves.values()):
+                for d, defender in enumerate(defenders):
+                    expected = native_rolls(attacker.name, defender.name, move.name)
+                    rolls = list(matrix[a, m, d])
+                    self.assertEqual(rolls if any(rolls) else [0], expected if len(expected) == 16 else [0],
+                                     f"{attacker.name} {move.name} vs {defender.name}")
+
+    def test_status_moves_empty_slots_and_immunities_are_zero(self):
+        matrix = team_damage_matrix([make_pokemon("Garchomp", ["Earthquake", "Swords Dance"])],
+                                    [make_pokemon("Pidgeot", [])])
+        self.assertFalse(matrix.any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,8 +32,8 @@ def mon(name, types, moves, level=100, ability="noability", item="", speed=100):
 
 
 class MechanicsFlowTests(unittest.TestCase):
-    @patch("backend.src.models.move.random.randint", return_value=100)
-    @patch("backend.src.models.move.random.random", return_value=1.0)
+    @patch("backend.src.utils.battle_rng.BattleRNG.randint", return_value=100)
+    @patch("backend.src.utils.battle_rng.BattleRNG.random", return_value=0.99)
     def test_player_self_switch_move_queues_switch_choice(self, _random, _randint):
         game = Game()
         game.start_battle(
@@ -49,8 +49,11 @@ class MechanicsFlowTests(unittest.TestCase):
         self.assertTrue(game.pending_player_self_switch)
         self.assertTrue(any(e.get("type") == "pending_switch" for e in result["battle_events"]))
 
-    @patch("backend.src.models.move.random.randint", return_value=100)
-    @patch("backend.src.models.move.random.random", return_value=1.0)
+        game.process_turn(switch_index=1)
+        self.assertFalse(game.pending_player_self_switch)
+
+    @patch("backend.src.utils.battle_rng.BattleRNG.randint", return_value=100)
+    @patch("backend.src.utils.battle_rng.BattleRNG.random", return_value=0.99)
     def test_eject_button_suppresses_user_self_switch(self, _random, _randint):
         game = Game()
         game.start_battle(
@@ -70,7 +73,7 @@ class MechanicsFlowTests(unittest.TestCase):
         self.assertEqual(game.opponent_pokemon.name, "Blissey")
         self.assertTrue(any(e.get("item_name") == "Eject Button" for e in result["battle_events"]))
 
-    @patch("backend.src.core.game.random.randint", return_value=1)
+    @patch("backend.src.utils.battle_rng.BattleRNG.randint", return_value=1)
     def test_ohko_move_fails_against_higher_level_target(self, _randint):
         game = Game()
         attacker = Pokemon("Dugtrio", ["ground"], None, BASE_STATS.copy(), moves=[], level=50)
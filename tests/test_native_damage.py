@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import patch
+
+from backend.src.models.move import Move
+from backend.src.models.pokemon import Pokemon
+from backend.src.systems.damage_cache import DamageCache
+from backend.src.systems.native_damage import chain_mods, native_damage_calculator, poke_round
+from backend.src.systems.smogon_oracle import smogon_damage_oracle
+from backend.src.utils.battle_rng import BattleRNG
+
+
+def payload(attacker="Pikachu", defender="Squirtle", move="Thunderbolt", **field):
+    return {
+        "gen": 9,
+        "attacker": {"species": attacker, "level": 100, "nature": "Hardy"},
+        "defender": {"species": defender, "level": 100, "nature": "Hardy"},
+        "move": {"name": move},
+        "field": field,
+    }
+
+
+class NativeDamageTests(unittest.TestCase):
+    def test_rounding_helpers_follow_the_4096_chain(self):
+        self.assertEqual(poke_round(2.5), 2)
+        self.assertEqual(poke_round(2.5001), 3)
+        self.assertEqual(chain_mods([6144, 5324], 41, 131072), 7986)
+        self.assertEqual(chain_mods([], 41, 131072), 4096)
+
+    def test_returns_sixteen_ascending_rolls(self):
+        result = native_damage_calculator.calculate(payload())
+
+        self.assertEqual(len(result["damage"]), 16)
+        self.assertEqual(result["damage"], sorted(result["damage"]))
+        self.assertEqual((result["min"], result["max"]), (result["damage"][0], result["damage"][-1]))
+        self.assertEqual(result["engine"], "native")
+
+    def test_immunity_yields_zero_damage(self):
+        result = native_damage_calculator.calculate(payload(attacker="Garchomp", defender="Pidgeot", move="Earthquake"))
+        self.assertEqual(result["damage"], [0])
+
+    def test_light_screen_halves_special_damage(self):
+        plain = native_damage_calculator.calculate(payload())
+        screened = native_damage_calculator.calculate(payload(isLightScreen=True))
+        self.assertLess(screened["max"], plain["max"])
+        self.assertAlmostEqual(screened["max"], plain["max"] / 2, delta=1)
+
+    def test_critical_hit_from_the_payload(self):
+        plain = native_damage_calculator.calculate(payload())
+        crit = payload()
+        crit["move"]["isCrit"] = True
+        self.assertAlmostEqual(native_damage_calculator.calculate(crit)["max"], plain["max"] * 1.5, delta=2)
+
+    def test_current_hp_drives_pinch_abilities_and_multiscale(self):
+        def calculate(attacker, defender, move, side, ability, hp=None):
+            item = payload(attacker=attacker, defender=defender, move=move)
+            item[side]["ability"] = ability
+            if hp is not None:
+                item[side]["curHP"] = hp
+            return native_damage_calculator.calculate(item)["max"]
+
+        blaze = calculate("Charizard", "Snorlax", "Flamethrower", "attacker", "Blaze")
+        self.assertAlmostEqual(calculate("Charizard", "Snorlax", "Flamethrower", "attacker", "Blaze", hp=1),
+                               blaze * 1.5, delta=2)
+
+        multiscale = calculate("Lapras", "Dragonite", "Ice Beam", "defender", "Multiscale")
+        self.assertAlmostEqual(calculate("Lapras", "Dragonite", "Ice Beam", "defender", "Multiscale", hp=100),
+                               multiscale * 2, delta=2)
+
+    def test_moves_still_land_critical_hits(self):
+        stats = {"hp": 80, "attack": 80, "defense": 80, "special_attack": 80, "special_defense": 80, "speed": 80}
+        attacker = Pokemon("Pikachu", ["electric"], None, stats.copy(), moves=[], level=100)
+        defender = Pokemon("Snorlax", ["normal"], None, stats.copy(), moves=[], level=100)
+        attacker.rng = BattleRNG(3)
+        move = Move("Thunderbolt")
+        crits = 0
+        with patch("backend.src.systems.damage_engine.damage_cache", DamageCache()), \
+                patch("backend.src.systems.damage_engine.DAMAGE_CALCULATOR", "native"):
+            for _ in range(300):
+                defender.current_hp = defender.max_hp
+                message = move.use_move(attacker, defender, field={"weather": "none"})[2] or ""
+                crits += message.startswith("A critical hit!")
+        self.assertEqual(move.damage_source, "native")
+        self.assertGreater(crits, 5)
+        self.assertLess(crits, 60)
+
+    def test_unsupported_mechanics_fall_back(self):
+        self.assertIsNone(native_damage_calculator.calculate(payload(move="Weather Ball")))
+        self.assertIsNone(native_damage_calculator.calculate(payload(move="Bullet Seed")))
+        self.assertIsNone(native_damage_calculator.calculate(payload(attacker="NotAPokemon")))
+
+    def test_matches_oracle_rolls(self):
+        if not smogon_damage_oracle.is_available():
+            self.skipTest("@smogon/calc is not installed")
+
+        payloads = [
+            payload(),
+            payload(attacker="Garchomp", defender="Ferrothorn", move="Earthquake", weather="Sand"),
+            payload(attacker="Dragapult", defender="Gholdengo", move="Shadow Ball", isLightScreen=True),
+            payload(attacker="Kingambit", defender="Dondozo", move="Sucker Punch", terrain="Psychic"),
+        ]
+        for item, oracle in zip(payloads, smogon_damage_oracle.calculate_many(payloads)):
+            with self.subTest(move=item["move"]["name"]):
+                self.assertEqual(native_damage_calculator.calculate(item)["damage"], oracle["damage"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.src.utils.pokeapi_cache import PokeAPICache, warm
+
+
+class StandInPokeAPI(BaseHTTPRequestHandler):
+    """/api/v2/pokemon/<name>: known names return JSON, 'flaky' returns 500, others 404."""
+
+    known = {"pikachu": {"id": 25, "name": "pikachu"}, "bulbasaur": {"id": 1, "name": "bulbasaur"}}
+    requests = []
+    delay = 0.0
+
+    def do_GET(self):
+        name = self.path.rstrip("/").rsplit("/", 1)[-1]
+        type(self).requests.append(name)
+        time.sleep(type(self).delay)
+        if name in self.known:
+            body = json.dumps(self.known[name]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_response(500 if name == "flaky" else 404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class PokeAPICacheTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInPokeAPI)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/api/v2"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StandInPokeAPI.requests = []
+        StandInPokeAPI.delay = 0.0
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "pokeapi.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def cache(self, **kwargs):
+        return PokeAPICache(self.path, self.base_url, **kwargs)
+
+    def test_responses_persist_across_instances(self):
+        self.assertEqual(self.cache().get("pokemon/pikachu")["id"], 25)
+        self.assertEqual(self.cache().get("pokemon/Pikachu")["id"], 25)
+        self.assertEqual(StandInPokeAPI.requests, ["pikachu"])
+
+    def test_entries_expire(self):
+        cache = self.cache(ttl=0.05, negative_ttl=0.05)
+        cache.get("pokemon/pikachu")
+        cache.get("pokemon/missingno")
+        cache.get("pokemon/missingno")
+        self.assertEqual(StandInPokeAPI.requests, ["pikachu", "missingno"])
+        time.sleep(0.1)
+        self.assertIsNotNone(cache.get("pokemon/pikachu"))
+        self.assertIsNone(cache.get("pokemon/missingno"))
+        self.assertEqual(StandInPokeAPI.requests, ["pikachu", "missingno", "pikachu", "missingno"])
+
+    def test_server_errors_are_not_cached(self):
+        cache = self.cache()
+        self.assertIsNone(cache.get("pokemon/flaky"))
+        self.assertIsNone(cache.get("pokemon/flaky"))
+        self.assertEqual(StandInPokeAPI.requests, ["flaky", "flaky"])
+        self.assertEqual(cache.lookup("pokemon/flaky"), (False, None))
+
+    def test_unusable_store_falls_back_to_uncached_fetches(self):
+        os.makedirs(self.path)  # a directory where the SQLite file should be
+        cache = self.cache()
+        self.assertEqual(cache.get("pokemon/pikachu")["id"], 25)
+        self.assertEqual(cache.get("pokemon/pikachu")["id"], 25)
+        self.assertEqual(StandInPokeAPI.requests, ["pikachu", "pikachu"])
+        self.assertGreater(cache.stats["store_errors"], 0)
+
+    def test_concurrent_misses_share_one_request(self):
+        StandInPokeAPI.delay = 0.2
+        cache = self.cache()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("pokemon/pikachu"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([r["id"] for r in results], [25] * 8)
+        self.assertEqual(StandInPokeAPI.requests, ["pikachu"])
+
+    def test_warm_fills_the_cache(self):
+        cache = self.cache()
+        counts = warm(["pikachu", "bulbasaur", "missingno", "flaky"], cache=cache, workers=4)
+        self.assertEqual(counts, {"cached": 0, "fetched": 2, "missing": 1, "failed": 1})
+        counts = warm(["pikachu", "bulbasaur", "missingno"], cache=self.cache())
+        self.assertEqual(counts["cached"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
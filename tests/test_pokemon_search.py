@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+
+from backend.src.utils.pokemon_search import PokemonSearchIndex, pokemon_search
+from backend.src.utils.sets_database import sets_database
+
+
+NAMES = ["Gabite", "Garchomp", "garchomp", "Gible", "Mr. Mime", "Tapu Koko", "Torchic"]
+
+
+class PokemonSearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = PokemonSearchIndex(lambda: NAMES)
+
+    def names(self, query, **kwargs):
+        return [card["name"] for card in self.index.search(query, **kwargs)]
+
+    def test_spellings_share_one_card(self):
+        self.assertEqual(self.names("garchomp"), ["garchomp"])
+        self.assertEqual(self.names("mr mime"), self.names("mr.-mime"))
+        self.assertEqual(self.names("mrmime"), ["mr-mime"])
+
+    def test_prefix_matches_rank_before_substring_matches(self):
+        # "ch" starts no name but is inside Garchomp and Torchic
+        self.assertEqual(set(self.names("ch")), {"garchomp", "torchic"})
+        self.assertEqual(self.names("g")[0], "garchomp")
+        self.assertEqual(self.names("gab"), ["gabite"])
+        self.assertEqual(self.names("chomp"), ["garchomp"])
+        self.assertEqual(self.names("xyz"), [])
+
+    def test_popular_species_rank_first(self):
+        # Garchomp has far more sets than Gabite or Gible
+        self.assertEqual(self.names("ga")[0], "garchomp")
+        self.assertEqual(self.names("g", sets_only=True)[0], "garchomp")
+
+    def test_cards_carry_what_the_picker_shows(self):
+        card = self.index.search("tapu koko")[0]
+        self.assertEqual(card["name"], "tapu-koko")
+        self.assertEqual(card["display_name"], "Tapu-Koko")
+        self.assertEqual(len(card["moveset"]), 4)
+        self.assertTrue(card["has_sets"])
+
+    def test_sets_file_is_checked_at_most_once_per_interval(self):
+        now = [0.0]
+        index = PokemonSearchIndex(lambda: NAMES, check_interval=5, clock=lambda: now[0])
+        with patch.object(sets_database, "is_available", wraps=sets_database.is_available) as check:
+            first = index._current()
+            built = check.call_count
+            for _ in range(20):
+                self.assertIs(index._current(), first)
+            self.assertEqual(check.call_count, built)
+            now[0] = 6
+            self.assertIs(index._current(), first)
+            self.assertEqual(check.call_count, built + 1)
+
+    def test_default_index_limits_results(self):
+        self.assertEqual(len(pokemon_search.search("a")), 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+
+from backend.src.core.ai import BattleAI
+from backend.src.core.battle_state import dump_game, load_game
+from backend.src.core.game import Game
+from backend.src.core.search_ai import SearchAI, create_ai, evaluate
+from backend.src.core.simulation import simulate
+
+
+BASE_STATS = {
+    "hp": 100,
+    "attack": 100,
+    "defense": 100,
+    "special_attack": 100,
+    "special_defense": 100,
+    "speed": 100,
+}
+
+
+def mon(name, types, moves, speed=100):
+    stats = BASE_STATS.copy()
+    stats["speed"] = speed
+    return {"name": name, "types": types, "stats": stats, "moves": moves}
+
+
+def started_game(ai_level="normal", seed=7):
+    game = Game(headless=True, seed=seed, ai_level=ai_level)
+    game.start_battle(
+        [mon("Gyarados", ["water", "flying"], ["Waterfall", "Tackle"]), mon("Snorlax", ["normal"], ["Body Slam"])],
+        [mon("Pikachu", ["electric"], ["Tackle", "Thunderbolt"]), mon("Blissey", ["normal"], ["Seismic Toss"])],
+    )
+    return game
+
+
+class SearchAITests(unittest.TestCase):
+    def test_levels(self):
+        self.assertIs(type(create_ai()), BattleAI)
+        self.assertIs(type(Game(headless=True).ai), BattleAI)
+        self.assertEqual(create_ai("hard").settings.depth, 2)
+        with self.assertRaises(ValueError):
+            create_ai("impossible")
+
+    def test_search_picks_the_better_move_without_touching_the_battle(self):
+        game = started_game()
+        pp = game.opponent_pokemon.moves["Thunderbolt"].pp
+        rolls = game.rng.copy()
+
+        name, move = game.ai.select_move(game.opponent_pokemon, game.player_pokemon, game.weather)
+
+        self.assertEqual(name, "Thunderbolt")
+        self.assertIs(move, game.opponent_pokemon.moves["Thunderbolt"])
+        self.assertGreater(game.ai.last_search["turns"], 0)
+        self.assertEqual(game.ai.last_search["depth"], 1)
+        self.assertEqual(game.player_pokemon.current_hp, game.player_pokemon.max_hp)
+        self.assertEqual(move.pp, pp)
+        self.assertEqual([game.rng.random() for _ in range(5)], [rolls.random() for _ in range(5)])
+
+    def test_search_can_play_the_player_side(self):
+        game = started_game()
+        ai = SearchAI("easy")
+        ai.bind(game)
+        name, _ = ai.select_move(game.player_pokemon, game.opponent_pokemon, game.weather)
+        self.assertEqual(ai.last_search["depth"], 1)
+        self.assertIn(name, game.player_pokemon.moves)
+
+    def test_out_of_budget_falls_back_to_the_greedy_pick(self):
+        for realtime in (False, True):
+            with self.subTest(realtime=realtime):
+                game = started_game()
+                game.ai.realtime = realtime
+                game.ai.budget_turns = game.ai.budget_ms = 0
+                name, _ = game.ai.select_move(game.opponent_pokemon, game.player_pokemon, game.weather)
+                greedy, _ = BattleAI(game.rng.copy()).select_move(game.opponent_pokemon, game.player_pokemon, game.weather)
+                self.assertTrue(game.ai.last_search["timed_out"])
+                self.assertEqual(game.ai.last_search["depth"], 0)
+                self.assertEqual(name, greedy)
+
+    def test_turn_budget_makes_search_reproducible(self):
+        self.assertFalse(started_game().ai.realtime)
+        self.assertTrue(Game(ai_level="hard").ai.realtime)
+
+        game = started_game("hard")
+        game.ai.budget_turns = 30
+        game.ai.select_move(game.opponent_pokemon, game.player_pokemon, game.weather)
+        self.assertEqual(game.ai.last_search["turns"], 30)
+        self.assertEqual(game.ai.last_search["depth"], 1)
+
+        team_a = [mon("Gyarados", ["water", "flying"], ["Waterfall", "Tackle"]), mon("Snorlax", ["normal"], ["Body Slam"])]
+        team_b = [mon("Pikachu", ["electric"], ["Tackle", "Thunderbolt"]), mon("Blissey", ["normal"], ["Seismic Toss"])]
+        runs = [simulate(team_a, team_b, BattleAI(), SearchAI("easy"), seed=11) for _ in range(2)]
+        self.assertEqual(runs[0].events, runs[1].events)
+
+    def test_evaluate_scores_from_either_side(self):
+        game = started_game()
+        self.assertEqual(evaluate(game), 0.0)
+        game.player_pokemon.current_hp = 1
+        self.assertGreater(evaluate(game), 0.0)
+        self.assertEqual(evaluate(game, as_player=True), -evaluate(game))
+
+    def test_level_survives_a_snapshot(self):
+        game = started_game("hard")
+        game.process_turn(move_name="Tackle")
+        restored = load_game(dump_game(game))
+        self.assertIsInstance(restored.ai, SearchAI)
+        self.assertEqual(restored.ai.level, "hard")
+        self.assertIs(restored.ai.game, restored)
+        self.assertIs(restored.ai.rng, restored.rng)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+
+from backend.src.utils.sets_database import SetsDatabase
+
+
+def sets_file(stats_by_format):
+    return {name: {"stats": stats} for name, stats in stats_by_format.items()}
+
+
+SETS = sets_file({
+    "gen8ou": {
+        "Garchomp": {"Swords Dance": {"moves": ["Swords Dance", "Earthquake", "Scale Shot", "Fire Fang", "Stealth Rock"]}},
+        "Urshifu-Rapid-Strike": {"Choice Band": {"moves": ["Surging Strikes", "Close Combat", "U-turn", "Aqua Jet"]}},
+        "Charizard-Mega-X": {"Dragon Dance": {"moves": ["Dragon Dance", "Flare Blitz"]}},
+    },
+    "gen8lc": {
+        "Gible": {"Scarf": {"moves": ["Earthquake", "Outrage"]}},
+    },
+})
+
+
+class SetsDatabaseTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        self.write(SETS)
+        self.db = SetsDatabase(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, data, mtime_ns=None):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_battle_ready_names_skip_battle_only_forms_and_lc(self):
+        self.assertEqual(self.db.battle_ready_names(), ["Garchomp", "Urshifu-Rapid-Strike"])
+
+    def test_default_moves_use_the_first_set(self):
+        self.assertEqual(self.db.default_moves("Garchomp", "gen8ou"), ["Swords Dance", "Earthquake", "Scale Shot", "Fire Fang"])
+        self.assertEqual(self.db.default_moves("garchomp", "gen8ou")[0], "Swords Dance")
+        self.assertEqual(self.db.default_moves("Urshifu-Rapid", "gen8ou")[0], "Surging Strikes")
+        self.assertIsNone(self.db.default_moves("Garchomp", "gen8lc"))
+        self.assertIsNone(self.db.default_moves("Garchomp", "gen8uu"))
+
+    def test_all_sets_match_by_name_then_substring(self):
+        self.assertEqual(set(self.db.all_sets("Gible")), {"gen8lc"})
+        self.assertIn("Dragon Dance", self.db.all_sets("charizard")["gen8ou"])
+        self.assertEqual(self.db.all_sets("Missingno"), {})
+
+    def test_lookups_of_user_input_stay_bounded(self):
+        self.db.battle_ready_names()
+        index = self.db.formats["gen8ou"]
+        index._index().max_cached = 8
+        for i in range(100):
+            self.assertIsNone(index.prefix_match(f"missing{i}"))
+        self.assertEqual(index.prefix_match("urshifu-rapid"), "Urshifu-Rapid-Strike")
+        self.assertLessEqual(len(index._index()._cache), 8)
+
+    def test_reloads_when_the_file_changes(self):
+        self.db.battle_ready_names()
+        version = self.db.version
+        stat = os.stat(self.path)
+        self.write(sets_file({"gen8uu": {"Gengar": {"Sub": {"moves": ["Substitute"]}}}}), stat.st_mtime_ns + 10**9)
+
+        self.assertEqual(self.db.battle_ready_names(), ["Gengar"])
+        self.assertEqual(self.db.version, version + 1)
+        self.assertIsNone(self.db.default_moves("Garchomp", "gen8ou"))
+
+
+if __name__ == "__main__":
+    unittest.main()
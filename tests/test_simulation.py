@@ -0,0 +1,71 @@
+import contextlib
+import io
+import random
+import unittest
+
+from backend.src.core.game import Game
+from backend.src.core.simulation import RandomPolicy, simulate
+from backend.src.models.pokemon import Pokemon
+
+
+def mon(name, types, moves, speed=100):
+    stats = {"hp": 100, "attack": 100, "defense": 100, "special_attack": 100, "special_defense": 100, "speed": speed}
+    return {"name": name, "types": types, "stats": stats, "moves": moves}
+
+
+TEAM_A = [mon("Pikachu", ["electric"], ["Thunderbolt", "Quick Attack"], speed=150), mon("Snorlax", ["normal"], ["Body Slam", "Crunch"], speed=30)]
+TEAM_B = [mon("Gyarados", ["water", "flying"], ["Waterfall", "Bite"]), mon("Onix", ["rock", "ground"], ["Rock Slide", "Earthquake"])]
+
+
+class SimulateTests(unittest.TestCase):
+    def test_battles_run_to_the_end_quietly(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result = simulate(TEAM_A, TEAM_B, seed=7)
+        self.assertEqual(output.getvalue(), "")
+        self.assertIn(result.winner, ("a", "b"))
+        self.assertIn(0, result.remaining)
+        self.assertEqual(result.events[-1].type, "faint")
+        moves = [e for e in result.events if e.type == "move"]
+        self.assertTrue(moves and all(e.side in (0, 1) and e.name for e in moves))
+
+    def test_seed_reproduces_the_battle_and_leaves_global_random_alone(self):
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        first = simulate(TEAM_A, TEAM_B, RandomPolicy(), RandomPolicy(), seed=3)
+        self.assertEqual(random.random(), expected)
+        self.assertEqual(simulate(TEAM_A, TEAM_B, RandomPolicy(), RandomPolicy(), seed=3), first)
+
+    def test_headless_games_skip_display_messages(self):
+        for headless in (False, True):
+            game = Game(headless=headless, seed=1)
+            game.start_battle(TEAM_A, TEAM_B)
+            events = game.switch_pokemon(True, 1)
+            self.assertEqual([e["type"] for e in events], ["recall", "status"])
+            self.assertEqual(events[-1]["new_pokemon_name"], "Snorlax")
+            self.assertEqual(events[-1]["message"], None if headless else "Go! Snorlax!")
+
+    def test_headless_events_are_the_display_events_without_display_fields(self):
+        turns = {}
+        for headless in (False, True):
+            game = Game(headless=headless, seed=1)
+            game.start_battle(TEAM_A, TEAM_B)
+            with contextlib.redirect_stdout(io.StringIO()):
+                turns[headless] = [e for e in game.process_turn(move_name="Thunderbolt")["battle_events"] if e["type"] == "move"]
+
+        self.assertTrue(turns[True])
+        self.assertEqual(len(turns[True]), len(turns[False]))
+        for compact, display in zip(turns[True], turns[False]):
+            self.assertEqual(compact, {key: display[key] for key in compact})
+            self.assertIn("attacker_name", display)
+            self.assertNotIn("attacker_name", compact)
+
+    def test_status_conditions_apply(self):
+        pokemon = Pokemon("Snorlax", ["normal"], None, {}, ["Tackle"])
+        self.assertEqual(pokemon.apply_status_effect("burn"), "The foe's Snorlax was burned!")
+        self.assertEqual(pokemon.major_status, "burn")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,12 @@
+import sys
+import threading
+import time
 import unittest
+from unittest.mock import patch
 
-from backend.src.systems.smogon_oracle import smogon_damage_oracle
+from backend.src.systems.damage_cache import DamageCache
+from backend.src.systems.damage_engine import smogon_damage_matrix
+from backend.src.systems.smogon_oracle import OracleTimeout, OracleWorkerCrashed, OracleWorkerPool, smogon_damage_oracle
 from backend.src.models.move import Move
 from backend.src.models.pokemon import Pokemon
 
@@ -63,6 +69,106 @@ class SmogonOracleTests(unittest.TestCase):
         self.assertGreaterEqual(damage, move.last_damage_range[0])
         self.assertLessEqual(damage, move.last_damage_range[1])
 
+    def test_damage_matrix_uses_one_batch_call(self):
+        stats = {"hp": 80, "attack": 80, "defense": 80, "special_attack": 80, "special_defense": 80, "speed": 80}
+        attacker = Pokemon("Pikachu", ["electric"], None, stats.copy(), moves=[], level=100)
+        defenders = [
+            Pokemon("Squirtle", ["water"], None, stats.copy(), moves=[], level=100),
+            Pokemon("Bulbasaur", ["grass", "poison"], None, stats.copy(), moves=[], level=100),
+        ]
+        moves = [Move("Thunderbolt"), Move("Thunder Wave"), Move("Quick Attack")]
+
+        def fake_batch(payloads):
+            return [
+                {"damage": [10, 12], "min": 10, "max": 12, "target": p["defender"]["species"], "move": p["move"]["name"]}
+                for p in payloads
+            ]
+
+        with patch("backend.src.systems.damage_engine.damage_cache", DamageCache()), \
+                patch("backend.src.systems.damage_engine.DAMAGE_CALCULATOR", "oracle"), \
+                patch("backend.src.systems.damage_engine.smogon_damage_oracle.calculate_many", side_effect=fake_batch) as batch:
+            matrix = smogon_damage_matrix(attacker, moves, defenders)
+
+        batch.assert_called_once()
+        self.assertEqual(len(batch.call_args[0][0]), 4)
+        self.assertEqual(matrix[0][1]["target"], "Bulbasaur")
+        self.assertEqual(matrix[2][0]["move"], "Quick Attack")
+        self.assertEqual(matrix[1], [None, None])
+
+
+FAKE_WORKER = """
+import json, sys, time, os
+for line in sys.stdin:
+    request = json.loads(line)
+    payload = request["payload"]
+    if payload == "crash":
+        os._exit(3)
+    if payload == "hang":
+        time.sleep(10)
+    if payload == "slow crash":
+        time.sleep(0.3)
+        os._exit(3)
+    print(json.dumps({"id": request["id"], "result": {"pid": os.getpid(), "echo": payload}}), flush=True)
+"""
+
+
+class OracleWorkerPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = OracleWorkerPool([sys.executable, "-c", FAKE_WORKER], size=2, timeout=2)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_worker_is_reused_across_requests(self):
+        first = self.pool.request({"payload": 1})["result"]
+        second = self.pool.request({"payload": 2})["result"]
+
+        self.assertEqual(second["echo"], 2)
+        self.assertEqual(first["pid"], second["pid"])
+
+    def test_crashed_worker_is_replaced(self):
+        pid = self.pool.request({"payload": 1})["result"]["pid"]
+        with self.assertRaises(Exception):
+            self.pool.request({"payload": "crash"})
+
+        result = self.pool.request({"payload": 2})["result"]
+        self.assertNotEqual(result["pid"], pid)
+        self.assertGreaterEqual(self.pool.restarts, 1)
+
+    def test_crashing_request_is_not_retried(self):
+        with self.assertRaises(OracleWorkerCrashed):
+            self.pool.request({"payload": "crash"})
+        self.assertEqual(self.pool.restarts, 1)
+
+    def test_request_to_a_worker_that_died_idle_is_retried(self):
+        pid = self.pool.request({"payload": 1})["result"]["pid"]
+        for worker in self.pool._workers:
+            worker.process.kill()
+            worker.process.wait()
+
+        result = self.pool.request({"payload": 2})["result"]
+        self.assertEqual(result["echo"], 2)
+        self.assertNotEqual(result["pid"], pid)
+        self.assertEqual(self.pool.restarts, 1)
+
+    def test_waiter_replaces_a_worker_that_crashed_while_it_waited(self):
+        pool = OracleWorkerPool([sys.executable, "-c", FAKE_WORKER], size=1, timeout=2)
+        self.addCleanup(pool.close)
+        crash = threading.Thread(target=lambda: self.assertRaises(OracleWorkerCrashed, pool.request, {"payload": "slow crash"}))
+        crash.start()
+        time.sleep(0.1)
+
+        started = time.monotonic()
+        self.assertEqual(pool.request({"payload": 4})["result"]["echo"], 4)
+        self.assertLess(time.monotonic() - started, 1.5)
+        crash.join()
+
+    def test_hung_worker_times_out_and_is_replaced(self):
+        with self.assertRaises(OracleTimeout):
+            self.pool.request({"payload": "hang"}, timeout=0.2)
+
+        self.assertEqual(self.pool.request({"payload": 3})["result"]["echo"], 3)
+
 
 if __name__ == "__main__":
     unittest.main()
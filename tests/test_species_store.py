@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+
+from backend.src.utils import pokemon_api
+from backend.src.utils.species_store import SpeciesStore, species_store
+
+
+POKEDEX = {
+    "landorus": {
+        "name": "Landorus", "num": 645, "types": ["Ground", "Flying"], "baseForme": "Incarnate",
+        "baseStats": {"hp": 89, "atk": 125, "def": 90, "spa": 115, "spd": 80, "spe": 101},
+        "abilities": {"H": "Sheer Force", "0": "Sand Force"},
+    },
+    "landorustherian": {
+        "name": "Landorus-Therian", "num": 645, "types": ["Ground", "Flying"], "forme": "Therian",
+        "baseSpecies": "Landorus",
+        "baseStats": {"hp": 89, "atk": 145, "def": 90, "spa": 105, "spd": 80, "spe": 91},
+        "abilities": {"0": "Intimidate"},
+    },
+    "mrmime": {
+        "name": "Mr. Mime", "num": 122, "types": ["Psychic", "Fairy"],
+        "baseStats": {"hp": 40, "atk": 45, "def": 65, "spa": 100, "spd": 120, "spe": 90},
+        "abilities": {"0": "Soundproof"},
+    },
+}
+ID_MAP = {"landorus-incarnate": 645, "landorus-therian": 10021, "mr-mime": 122}
+
+
+class SpeciesStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.store = SpeciesStore(POKEDEX, ID_MAP)
+
+    def test_records_use_pokeapi_names_and_shape(self):
+        record = self.store.get("Landorus")
+        self.assertEqual(record["name"], "landorus-incarnate")
+        self.assertEqual([t["type"]["name"] for t in record["types"]], ["ground", "flying"])
+        self.assertEqual([s["base_stat"] for s in record["stats"]], [89, 125, 90, 115, 80, 101])
+        self.assertEqual([s["stat"]["name"] for s in record["stats"]][3], "special-attack")
+        self.assertEqual([(a["ability"]["name"], a["is_hidden"]) for a in record["abilities"]],
+                         [("sand-force", False), ("sheer-force", True)])
+        self.assertTrue(record["cries"]["latest"].endswith("/645.ogg"))
+
+    def test_lookup_by_any_spelling(self):
+        therian = self.store.get("landorus-therian")
+        self.assertIs(self.store.get("Landorus-Therian"), therian)
+        self.assertIs(self.store.get("landorustherian"), therian)
+        self.assertEqual(therian["id"], 10021)
+        self.assertEqual(self.store.get("Mr. Mime")["name"], "mr-mime")
+        self.assertIsNone(self.store.get("missingno"))
+
+    def test_battle_ready_pokemon_resolve_without_network(self):
+        with mock.patch.object(pokemon_api.pokeapi_cache, "get", side_effect=AssertionError("network used")):
+            for name in ["Garchomp", "Urshifu-Rapid-Strike", "Giratina Origin", "stunfisk-galar", "Zygarde-10%", "Flabébé"]:
+                self.assertIsNotNone(pokemon_api.get_pokemon_data(name), name)
+            forme = pokemon_api.get_forme_data("mimikyu-busted")
+        self.assertEqual(forme["types"], ["ghost", "fairy"])
+        self.assertEqual(forme["ability"], "disguise")
+        self.assertGreater(len(species_store), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
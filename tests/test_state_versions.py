@@ -0,0 +1,56 @@
+import unittest
+
+from fastapi.testclient import TestClient
+
+from backend.src.core.battle_view import StateVersions, apply_delta
+from backend.src.core.fastapi_server import app
+
+
+def view(player_hp, opponent_hp, weather="none"):
+    return {
+        "weather": weather,
+        "player_team": [{"name": "Garchomp", "current_hp": player_hp}],
+        "opponent_team": [{"name": "Toxapex", "current_hp": opponent_hp}],
+    }
+
+
+class StateVersionsTests(unittest.TestCase):
+    def test_delta_holds_only_fields_changed_after_the_acked_version(self):
+        versions = StateVersions()
+        self.assertEqual(versions.update(view(100, 100)), 1)
+        self.assertEqual(versions.update(view(100, 100)), 1)
+        self.assertEqual(versions.update(view(100, 60)), 2)
+        self.assertEqual(versions.update(view(80, 60, "raindance")), 3)
+
+        self.assertEqual(versions.delta_since(3), {})
+        self.assertEqual(versions.delta_since(2), {"weather": "raindance", "player_team": {"0": {"current_hp": 80}}})
+        self.assertEqual(apply_delta(view(100, 100), versions.delta_since(1)), view(80, 60, "raindance"))
+
+    def test_unknown_versions_need_a_full_state(self):
+        versions = StateVersions()
+        versions.update(view(100, 100))
+        for version in (None, 0, 2, "1", True):
+            self.assertIsNone(versions.delta_since(version))
+
+
+class DeltaMoveEndpointTests(unittest.TestCase):
+    def test_clients_follow_the_battle_with_deltas(self):
+        client = TestClient(app)
+        start = client.post("/api/start", json={"pokemon": "garchomp", "opponent": "toxapex"}).json()
+        move = {"battle_id": start["battle_id"], "move": start["player_moves"][0]["name"], "delta": True}
+
+        first = client.post("/api/move", json=move).json()
+        self.assertIn("state", first)
+        self.assertNotIn("player_team", first)
+
+        second = client.post("/api/move", json={**move, "ack_version": first["state_version"]}).json()
+        self.assertIn("delta", second)
+        self.assertIn("player_team", second["delta"])
+        state = apply_delta(first["state"], second["delta"])
+
+        full = client.post("/api/move", json={**move, "ack_version": 10 ** 6}).json()
+        self.assertEqual(full["state"]["player_team"][0]["name"], state["player_team"][0]["name"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+from backend.src.core import team_builder
+from backend.src.utils import pokemon_api
+
+
+class TeamBuilderTests(unittest.TestCase):
+    def hydrate(self, player, opponent):
+        async def run():
+            try:
+                return await team_builder.hydrate_teams(player, opponent)
+            finally:
+                await team_builder.close_http_client()
+        return asyncio.run(run())
+
+    def test_teams_keep_order_and_skip_unknown_pokemon(self):
+        async def no_network(*args, **kwargs):
+            return None
+
+        with mock.patch.object(pokemon_api.pokeapi_cache, "aget", side_effect=no_network):
+            player, opponent, timings = self.hydrate(
+                [{"name": "Garchomp", "moves": ["Earthquake"]}, {"name": "not-a-pokemon"}, {"name": "Landorus"}],
+                [{"name": "Dragapult"}, {"name": "Toxapex"}],
+            )
+
+        self.assertEqual([p["name"] for p in player], ["garchomp", "landorus-incarnate"])
+        self.assertEqual(player[0]["moves"], [{"name": "Earthquake"}])
+        self.assertTrue(player[1]["moves"])
+        self.assertEqual([o["name"] for o in opponent], ["dragapult", "toxapex"])
+        self.assertTrue(all(o["moves"] and "nature" in o for o in opponent))
+        for stage in ("species", "sets", "player_team", "opponent_team", "hydrate"):
+            self.assertIn(stage, timings.as_ms())
+        self.assertIn("hydrate;dur=", timings.server_timing())
+
+    def test_blocking_lookups_run_in_the_thread_pool(self):
+        threads = []
+
+        def fake_sets(name):
+            threads.append(threading.current_thread().name)
+            return {}
+
+        with mock.patch.object(team_builder, "get_all_pokemon_sets", side_effect=fake_sets), \
+                mock.patch.object(team_builder, "default_moves", return_value=[{"name": "tackle"}]):
+            self.hydrate([], [{"name": "Garchomp"}, {"name": "Gengar"}])
+
+        self.assertEqual(len(threads), 2)
+        self.assertTrue(all(name.startswith("team-builder") for name in threads))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from backend.src.utils.ts_object_parser import parse_ts_object
+
+
+class TSObjectParserTests(unittest.TestCase):
+    def test_parses_data_literals(self):
+        table = parse_ts_object('''{
+            "10000000voltthunderbolt": {
+                name: "10,000,000 Volt Thunderbolt",
+                desc: "Say \\"hi\\".", // trailing comment
+            },
+            pluck: {removeItem: '#bugbite', drain: [1, 2], secondary: null, critRatio: 1.5,},
+        }''')
+
+        self.assertEqual(table["10000000voltthunderbolt"]["desc"], 'Say "hi".')
+        self.assertEqual(table["pluck"], {"removeItem": "#bugbite", "drain": [1, 2], "secondary": None, "critRatio": 1.5})
+
+    def test_duplicate_keys_keep_the_first_value(self):
+        data = parse_ts_object('{bind: {shortDesc: "5 turns.", shortDesc: "2-5 turns."}}')
+        code = parse_ts_object('{bind: {shortDesc: "5 turns.", onHit() {}, shortDesc: "2-5 turns."}}')
+
+        self.assertEqual(data, {"bind": {"shortDesc": "5 turns."}})
+        self.assertEqual(code, data)
+
+    def test_skips_methods_and_code_values(self):
+        table = parse_ts_object('''export const Items: ItemDataTable = {
+            lifeorb: {
+                name: "Life Orb",
+                onModifyDamage(damage, source, target, move) {
+                    if (move.category !== 'Status') return this.chainModify([5324, 4096]);
+                },
+                onAfterMoveSecondarySelf: (source, target, move) => { this.damage(source.baseMaxhp / 10); },
+                condition: { duration: 2, onStart() { this.add(`-start ${target}`); } },
+                fling: { basePower: 30 },
+                num: 270,
+            },
+        };''')
+
+        self.assertEqual(table, {"lifeorb": {"name": "Life Orb", "condition": {"duration": 2}, "fling": {"basePower": 30}, "num": 270}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+from backend.src.models.pokemon import Pokemon
+from backend.src.utils.data_loader import data_loader
+
+
+class TypeChartTests(unittest.TestCase):
+    def setUp(self):
+        self.chart = data_loader.type_chart
+
+    def test_matrix_matches_typechart_codes(self):
+        codes = {0: 1.0, 1: 2.0, 2: 0.5, 3: 0.0}
+        for defending, data in data_loader.typechart_data.items():
+            for attacking in self.chart.types:
+                expected = codes[data["damageTaken"].get(attacking.title(), 0)]
+                self.assertEqual(data_loader.get_type_effectiveness(attacking, defending), expected)
+                self.assertEqual(self.chart.array[self.chart.type_id(attacking), self.chart.type_id(defending)], expected)
+
+    def test_dual_types_and_unknown_types(self):
+        ground, flying, electric = (self.chart.type_id(t) for t in ("ground", "flying", "electric"))
+        self.assertEqual(self.chart.against(ground, (electric, flying)), 0.0)
+        self.assertEqual(self.chart.against(electric, (electric, self.chart.NONE)), 0.5)
+        self.assertEqual(data_loader.get_type_effectiveness("fire", "???"), 1.0)
+
+    def test_pokemon_interns_type_ids(self):
+        pokemon = Pokemon("Gyarados", ["water", "flying"], None, {"hp": 95}, moves=[])
+        self.assertEqual(pokemon.type_ids, (self.chart.type_id("water"), self.chart.type_id("flying")))
+
+        pokemon.types = ["water", "dark"]
+        self.assertEqual(pokemon.type_ids[1], self.chart.type_id("dark"))
+
+
+if __name__ == "__main__":
+    unittest.main()